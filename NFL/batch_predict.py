@@ -3,12 +3,19 @@ NFL Batch Predictor
 Automatically predicts all games for the upcoming week using ML model
 """
 
+import bisect
+import functools
+import sys
 import requests
 import json
+import time
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime
-from predictor import read_nfl_data, advanced_prediction, calculate_team_averages
-from ml_predictor import build_training_dataset, train_model, create_matchup_features, classify_offensive_style, predict_game_ml
+from predictor import read_nfl_data, get_team_averages, predict_slate
+from ml_predictor import load_or_train_model, classify_offensive_style, predict_games_ml_batch
 
 # Import injury data
 try:
@@ -17,14 +24,53 @@ try:
 except ImportError:
     INJURIES_AVAILABLE = False
 
+# optional faster JSON decoder for the scoreboard (stdlib json otherwise)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# how long (seconds) a fetched week of games is reused before ESPN is asked again
+SCOREBOARD_TTL = 900
+
+# shared keep-alive session for ESPN requests (reuses the TLS connection between
+# calls and retries transient errors with backoff); parsed weeks are cached in-process
+# by fetch_week_games
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+))
+
+# console confidence labels: a pick must be strictly above a threshold to move up a label
+CONFIDENCE_THRESHOLDS = (60, 70, 85)
+CONFIDENCE_LABELS = ('TOSS-UP', 'LEAN', 'CONFIDENT', 'LOCK')
+
+# predictions_week_N.txt layout, filled with str.format_map per game
+REPORT_HEADER = (
+    "NFL PREDICTIONS - WEEK {week}\n"
+    "Successfully predicted: {predicted}/{total} games\n"
+    + "=" * 100 + "\n\n"
+)
+GAME_TEMPLATE = (
+    "Game {index}: {away_team} @ {home_team}{neutral}\n"
+    "  PREDICTION: {winner} wins\n"
+    "  Confidence: {confidence:.1f}%\n"
+)
+POINTS_TEMPLATE = "  Points: {home_team} {home_points:.1f} - {away_points:.1f} {away_team}\n\n"  # heuristic mode
+PROBABILITIES_TEMPLATE = "  Probabilities: {home_team} {home_pct:.1f}% | {away_team} {away_pct:.1f}%\n\n"  # ML mode
+FAILED_HEADER = "\n" + "=" * 100 + "\nGAMES THAT COULD NOT BE PREDICTED ({count}):\n" + "=" * 100 + "\n\n"
+FAILED_TEMPLATE = "{index}. {away_team} @ {home_team}{neutral}\n   Reason: {reason}\n\n"
+NEUTRAL_SITE_TAG = " [NEUTRAL SITE]"
+
 
 def get_upcoming_games(week_num, season_type='regular', year=2024):
     """
     gets all games scheduled for a specific week (completed or not)
     week_num: If >= 19, treated as postseason (converted to API week 1-4)
     """
-    base_api_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
-    
     # Convert week 19-22 to postseason weeks 1-4 for API
     actual_week = week_num
     if week_num >= 19 and week_num <= 22:
@@ -39,62 +85,68 @@ def get_upcoming_games(week_num, season_type='regular', year=2024):
     else:
         season_type_num = 2  # Regular season
     
+    try:
+        # the time bucket keys the cache, so a week's schedule is refetched at most every SCOREBOARD_TTL
+        games = fetch_week_games(season_type_num, actual_week, year, int(time.time() // SCOREBOARD_TTL))
+        # copies, so callers can't edit the cached entries
+        return [dict(game) for game in games]
+        
+    except Exception as e:
+        print(f"Error getting games: {e}")
+        return []
+
+
+@functools.lru_cache(maxsize=32)
+def fetch_week_games(season_type_num, week, year, time_bucket):
+    """
+    fetches and parses one scoreboard week; cached per (season type, week, year, time bucket)
+    errors propagate so a failed request is never cached
+    """
+    base_api_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
     params = {
         'seasontype': season_type_num,
-        'week': actual_week,  # Use converted week for API
+        'week': week,
         'year': year
     }
     
-    try:
-        response = requests.get(base_api_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        games = []
-        
-        if 'events' in data:
-            for event in data['events']:
-                competitions = event.get('competitions', [])
-                
-                if competitions:
-                    competition = competitions[0]
-                    competitors = competition.get('competitors', [])
-                    
-                    if len(competitors) >= 2:
-                        home_team = None
-                        away_team = None
-                        
-                        for competitor in competitors:
-                            team = competitor.get('team', {})
-                            team_name = team.get('displayName', '')
-                            home_away = competitor.get('homeAway', '')
-                            
-                            if home_away == 'home':
-                                home_team = team_name
-                            else:
-                                away_team = team_name
-                        
-                        if home_team and away_team:
-                            # check if it's at neutral site
-                            venue = competition.get('venue', {})
-                            is_neutral = venue.get('neutral', False)
-                            
-                            games.append({
-                                'home_team': home_team,
-                                'away_team': away_team,
-                                'is_neutral': is_neutral
-                            })
-        
-        return games
+    response = _SESSION.get(base_api_url, params=params, timeout=10)
+    response.raise_for_status()
+    data = orjson.loads(response.content) if ORJSON_AVAILABLE else response.json()
+    
+    games = []
+    for event in data.get('events', ()):
+        # the scoreboard's shape is stable, so index straight in and skip any event
+        # that's missing a piece rather than defaulting every level
+        try:
+            competition = event['competitions'][0]
+            competitors = competition['competitors']
+            if len(competitors) < 2:
+                continue
+            
+            # anything not marked home is the away side; a later entry for a side wins
+            sides = {
+                competitor.get('homeAway') == 'home': competitor['team']['displayName']
+                for competitor in competitors
+            }
+        except (KeyError, IndexError):
+            continue
+        home_team = sides.get(True)
+        away_team = sides.get(False)
         
-    except Exception as e:
-        print(f"Error getting games: {e}")
-        return []
+        if home_team and away_team:
+            games.append({
+                'home_team': home_team,
+                'away_team': away_team,
+                'is_neutral': competition.get('venue', {}).get('neutral', False)  # neutral site?
+            })
+    
+    return tuple(games)
 
 
-def batch_predict_week(week_num, season_type='regular', use_ml=True):
+def batch_predict_week(week_num, season_type='regular', use_ml=True, verbose=True):
     """
     predicts all games for a specific week using ML model
+    verbose: print per-game progress as games are predicted (the summary is always printed)
     """
     print("=" * 100)
     print(f"NFL BATCH PREDICTOR ({'ML MODEL' if use_ml else 'HEURISTIC'}) - {season_type.upper()} WEEK {week_num}")
@@ -114,6 +166,12 @@ def batch_predict_week(week_num, season_type='regular', use_ml=True):
     
     print(f"Data loaded! {len(teams_data)} teams found.\n")
     
+    # the week's schedule doesn't depend on the injury report or the model, so fetch it
+    # in the background while those load/train
+    schedule_pool = ThreadPoolExecutor(max_workers=1)
+    games_future = schedule_pool.submit(get_upcoming_games, week_num, season_type)
+    schedule_pool.shutdown(wait=False)
+    
     # load injury data
     injury_data = None
     if INJURIES_AVAILABLE:
@@ -122,18 +180,19 @@ def batch_predict_week(week_num, season_type='regular', use_ml=True):
         if injury_data:
             print(f"Injury data loaded for {len(injury_data)} teams\n")
     
-    # Train ML model if using ML mode
+    # Train ML model if using ML mode, overlapping the ESPN round-trip
+    # (skipped when the schedule has already come back empty)
     model = None
     feature_names = None
-    if use_ml:
+    if use_ml and not (games_future.done() and not games_future.result()):
         print("Training ML model on historical data...")
-        X, y, feature_names, game_info = build_training_dataset(teams_data, injury_data)
-        model, feature_importance = train_model(X, y, feature_names)
+        # reuses the saved model when the data hasn't changed since the last run
+        model, feature_names, feature_importance = load_or_train_model(teams_data, injury_data)
         print()
     
     # get upcoming games
     print(f"Fetching games for Week {week_num}...")
-    games = get_upcoming_games(week_num, season_type)
+    games = games_future.result()
     
     if not games:
         print(f"No games found for Week {week_num}")
@@ -145,25 +204,72 @@ def batch_predict_week(week_num, season_type='regular', use_ml=True):
     
     print(f"Found {len(games)} games to predict\n")
     
-    # predict each game
+    # heuristic mode scores the whole slate in one pass: team averages are shared
+    # across games and winner/confidence are worked out for every game at once
+    slate = None
+    if not use_ml or model is None:
+        # rows come back as light namedtuples; the per-game dicts below are only built
+        # for games that make it into the returned predictions
+        slate = list(predict_slate(games, teams_data, injury_data).itertuples(index=False))
+    
+    # look each team's averages up once for the whole slate rather than per game and hand
+    # them to the predictor too (shared cached dicts - only read)
+    slate_teams = {game[side] for game in games for side in ('home_team', 'away_team')}
+    team_averages = {team: get_team_averages(team, teams_data, regular_only=True) for team in slate_teams}
+    
+    # classify each team's offense once too (only shown in the verbose ML progress lines)
+    styles = {}
+    if verbose and model is not None:
+        styles = {team: classify_offensive_style(avg) for team, avg in team_averages.items() if avg}
+    
+    # ML mode scores the whole slate with one predict_proba call (calibrated per game);
+    # only games where both teams have data are scored, the rest are reported below as
+    # insufficient data
+    ml_results = [None] * len(games)
+    ml_error = None
+    if model is not None:
+        valid_teams = {team for team, avg in team_averages.items() if avg}
+        playable = [idx for idx, game in enumerate(games)
+                    if game['home_team'] in valid_teams and game['away_team'] in valid_teams]
+        try:
+            scored = predict_games_ml_batch(
+                [games[idx]['home_team'] for idx in playable],
+                [games[idx]['away_team'] for idx in playable],
+                teams_data,
+                model,
+                feature_names,
+                injury_data,
+                team_averages
+            )
+            for idx, result in zip(playable, scored):
+                ml_results[idx] = result
+        except Exception as e:
+            # nothing could be scored - every playable game fails with this error
+            ml_error = str(e)
+            if verbose:
+                print(f"Error predicting games: {e}")
+    
     predictions = []
     failed_games = []
+    log = []
     
     for i, game in enumerate(games, 1):
-        print(f"\n{'=' * 100}")
-        print(f"GAME {i}/{len(games)}: {game['away_team']} @ {game['home_team']}")
-        if game['is_neutral']:
-            print("(NEUTRAL SITE)")
-        print(f"{'=' * 100}")
+        if verbose:
+            log.append(f"\n{'=' * 100}")
+            log.append(f"GAME {i}/{len(games)}: {game['away_team']} @ {game['home_team']}")
+            if game['is_neutral']:
+                log.append("(NEUTRAL SITE)")
+            log.append(f"{'=' * 100}")
         
         try:
-            if use_ml and model is not None:
-                # ML prediction
-                home_avg = calculate_team_averages(game['home_team'], teams_data, regular_only=True)
-                away_avg = calculate_team_averages(game['away_team'], teams_data, regular_only=True)
+            if model is not None:
+                # ML prediction (already scored with the slate above)
+                home_avg = team_averages[game['home_team']]
+                away_avg = team_averages[game['away_team']]
                 
                 if not home_avg or not away_avg:
-                    print(f"  Insufficient data for ML prediction")
+                    if verbose:
+                        log.append(f"  Insufficient data for ML prediction")
                     failed_games.append({
                         'home_team': game['home_team'],
                         'away_team': game['away_team'],
@@ -172,22 +278,14 @@ def batch_predict_week(week_num, season_type='regular', use_ml=True):
                     })
                     continue
                 
-                # Use improved prediction function with calibration
-                prediction_result = predict_game_ml(
-                    game['home_team'], 
-                    game['away_team'], 
-                    teams_data, 
-                    model, 
-                    feature_names, 
-                    injury_data
-                )
+                prediction_result = ml_results[i - 1]
                 
                 if not prediction_result:
                     failed_games.append({
                         'home_team': game['home_team'],
                         'away_team': game['away_team'],
                         'is_neutral': game['is_neutral'],
-                        'reason': 'Prediction failed'
+                        'reason': ml_error or 'Prediction failed'
                     })
                     continue
                 
@@ -203,12 +301,10 @@ def batch_predict_week(week_num, season_type='regular', use_ml=True):
                     confidence = away_win_prob * 100
                 
                 # Display styles
-                home_style = classify_offensive_style(home_avg)
-                away_style = classify_offensive_style(away_avg)
-                
-                print(f"  {game['home_team']}: {home_avg['wins']}-{home_avg['games_played'] - home_avg['wins']} ({home_style})")
-                print(f"  {game['away_team']}: {away_avg['wins']}-{away_avg['games_played'] - away_avg['wins']} ({away_style})")
-                print(f"  → {winner} wins ({confidence:.1f}% confidence)")
+                if verbose:
+                    log.append(f"  {game['home_team']}: {home_avg['wins']}-{home_avg['games_played'] - home_avg['wins']} ({styles[game['home_team']]})")
+                    log.append(f"  {game['away_team']}: {away_avg['wins']}-{away_avg['games_played'] - away_avg['wins']} ({styles[game['away_team']]})")
+                    log.append(f"  → {winner} wins ({confidence:.1f}% confidence)")
                 
                 predictions.append({
                     'home_team': game['home_team'],
@@ -221,44 +317,31 @@ def batch_predict_week(week_num, season_type='regular', use_ml=True):
                     'status': 'predicted'
                 })
             else:
-                # Heuristic prediction (old method)
-                result = advanced_prediction(
-                    game['home_team'], 
-                    game['away_team'], 
-                    teams_data, 
-                    game['is_neutral'],
-                    injury_data
-                )
+                # Heuristic prediction (old method, already scored with the slate above)
+                result = slate[i - 1]
                 
-                if result:
-                    home_points = result['home_points']
-                    away_points = result['away_points']
-                    
-                    if home_points > away_points:
-                        diff = home_points - away_points
-                        confidence = min(diff / 6 * 100, 95)
-                        winner = game['home_team']
-                    elif away_points > home_points:
-                        diff = away_points - home_points
-                        confidence = min(diff / 6 * 100, 95)
-                        winner = game['away_team']
-                    else:
-                        diff = 0
-                        confidence = 50
-                        winner = "TIE"
+                if result.error is not None:
+                    raise RuntimeError(result.error)
+                
+                if result.winner is not None:
+                    winner = result.winner
+                    confidence = float(result.confidence)
+                    if verbose:
+                        log.append(f"  → {winner} wins ({confidence:.1f}% confidence)")
                     
                     predictions.append({
                         'home_team': game['home_team'],
                         'away_team': game['away_team'],
-                        'home_points': home_points,
-                        'away_points': away_points,
+                        'home_points': float(result.home_points),
+                        'away_points': float(result.away_points),
                         'winner': winner,
                         'confidence': confidence,
                         'is_neutral': game['is_neutral'],
                         'status': 'predicted'
                     })
                 else:
-                    print(f"  Could not predict this game (missing team data)")
+                    if verbose:
+                        log.append(f"  Could not predict this game (missing team data)")
                     failed_games.append({
                         'home_team': game['home_team'],
                         'away_team': game['away_team'],
@@ -267,7 +350,8 @@ def batch_predict_week(week_num, season_type='regular', use_ml=True):
                     })
         
         except Exception as e:
-            print(f"  Error predicting game: {e}")
+            if verbose:
+                log.append(f"  Error predicting game: {e}")
             failed_games.append({
                 'home_team': game['home_team'],
                 'away_team': game['away_team'],
@@ -276,83 +360,79 @@ def batch_predict_week(week_num, season_type='regular', use_ml=True):
             })
             continue
     
-    # output summary
-    print("\n\n")
-    print("=" * 100)
-    print(f"PREDICTIONS SUMMARY - WEEK {week_num}")
-    print(f"Successfully predicted: {len(predictions)}/{len(games)} games")
-    print("=" * 100)
-    print()
+    # per-game progress goes out in one write rather than a print per line
+    if log:
+        sys.stdout.write('\n'.join(log) + '\n')
+        sys.stdout.flush()
+    
+    # output summary - collected with the failed games and written in one call
+    summary = [
+        "\n\n",
+        "=" * 100,
+        f"PREDICTIONS SUMMARY - WEEK {week_num}",
+        f"Successfully predicted: {len(predictions)}/{len(games)} games",
+        "=" * 100,
+        ""
+    ]
     
     for i, pred in enumerate(predictions, 1):
-        home_marker = "  " if pred['winner'] != pred['home_team'] else ">>>"
-        away_marker = "  " if pred['winner'] != pred['away_team'] else ">>>"
+        home, away, winner, conf = pred['home_team'], pred['away_team'], pred['winner'], pred['confidence']
+        home_marker = "  " if winner != home else ">>>"
+        away_marker = "  " if winner != away else ">>>"
         neutral_marker = " [NEUTRAL]" if pred['is_neutral'] else ""
         
-        # Determine confidence level label
-        conf = pred['confidence']
-        if conf > 85:
-            conf_label = "LOCK"
-        elif conf > 70:
-            conf_label = "CONFIDENT"
-        elif conf > 60:
-            conf_label = "LEAN"
-        else:
-            conf_label = "TOSS-UP"
+        # Determine confidence level label (bisect_left keeps the boundaries exclusive)
+        conf_label = CONFIDENCE_LABELS[bisect.bisect_left(CONFIDENCE_THRESHOLDS, conf)]
         
-        print(f"Game {i}:{neutral_marker}")
-        print(f"  {away_marker} {pred['away_team']}")
-        print(f"  @")
-        print(f"  {home_marker} {pred['home_team']}")
-        print(f"  PREDICTION: {pred['winner']} wins ({conf:.1f}% | {conf_label})")
+        summary.append(f"Game {i}:{neutral_marker}")
+        summary.append(f"  {away_marker} {away}")
+        summary.append(f"  @")
+        summary.append(f"  {home_marker} {home}")
+        summary.append(f"  PREDICTION: {winner} wins ({conf:.1f}% | {conf_label})")
         
         if 'home_points' in pred:  # Heuristic mode
-            print(f"  Score: {pred['home_team']} {pred['home_points']:.1f} - {pred['away_points']:.1f} {pred['away_team']}")
+            summary.append(f"  Score: {home} {pred['home_points']:.1f} - {pred['away_points']:.1f} {away}")
         else:  # ML mode
-            print(f"  Probabilities: {pred['home_team']} {pred.get('home_win_prob', 0)*100:.1f}% | {pred['away_team']} {pred.get('away_win_prob', 0)*100:.1f}%")
-        print()
+            summary.append(f"  Probabilities: {home} {pred.get('home_win_prob', 0)*100:.1f}% | {away} {pred.get('away_win_prob', 0)*100:.1f}%")
+        summary.append("")
     
     # show failed predictions
     if failed_games:
-        print("=" * 100)
-        print(f"GAMES THAT COULD NOT BE PREDICTED ({len(failed_games)}):")
-        print("=" * 100)
+        summary.append("=" * 100)
+        summary.append(f"GAMES THAT COULD NOT BE PREDICTED ({len(failed_games)}):")
+        summary.append("=" * 100)
         for i, failed in enumerate(failed_games, 1):
             neutral_marker = " [NEUTRAL]" if failed['is_neutral'] else ""
-            print(f"{i}. {failed['away_team']} @ {failed['home_team']}{neutral_marker}")
-            print(f"   Reason: {failed['reason']}")
-            print()
+            summary.append(f"{i}. {failed['away_team']} @ {failed['home_team']}{neutral_marker}")
+            summary.append(f"   Reason: {failed['reason']}")
+            summary.append("")
     
-    print("=" * 100)
+    summary.append("=" * 100)
+    sys.stdout.write("\n".join(summary) + "\n")
+    sys.stdout.flush()
+    
+    # save to file - build the report in memory and write it in one call
+    report = [REPORT_HEADER.format(week=week_num, predicted=len(predictions), total=len(games))]
+    
+    for i, pred in enumerate(predictions, 1):
+        fields = {**pred, 'index': i, 'neutral': NEUTRAL_SITE_TAG if pred['is_neutral'] else ''}
+        report.append(GAME_TEMPLATE.format_map(fields))
+        if 'home_points' in pred:  # Heuristic mode
+            report.append(POINTS_TEMPLATE.format_map(fields))
+        else:  # ML mode
+            fields['home_pct'] = pred.get('home_win_prob', 0) * 100
+            fields['away_pct'] = pred.get('away_win_prob', 0) * 100
+            report.append(PROBABILITIES_TEMPLATE.format_map(fields))
+    
+    if failed_games:
+        report.append(FAILED_HEADER.format(count=len(failed_games)))
+        for i, failed in enumerate(failed_games, 1):
+            report.append(FAILED_TEMPLATE.format_map(
+                {**failed, 'index': i, 'neutral': NEUTRAL_SITE_TAG if failed['is_neutral'] else ''}
+            ))
     
-    # save to file
     with open(f'predictions_week_{week_num}.txt', 'w', encoding='utf-8') as f:
-        f.write(f"NFL PREDICTIONS - WEEK {week_num}\n")
-        f.write(f"Successfully predicted: {len(predictions)}/{len(games)} games\n")
-        f.write("=" * 100 + "\n\n")
-        
-        for i, pred in enumerate(predictions, 1):
-            f.write(f"Game {i}: {pred['away_team']} @ {pred['home_team']}")
-            if pred['is_neutral']:
-                f.write(" [NEUTRAL SITE]")
-            f.write("\n")
-            f.write(f"  PREDICTION: {pred['winner']} wins\n")
-            f.write(f"  Confidence: {pred['confidence']:.1f}%\n")
-            
-            if 'home_points' in pred:  # Heuristic mode
-                f.write(f"  Points: {pred['home_team']} {pred['home_points']:.1f} - {pred['away_points']:.1f} {pred['away_team']}\n\n")
-            else:  # ML mode
-                f.write(f"  Probabilities: {pred['home_team']} {pred.get('home_win_prob', 0)*100:.1f}% | {pred['away_team']} {pred.get('away_win_prob', 0)*100:.1f}%\n\n")
-        
-        if failed_games:
-            f.write("\n" + "=" * 100 + "\n")
-            f.write(f"GAMES THAT COULD NOT BE PREDICTED ({len(failed_games)}):\n")
-            f.write("=" * 100 + "\n\n")
-            for i, failed in enumerate(failed_games, 1):
-                f.write(f"{i}. {failed['away_team']} @ {failed['home_team']}")
-                if failed['is_neutral']:
-                    f.write(" [NEUTRAL SITE]")
-                f.write(f"\n   Reason: {failed['reason']}\n\n")
+        f.write(''.join(report))
     
     print(f"\nPredictions saved to predictions_week_{week_num}.txt")
     
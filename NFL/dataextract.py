@@ -1,7 +1,367 @@
+import os
+import sys
 import requests
 import json
 from datetime import datetime
 import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+
+# optional streaming JSON parser (lets us skip the parts of the summary we don't use)
+try:
+    import ijson
+    from ijson.common import ObjectBuilder
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+# optional faster JSON decoder for whole responses (stdlib json otherwise)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# top-level keys of the game summary that get_game_details actually reads
+SUMMARY_FIELDS = ('header', 'boxscore')
+
+# keys of each scoreboard event that get_games_for_week reads (odds, links, weather,
+# broadcasts and the rest of the event are skipped)
+SCOREBOARD_EVENT_FIELDS = ('id', 'status', 'competitions')
+
+# ESPN's status name for a completed game
+STATUS_FINAL = 'STATUS_FINAL'
+
+# shared keep-alive session for every ESPN call - one TLS connection is reused across
+# the scoreboard and game-summary requests, and transient errors are retried with backoff
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    # a 429's Retry-After header sets the wait before the retry when ESPN sends one
+    # the last response is returned rather than raised so its rate-limit headers can be read
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504),
+                      respect_retry_after_header=True, raise_on_status=False)
+))
+_SESSION.headers.update({'User-Agent': 'Mozilla/5.0 (compatible; sportsPredictor)'})
+
+# failures the adapter's Retry can't see - the connection dropping or stalling while a
+# streamed body is being parsed - retry the whole request, waiting
+# FETCH_BACKOFF * 2**attempt seconds in between (connect/read errors before the
+# response arrives are already retried by the adapter and aren't retried again)
+# requests reports a body read timeout from response.content as a ConnectionError
+FETCH_ATTEMPTS = 3
+FETCH_BACKOFF = 0.5
+TRANSIENT_ERRORS = (requests.exceptions.ChunkedEncodingError, requests.ConnectionError,
+                    ProtocolError, ReadTimeoutError)
+
+# ESPN requests in flight at once
+MAX_CONCURRENT_REQUESTS = 5
+
+# adaptive in-flight limit (AIMD): each success adds 1/limit up to MAX_CONCURRENT_REQUESTS,
+# each 429/5xx or dropped connection halves it (never below one request)
+_CONCURRENCY = {'limit': float(MAX_CONCURRENT_REQUESTS), 'in_flight': 0}
+_CONCURRENCY_COND = threading.Condition()
+
+# token bucket shared by every fetch thread: on average at most REQUESTS_PER_SECOND
+# requests, with bursts of up to REQUEST_BURST when the budget hasn't been spent
+REQUESTS_PER_SECOND = 5.0
+REQUEST_BURST = 5
+_RATE_BUCKET = {'tokens': float(REQUEST_BURST), 'updated': time.monotonic()}
+_RATE_LOCK = threading.Lock()
+
+# completed weeks' game ids and final games' details are kept here between runs -
+# final results never change, so entries are written once and never invalidated
+ESPN_CACHE_DIR = '.espn_cache'
+
+# a week that still has unfinished games is re-fetched once its cached scoreboard is
+# older than this (seconds)
+SCOREBOARD_TTL = 300
+
+
+# nflData.txt / nflData.jsonl are written through a buffer this big, so a season's
+# worth of games reaches the OS in a few large writes, then synced to disk once
+WRITE_BUFFER_SIZE = 1 << 20
+
+# every (season_type, week_num) of a season, in order
+# Regular weeks 1-18, Postseason weeks 19-22 (mapped to API weeks 1-4)
+WEEKS_CONFIG = (
+    *(('preseason', week) for week in range(1, 4)),
+    *(('regular', week) for week in range(1, 19)),
+    *(('postseason', week) for week in range(19, 23))
+)
+SEASON_ORDER = ('preseason', 'regular', 'postseason')
+
+# machine-readable copy of nflData.txt - one JSON object per game, appended alongside it
+GAMES_JSONL = 'nflData.jsonl'
+
+# ESPN ids of the games recorded in nflData.txt, so update_mode's re-check of the last
+# week doesn't fetch (or append) them again
+SEEN_GAMES_FILE = 'seen_games.json'
+
+# nflData.txt line templates - filled with str.format_map, one call per QB / team block
+QB_TEMPLATE = "  {side} QB ({name}): {comp_att} for {yards}yds, {tds}TD/{ints}INT, {ypa} YPA, {qb_rating} RTG\n"
+TEAM_STATS_TEMPLATE = (
+    "  {side} ({name}):\n"
+    "    Total Yards: {totalYards} | Yards/Play: {yardsPerPlay} | Possession: {possessionTime}\n"
+    "    Passing: {netPassingYards}yds ({completionAttempts}) | "
+    "Rushing: {rushingYards}yds ({yardsPerRushAttempt} avg) | 1st Downs: {firstDowns}\n"
+    "    3rd Down: {thirdDownEff} | 4th Down: {fourthDownEff} | Red Zone: {redZoneAttempts}\n"
+    "    Turnovers: {turnovers} (INT: {interceptions}, Fum: {fumblesLost}) | "
+    "Sacks: {sacks} | Penalties: {totalPenaltiesYards}\n"
+)
+
+# value written for a stat ESPN didn't report
+STAT_DEFAULTS = {
+    'totalYards': '0',
+    'yardsPerPlay': '0',
+    'possessionTime': '0:00',
+    'netPassingYards': '0',
+    'completionAttempts': '0-0',
+    'rushingYards': '0',
+    'yardsPerRushAttempt': '0.0',
+    'firstDowns': '0',
+    'thirdDownEff': '0-0',
+    'fourthDownEff': '0-0',
+    'redZoneAttempts': '0-0',
+    'turnovers': '0',
+    'interceptions': '0',
+    'fumblesLost': '0',
+    'totalPenaltiesYards': '0-0'
+}
+
+
+def read_cached(key, max_age=None):
+    """
+    returns the value cached under key, or None when there isn't a (readable) entry
+    max_age (seconds) also treats an entry written longer ago than that as missing
+    """
+    path = os.path.join(ESPN_CACHE_DIR, f'{key}.json')
+    try:
+        if max_age is not None and time.time() - os.path.getmtime(path) > max_age:
+            return None
+        with open(path, 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    except (OSError, ValueError):
+        return None
+
+
+def write_cached(key, value):
+    """
+    stores value under key (through a temp file, so a reader never sees half an entry)
+    """
+    os.makedirs(ESPN_CACHE_DIR, exist_ok=True)
+    path = os.path.join(ESPN_CACHE_DIR, f'{key}.json')
+    tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(value) if ORJSON_AVAILABLE else json.dumps(value).encode('utf-8'))
+    os.replace(tmp_path, path)
+
+
+def close():
+    """
+    closes the shared session's pooled connections once a run's requests are done
+    the session opens new ones if it's used again
+    """
+    _SESSION.close()
+
+
+def wait_for_request_slot():
+    """
+    blocks until the shared token bucket allows another ESPN request
+    only sleeps when the scraper is actually over its request budget
+    """
+    while True:
+        with _RATE_LOCK:
+            now = time.monotonic()
+            tokens = min(REQUEST_BURST, _RATE_BUCKET['tokens'] + (now - _RATE_BUCKET['updated']) * REQUESTS_PER_SECOND)
+            _RATE_BUCKET['updated'] = now
+            if tokens >= 1:
+                _RATE_BUCKET['tokens'] = tokens - 1
+                return
+            _RATE_BUCKET['tokens'] = tokens
+            wait = (1 - tokens) / REQUESTS_PER_SECOND
+        time.sleep(wait)
+
+
+def note_rate_limit(response):
+    """
+    feeds ESPN's rate-limit headers back into the shared token bucket, so a
+    Retry-After or an exhausted X-RateLimit-Remaining holds off every fetch thread
+    instead of only the one that got the response
+    """
+    headers = response.headers
+    retry_after = headers.get('Retry-After')
+    if retry_after is None and headers.get('X-RateLimit-Remaining') != '0':
+        return
+    
+    try:
+        delay = float(retry_after) if retry_after is not None else 0.0
+    except ValueError:
+        # HTTP-date form - the request's own retry already honoured it
+        delay = 0.0
+    
+    # a negative balance is a debt the bucket refills before the next request goes out
+    with _RATE_LOCK:
+        _RATE_BUCKET['tokens'] = min(_RATE_BUCKET['tokens'], -delay * REQUESTS_PER_SECOND)
+
+
+def acquire_fetch_slot():
+    """
+    blocks until fewer requests are in flight than the current adaptive limit
+    """
+    with _CONCURRENCY_COND:
+        while _CONCURRENCY['in_flight'] >= int(_CONCURRENCY['limit']):
+            _CONCURRENCY_COND.wait()
+        _CONCURRENCY['in_flight'] += 1
+
+
+def release_fetch_slot(overloaded):
+    """
+    frees an in-flight slot and adjusts the limit - halved when ESPN pushed back,
+    grown by 1/limit otherwise
+    """
+    with _CONCURRENCY_COND:
+        _CONCURRENCY['in_flight'] -= 1
+        limit = _CONCURRENCY['limit']
+        if overloaded:
+            _CONCURRENCY['limit'] = max(1.0, limit / 2)
+        else:
+            _CONCURRENCY['limit'] = min(float(MAX_CONCURRENT_REQUESTS), limit + 1 / limit)
+        _CONCURRENCY_COND.notify_all()
+
+
+def fetch_espn(url, params, parse):
+    """
+    GETs an ESPN endpoint (streamed) and returns parse(response)
+    a body that breaks off while it's being parsed retries the whole request with
+    exponential backoff
+    """
+    for attempt in range(FETCH_ATTEMPTS):
+        wait_for_request_slot()
+        acquire_fetch_slot()
+        # anything that fails before a status arrives counts as the connection giving out
+        overloaded = True
+        try:
+            with _SESSION.get(url, params=params, timeout=10, stream=True) as response:
+                note_rate_limit(response)
+                overloaded = response.status_code == 429 or response.status_code >= 500
+                response.raise_for_status()
+                try:
+                    return parse(response)
+                except TRANSIENT_ERRORS:
+                    if attempt == FETCH_ATTEMPTS - 1:
+                        raise
+        finally:
+            release_fetch_slot(overloaded)
+        time.sleep(FETCH_BACKOFF * 2 ** attempt)
+
+
+def decode_json(response):
+    """
+    decodes a JSON response body, with orjson when it's installed
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def load_json_fields(response, fields):
+    """
+    builds only the requested top-level keys of a streamed JSON response
+    everything else is tokenized and dropped without creating python objects
+    falls back to decoding the whole body when ijson isn't installed
+    """
+    if not IJSON_AVAILABLE:
+        data = decode_json(response)
+        return {key: data[key] for key in fields if key in data}
+    
+    response.raw.decode_content = True
+    builders = {}
+    for prefix, event, value in ijson.parse(response.raw, use_float=True):
+        key = prefix.partition('.')[0]
+        if key in fields:
+            if key not in builders:
+                builders[key] = ObjectBuilder()
+            builders[key].event(event, value)
+    return {key: builder.value for key, builder in builders.items()}
+
+
+def load_json_items(response, array_key, fields):
+    """
+    yields the items of a streamed top-level JSON array, each built with only the
+    requested keys
+    falls back to decoding the whole body when ijson isn't installed
+    """
+    if not IJSON_AVAILABLE:
+        for item in decode_json(response).get(array_key, []):
+            yield {key: item[key] for key in fields if key in item}
+        return
+    
+    response.raw.decode_content = True
+    item_prefix = array_key + '.item'
+    field_prefix = item_prefix + '.'
+    builders = None
+    for prefix, event, value in ijson.parse(response.raw, use_float=True):
+        if prefix == item_prefix:
+            if event == 'start_map':
+                builders = {}
+            elif event == 'end_map':
+                yield {key: builder.value for key, builder in builders.items()}
+                builders = None
+        elif builders is not None and prefix.startswith(field_prefix):
+            key = prefix[len(field_prefix):].partition('.')[0]
+            if key in fields:
+                if key not in builders:
+                    builders[key] = ObjectBuilder()
+                builders[key].event(event, value)
+
+def _game_teams(competitors):
+    """
+    builds game_info's away/home team names and scores from ESPN competitors
+    """
+    game_info = {
+        'away_team': {},
+        'home_team': {}
+    }
+    
+    # get team names and scores
+    for competitor in competitors:
+        team = competitor.get('team', {})
+        team_name = team.get('displayName', 'Unknown')
+        score = competitor.get('score', '0')
+        home_away = competitor.get('homeAway', '')
+        
+        if home_away == 'home':
+            game_info['home_team']['name'] = team_name
+            game_info['home_team']['score'] = score
+        else:
+            game_info['away_team']['name'] = team_name
+            game_info['away_team']['score'] = score
+    return game_info
+
+
+def _team_stats(statistics):
+    """
+    builds a team's stats dict from an ESPN statistics list - every display value,
+    plus the numeric value of stats that have one under "<name>_value"
+    """
+    # create stats dict - capture ALL available stats, numeric values alongside
+    stats = {}
+    for stat in statistics:
+        stat_name = stat.get('name', '')
+        if not stat_name:
+            continue
+        stats[stat_name] = stat.get('displayValue', '')
+        value = stat.get('value')
+        if isinstance(value, (int, float)):
+            stats[f"{stat_name}_value"] = value
+    return stats
+
 
 def get_games_for_week(season_type, week_num, year=2024):
     """
@@ -10,6 +370,7 @@ def get_games_for_week(season_type, week_num, year=2024):
     week_num: For postseason, this should be 1-4 (Wild Card, Divisional, Conference, Super Bowl)
               For regular, this is 1-18
               If week_num >= 19, it's converted to postseason week (week_num - 18)
+    returns the ids of the week's completed games
     """
     base_api_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/scoreboard"
     
@@ -32,28 +393,39 @@ def get_games_for_week(season_type, week_num, year=2024):
         'year': year
     }
     
+    # a week where every game is final can't change, so it's only ever fetched once;
+    # one still in progress is reused for SCOREBOARD_TTL seconds
+    cache_key = f"scoreboard_{year}_{season_type_num}_{actual_week}"
+    cached = read_cached(cache_key)
+    if cached is None:
+        cached = read_cached(f"{cache_key}_live", max_age=SCOREBOARD_TTL)
+    if cached is not None:
+        return cached
+    
     try:
-        response = requests.get(base_api_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        events = fetch_espn(base_api_url, params,
+                            lambda response: list(load_json_items(response, 'events', SCOREBOARD_EVENT_FIELDS)))
         
         games = []
+        all_final = bool(events)
         
-        if 'events' in data:
-            for event in data['events']:
-                status = event.get('status', {}).get('type', {}).get('name', '')
-                
-                # only include completed games
-                if status.lower() == 'status_final':
-                    game_id = event.get('id')
-                    competitions = event.get('competitions', [])
-                    
-                    if competitions and game_id:
-                        competition = competitions[0]
-                        competitors = competition.get('competitors', [])
-                        
-                        if len(competitors) >= 2:
-                            games.append(game_id)
+        for event in events:
+            status = ((event.get('status') or {}).get('type') or {}).get('name')
+            
+            # only include completed games
+            if status != STATUS_FINAL:
+                all_final = False
+                continue
+            
+            game_id = event.get('id')
+            if not game_id:
+                continue
+            
+            competitions = event.get('competitions')
+            if competitions and len(competitions[0].get('competitors', [])) >= 2:
+                games.append(game_id)
+        
+        write_cached(cache_key if all_final else f"{cache_key}_live", games)
         
         return games
         
@@ -69,35 +441,29 @@ def get_game_details(game_id):
     game_detail_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/summary"
     params = {'event': game_id}
     
+    # only final games are looked up here, so a stored summary is never stale
+    cache_key = f"game_{game_id}"
+    cached = read_cached(cache_key)
+    if cached is not None:
+        return cached
+    
     try:
-        response = requests.get(game_detail_url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
+        data = fetch_espn(game_detail_url, params,
+                          lambda response: load_json_fields(response, SUMMARY_FIELDS))
         
         # extract team info
         header = data.get('header', {})
         competitions = header.get('competitions', [{}])[0]
         competitors = competitions.get('competitors', [])
         
-        game_info = {
-            'away_team': {},
-            'home_team': {}
+        game_info = _game_teams(competitors)
+        # boxscore entries are matched to a side by team name (home listed last, so it
+        # wins if both sides somehow share a name)
+        slot_by_name = {
+            game_info['away_team'].get('name'): game_info['away_team'],
+            game_info['home_team'].get('name'): game_info['home_team']
         }
         
-        # get team names and scores
-        for competitor in competitors:
-            team = competitor.get('team', {})
-            team_name = team.get('displayName', 'Unknown')
-            score = competitor.get('score', '0')
-            home_away = competitor.get('homeAway', '')
-            
-            if home_away == 'home':
-                game_info['home_team']['name'] = team_name
-                game_info['home_team']['score'] = score
-            else:
-                game_info['away_team']['name'] = team_name
-                game_info['away_team']['score'] = score
-        
         # Extract QB stats from players section
         if 'boxscore' in data and 'players' in data['boxscore']:
             players_by_team = data['boxscore']['players']
@@ -117,22 +483,23 @@ def get_game_details(game_id):
                             qb_stats = qb.get('stats', [])
                             
                             # Parse QB stats: ['17/34', '204', '6.0', '1', '3', '1-6', '31.5', '41.8']
+                            # (padded, so a short or blank entry falls back to its default)
+                            padded = qb_stats + [''] * 8
                             qb_data = {
                                 'name': qb_name,
-                                'comp_att': qb_stats[0] if len(qb_stats) > 0 else '0/0',
-                                'yards': qb_stats[1] if len(qb_stats) > 1 else '0',
-                                'ypa': qb_stats[2] if len(qb_stats) > 2 else '0.0',
-                                'tds': qb_stats[3] if len(qb_stats) > 3 else '0',
-                                'ints': qb_stats[4] if len(qb_stats) > 4 else '0',
-                                'sacks_lost': qb_stats[5] if len(qb_stats) > 5 else '0-0',
-                                'qb_rating': qb_stats[7] if len(qb_stats) > 7 else '0.0'
+                                'comp_att': padded[0] or '0/0',
+                                'yards': padded[1] or '0',
+                                'ypa': padded[2] or '0.0',
+                                'tds': padded[3] or '0',
+                                'ints': padded[4] or '0',
+                                'sacks_lost': padded[5] or '0-0',
+                                'qb_rating': padded[7] or '0.0'
                             }
                             
                             # Store QB data for the correct team
-                            if team_name == game_info['home_team'].get('name'):
-                                game_info['home_team']['qb'] = qb_data
-                            elif team_name == game_info['away_team'].get('name'):
-                                game_info['away_team']['qb'] = qb_data
+                            slot = slot_by_name.get(team_name)
+                            if slot is not None:
+                                slot['qb'] = qb_data
         
         # extract team statistics from boxscore
         if 'boxscore' in data:
@@ -143,26 +510,14 @@ def get_game_details(game_id):
                 team_info = team.get('team', {})
                 team_name = team_info.get('displayName', '')
                 
-                # create stats dict - capture ALL available stats
-                stats = {}
-                statistics = team.get('statistics', [])
-                for stat in statistics:
-                    stat_name = stat.get('name', '')
-                    stat_value = stat.get('displayValue', '')
-                    stats[stat_name] = stat_value
-                
-                # Also capture numeric values for key stats
-                for stat in statistics:
-                    stat_name = stat.get('name', '')
-                    if 'value' in stat and isinstance(stat.get('value'), (int, float)):
-                        stats[f"{stat_name}_value"] = stat.get('value')
+                stats = _team_stats(team.get('statistics', []))
                 
                 # determine if home or away and store stats
-                if team_name == game_info['home_team'].get('name'):
-                    game_info['home_team']['stats'] = stats
-                elif team_name == game_info['away_team'].get('name'):
-                    game_info['away_team']['stats'] = stats
+                slot = slot_by_name.get(team_name)
+                if slot is not None:
+                    slot['stats'] = stats
         
+        write_cached(cache_key, game_info)
         return game_info
         
     except Exception as e:
@@ -170,59 +525,85 @@ def get_game_details(game_id):
         return None
 
 
-def scrape_nfl_scores():
+def get_week_label(season_type, week_num):
+    """
+    nflData.txt week header for a (season_type, week_num) pair
+    postseason weeks 19-22 are stored as REGULAR_WEEK_19-22 for compatibility
+    """
+    if season_type == 'preseason':
+        return f"PRESEASON_WEEK_{week_num}"
+    return f"REGULAR_WEEK_{week_num}"
+
+
+def _future_result(future, default):
+    """
+    returns a finished future's result, or default (printing the error) when its call raised
+    so one failed request can't abort the rest of the batch
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        print(f"    Error fetching from ESPN: {e}")
+        return default
+
+
+def fetch_weeks(weeks, skip_ids=frozenset()):
+    """
+    fetches the completed games of every (season_type, week_num) in weeks
+    games whose id is in skip_ids are left out
+    returns [(season_type, week_num, game_ids, game_details)] in the same order
+    """
+    # one pool for everything, at most MAX_CONCURRENT_REQUESTS in flight: every week's
+    # scoreboard is queued up front, and a week's game summaries are queued as soon as
+    # its scoreboard is in, so they overlap the scoreboards still being fetched
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        week_futures = [executor.submit(get_games_for_week, *week) for week in weeks]
+        
+        week_games = []
+        for future in week_futures:
+            game_ids = [game_id for game_id in _future_result(future, []) if game_id not in skip_ids]
+            week_games.append((game_ids, [executor.submit(get_game_details, game_id) for game_id in game_ids]))
+        
+        return [(season_type, week_num, game_ids, [_future_result(detail, None) for detail in details])
+                for (season_type, week_num), (game_ids, details) in zip(weeks, week_games)]
+
+
+def scrape_nfl_scores(verbose=True):
     """
     scrapes NFL scores and detailed stats using ESPN API
+    verbose: print per-week / per-game progress (errors are always printed)
     """
     all_games = []
     
     print("Starting NFL data extraction with detailed stats from ESPN API...")
     
-    # define weeks to scrape
-    # Regular weeks 1-18, Postseason weeks 19-22 (mapped to API weeks 1-4)
-    weeks_config = [
-        ('preseason', 1), ('preseason', 2), ('preseason', 3),
-        ('regular', 1), ('regular', 2), ('regular', 3), ('regular', 4), ('regular', 5),
-        ('regular', 6), ('regular', 7), ('regular', 8), ('regular', 9), ('regular', 10),
-        ('regular', 11), ('regular', 12), ('regular', 13), ('regular', 14), ('regular', 15),
-        ('regular', 16), ('regular', 17), ('regular', 18),
-        ('postseason', 19), ('postseason', 20), ('postseason', 21), ('postseason', 22)
-    ]
-    
-    for season_type, week_num in weeks_config:
-        if season_type == 'preseason':
-            week_label = f"PRESEASON_WEEK_{week_num}"
-        elif season_type == 'postseason':
-            # Store as REGULAR_WEEK_19-22 for compatibility, but these are postseason games
-            week_label = f"REGULAR_WEEK_{week_num}"  # Will be 19, 20, 21, or 22
-        else:
-            week_label = f"REGULAR_WEEK_{week_num}"
-        
-        print(f"\nScraping {week_label}...")
-        
-        # get game IDs for this week
-        game_ids = get_games_for_week(season_type, week_num)
-        
-        if not game_ids:
-            print(f"  No completed games for {week_label}")
-            time.sleep(1)
-            continue
+    week_results = fetch_weeks(WEEKS_CONFIG)
+    close()
+    
+    for season_type, week_num, game_ids, game_details in week_results:
+        week_label = get_week_label(season_type, week_num)
         
-        print(f"  Found {len(game_ids)} games")
+        # the week's progress lines are collected and written in one go
+        log = []
+        if verbose:
+            log.append(f"\nScraping {week_label}...")
+            if not game_ids:
+                log.append(f"  No completed games for {week_label}")
+            else:
+                log.append(f"  Found {len(game_ids)} games")
         
-        for game_id in game_ids:
+        for game_id, game_info in zip(game_ids, game_details):
             try:
-                # get detailed game info
-                game_info = get_game_details(game_id)
-                
                 if not game_info or not game_info['away_team'] or not game_info['home_team']:
                     continue
                 
-                print(f"  OK: {game_info['away_team']['name']} @ {game_info['home_team']['name']} "
-                      f"({game_info['away_team']['score']}-{game_info['home_team']['score']})")
+                if verbose:
+                    log.append(f"  OK: {game_info['away_team']['name']} @ {game_info['home_team']['name']} "
+                               f"({game_info['away_team']['score']}-{game_info['home_team']['score']})")
                 
                 # format game data
                 game_data = {
+                    'game_id': game_id,
                     'week': week_label,
                     'season_type': season_type.upper(),
                     'week_number': week_num,
@@ -233,106 +614,118 @@ def scrape_nfl_scores():
                 
                 all_games.append(game_data)
                 
-                # be respectful to the API
-                time.sleep(1.5)
-                
             except Exception as e:
-                print(f"    Error processing game {game_id}: {e}")
+                log.append(f"    Error processing game {game_id}: {e}")
                 continue
         
-        # wait between weeks
-        time.sleep(1)
+        if log:
+            sys.stdout.write('\n'.join(log) + '\n')
     
     return all_games
 
 
+def _format_team(side, team):
+    """
+    formats one team's stats block for nflData.txt
+    """
+    stats = team.get('stats', {})
+    view = {**STAT_DEFAULTS, **stats}
+    # sacksYardsLost is "sacks-yards"; only the sack count is written
+    view['sacks'] = stats.get('sacksYardsLost', '0-0').partition('-')[0] or '0'
+    view['side'] = side
+    view['name'] = team['name']
+    return TEAM_STATS_TEMPLATE.format_map(view)
+
+
+def _format_game(game):
+    """
+    formats one game's block for nflData.txt - score line, QB lines and both teams' stats
+    """
+    away = game['away_team']
+    home = game['home_team']
+    
+    # basic game info
+    lines = [f"[{game['week']}] {away['name']} @ {home['name']} | "
+             f"{away['score']}-{home['score']} | {game['status']}\n"]
+    
+    # QB stats (if available)
+    if 'qb' in away:
+        lines.append(QB_TEMPLATE.format_map({**away['qb'], 'side': 'AWAY'}))
+    if 'qb' in home:
+        lines.append(QB_TEMPLATE.format_map({**home['qb'], 'side': 'HOME'}))
+    
+    # detailed stats
+    lines.append(_format_team('AWAY', away))
+    lines.append(_format_team('HOME', home))
+    lines.append("\n")
+    return ''.join(lines)
+
+
+def _sync(f):
+    """
+    flushes an open file and waits until its contents are on disk
+    """
+    f.flush()
+    os.fsync(f.fileno())
+
+
+def write_games_jsonl(games, mode):
+    """
+    writes games to nflData.jsonl, one compact JSON object per line
+    mode is 'w' to replace the file or 'a' to append to it
+    """
+    with open(GAMES_JSONL, mode, encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.writelines(json.dumps(game, separators=(',', ':')) + '\n' for game in games)
+        _sync(f)
+
+
+def _write_games(f, games):
+    """
+    writes games to an open nflData.txt grouped under their week headers
+    the block's pieces are built first and handed to the file in one call
+    """
+    parts = []
+    current_week = None
+    for game in games:
+        if game['week'] != current_week:
+            current_week = game['week']
+            parts.append(f"\n{'=' * 100}\n{current_week}\n{'=' * 100}\n\n")
+        parts.append(_format_game(game))
+    f.writelines(parts)
+
+
 def write_to_file(games):
     """
     writes game data to nflData.txt with detailed statistics
     """
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     
-    with open('nflData.txt', 'w', encoding='utf-8') as f:
-        f.write(f"NFL Game Data - Last Updated: {timestamp}\n")
-        f.write("=" * 100 + "\n\n")
+    with open('nflData.txt', 'w', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        f.write(f"NFL Game Data - Last Updated: {timestamp}\n{'=' * 100}\n\n")
         
         if not games:
             f.write("No game data available.\n")
-            return
-        
-        # group games by week
-        current_week = None
-        for game in games:
-            if game['week'] != current_week:
-                current_week = game['week']
-                f.write(f"\n{'=' * 100}\n")
-                f.write(f"{current_week}\n")
-                f.write(f"{'=' * 100}\n\n")
-            
-            away = game['away_team']
-            home = game['home_team']
-            away_stats = away.get('stats', {})
-            home_stats = home.get('stats', {})
-            
-            # basic game info
-            f.write(f"[{game['week']}] {away['name']} @ {home['name']} | "
-                   f"{away['score']}-{home['score']} | {game['status']}\n")
-            
-            # QB stats (if available)
-            if 'qb' in away:
-                qb = away['qb']
-                f.write(f"  AWAY QB ({qb['name']}): {qb['comp_att']} for {qb['yards']}yds, {qb['tds']}TD/{qb['ints']}INT, "
-                       f"{qb['ypa']} YPA, {qb['qb_rating']} RTG\n")
-            if 'qb' in home:
-                qb = home['qb']
-                f.write(f"  HOME QB ({qb['name']}): {qb['comp_att']} for {qb['yards']}yds, {qb['tds']}TD/{qb['ints']}INT, "
-                       f"{qb['ypa']} YPA, {qb['qb_rating']} RTG\n")
-            
-            # detailed stats
-            f.write(f"  AWAY ({away['name']}):\n")
-            f.write(f"    Total Yards: {away_stats.get('totalYards', '0')} | "
-                   f"Yards/Play: {away_stats.get('yardsPerPlay', '0')} | "
-                   f"Possession: {away_stats.get('possessionTime', '0:00')}\n")
-            f.write(f"    Passing: {away_stats.get('netPassingYards', '0')}yds ({away_stats.get('completionAttempts', '0-0')}) | "
-                   f"Rushing: {away_stats.get('rushingYards', '0')}yds ({away_stats.get('yardsPerRushAttempt', '0.0')} avg) | "
-                   f"1st Downs: {away_stats.get('firstDowns', '0')}\n")
-            f.write(f"    3rd Down: {away_stats.get('thirdDownEff', '0-0')} | "
-                   f"4th Down: {away_stats.get('fourthDownEff', '0-0')} | "
-                   f"Red Zone: {away_stats.get('redZoneAttempts', '0-0')}\n")
-            f.write(f"    Turnovers: {away_stats.get('turnovers', '0')} (INT: {away_stats.get('interceptions', '0')}, Fum: {away_stats.get('fumblesLost', '0')}) | "
-                   f"Sacks: {away_stats.get('sacksYardsLost', '0-0').split('-')[0] if '-' in away_stats.get('sacksYardsLost', '0') else '0'} | "
-                   f"Penalties: {away_stats.get('totalPenaltiesYards', '0-0')}\n")
-            
-            f.write(f"  HOME ({home['name']}):\n")
-            f.write(f"    Total Yards: {home_stats.get('totalYards', '0')} | "
-                   f"Yards/Play: {home_stats.get('yardsPerPlay', '0')} | "
-                   f"Possession: {home_stats.get('possessionTime', '0:00')}\n")
-            f.write(f"    Passing: {home_stats.get('netPassingYards', '0')}yds ({home_stats.get('completionAttempts', '0-0')}) | "
-                   f"Rushing: {home_stats.get('rushingYards', '0')}yds ({home_stats.get('yardsPerRushAttempt', '0.0')} avg) | "
-                   f"1st Downs: {home_stats.get('firstDowns', '0')}\n")
-            f.write(f"    3rd Down: {home_stats.get('thirdDownEff', '0-0')} | "
-                   f"4th Down: {home_stats.get('fourthDownEff', '0-0')} | "
-                   f"Red Zone: {home_stats.get('redZoneAttempts', '0-0')}\n")
-            f.write(f"    Turnovers: {home_stats.get('turnovers', '0')} (INT: {home_stats.get('interceptions', '0')}, Fum: {home_stats.get('fumblesLost', '0')}) | "
-                   f"Sacks: {home_stats.get('sacksYardsLost', '0-0').split('-')[0] if '-' in home_stats.get('sacksYardsLost', '0') else '0'} | "
-                   f"Penalties: {home_stats.get('totalPenaltiesYards', '0-0')}\n")
-            f.write("\n")
-        
-        f.write(f"\n{'=' * 100}\n")
-        f.write(f"Total games recorded: {len(games)}\n")
+        else:
+            _write_games(f, games)
+            f.write(f"\n{'=' * 100}\nTotal games recorded: {len(games)}\n")
+        _sync(f)
+    write_games_jsonl(games, 'w')
+    save_seen_game_ids(game['game_id'] for game in games)
     
-    print(f"\nData written to nflData.txt - {len(games)} games recorded")
+    if games:
+        print(f"\nData written to nflData.txt - {len(games)} games recorded")
 
 
-def main():
+def main(verbose=True):
     """
     main execution function
+    verbose: print per-week / per-game progress while scraping
     """
     print("NFL Data Extractor - Using ESPN API")
     print("=" * 100)
     
     # scrape the data
-    games = scrape_nfl_scores()
+    games = scrape_nfl_scores(verbose)
     
     # write to file
     write_to_file(games)
@@ -340,18 +733,80 @@ def main():
     print("\nExtraction complete!")
 
 
+def _written_with_report(path):
+    """
+    True when path was written with (or after) the current nflData.txt, so what it
+    says about the recorded games still holds
+    """
+    try:
+        return os.path.getmtime(path) >= os.path.getmtime('nflData.txt')
+    except OSError:
+        return False
+
+
+def load_seen_game_ids():
+    """
+    returns the set of game ids recorded in nflData.txt (empty when unknown)
+    """
+    if not _written_with_report(SEEN_GAMES_FILE):
+        return set()
+    try:
+        with open(SEEN_GAMES_FILE, 'r', encoding='utf-8') as f:
+            return set(json.load(f))
+    except (OSError, ValueError):
+        return set()
+
+
+def save_seen_game_ids(game_ids):
+    """
+    stores the ids of the games recorded in nflData.txt
+    """
+    with open(SEEN_GAMES_FILE, 'w', encoding='utf-8') as f:
+        json.dump(sorted(game_ids), f)
+
+
+def _reverse_lines(path, block_size=8192):
+    """
+    yields a text file's non-empty lines last-first, reading backwards from the end in
+    blocks so only as much of the file as the caller consumes is ever loaded
+    """
+    with open(path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        head = b''
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + head).split(b'\n')
+            # the first piece may be cut by the block boundary, so it waits for the next block
+            head = lines[0]
+            for line in reversed(lines[1:]):
+                if line:
+                    yield line.decode('utf-8', errors='replace')
+        if head:
+            yield head.decode('utf-8', errors='replace')
+
+
 def get_last_week_from_file():
     """
     reads nflData.txt and determines the last week that was scraped
     returns (season_type, week_number) or None
     """
+    # the JSONL copy names the last game's week directly - only trusted when it was
+    # written with (or after) the current text file
     try:
-        with open('nflData.txt', 'r', encoding='utf-8') as f:
-            lines = f.readlines()
-        
-        # find the last week header
+        if _written_with_report(GAMES_JSONL):
+            last_line = next(_reverse_lines(GAMES_JSONL), None)
+            if last_line:
+                game = json.loads(last_line)
+                return (game['season_type'].lower(), game['week_number'])
+    except (OSError, ValueError, KeyError):
+        pass
+    
+    try:
+        # find the last week header - scanning stops there, so only the last week is read
         last_week = None
-        for line in reversed(lines):
+        for line in _reverse_lines('nflData.txt'):
             if 'PRESEASON_WEEK' in line or 'REGULAR_WEEK' in line:
                 if '[' not in line and '=' not in line:
                     last_week = line.strip()
@@ -374,9 +829,10 @@ def get_last_week_from_file():
         return None
 
 
-def update_mode():
+def update_mode(verbose=True):
     """
     only fetches games from weeks after the last scraped week
+    verbose: print per-week / per-game progress (errors are always printed)
     """
     print("NFL Data Updater - Incremental Mode")
     print("=" * 100)
@@ -386,43 +842,20 @@ def update_mode():
     if not last_week_info:
         print("No existing data found or couldn't determine last week.")
         print("Running full extraction instead...\n")
-        main()
+        main(verbose)
         return
     
     season_type, last_week_num = last_week_info
     print(f"Last scraped: {season_type.upper()} Week {last_week_num}")
     print("Fetching only new games...\n")
     
-    # determine which weeks to scrape
-    weeks_to_scrape = []
-    
-    if season_type == 'preseason':
-        # finish preseason, then start regular/postseason
-        for week in range(last_week_num, 4):  # Re-check current week for missed games
-            weeks_to_scrape.append(('preseason', week))
-        # add all regular season weeks (1-18)
-        for week in range(1, 19):
-            weeks_to_scrape.append(('regular', week))
-        # add postseason weeks (19-22)
-        for week in range(19, 23):
-            weeks_to_scrape.append(('postseason', week))
-    elif season_type == 'postseason':
-        # Continue from last postseason week
-        for week in range(last_week_num, 23):
-            weeks_to_scrape.append(('postseason', week))
-    else:  # regular season - continue through postseason
-        # Re-check the last scraped week to catch any missed games, then continue
-        if last_week_num < 19:
-            # Still in regular season, continue to postseason
-            for week in range(last_week_num, 19):
-                weeks_to_scrape.append(('regular', week))
-            # Add all postseason weeks
-            for week in range(19, 23):
-                weeks_to_scrape.append(('postseason', week))
-        else:
-            # Already in postseason
-            for week in range(last_week_num, 23):
-                weeks_to_scrape.append(('postseason', week))
+    # determine which weeks to scrape - re-check the last scraped week to catch any
+    # missed games, then continue through the end of the postseason
+    if season_type == 'regular' and last_week_num >= 19:
+        season_type = 'postseason'
+    start = (SEASON_ORDER.index(season_type), last_week_num)
+    weeks_to_scrape = [week for week in WEEKS_CONFIG
+                       if (SEASON_ORDER.index(week[0]), week[1]) >= start]
     
     if not weeks_to_scrape:
         print("Already up to date! No new weeks to fetch.")
@@ -430,38 +863,35 @@ def update_mode():
     
     print(f"Will check {len(weeks_to_scrape)} weeks for new games\n")
     
-    # fetch new games
+    # fetch new games - ones already in nflData.txt aren't fetched again
+    seen_ids = load_seen_game_ids()
     new_games = []
-    for season_type, week_num in weeks_to_scrape:
-        if season_type == 'preseason':
-            week_label = f"PRESEASON_WEEK_{week_num}"
-        elif season_type == 'postseason':
-            week_label = f"REGULAR_WEEK_{week_num}"  # Store as REGULAR_WEEK_19-22 for compatibility
-        else:
-            week_label = f"REGULAR_WEEK_{week_num}"
-        
-        print(f"Checking {week_label} (season_type={season_type}, week={week_num})...")
-        
-        # get_games_for_week will handle the week conversion (19-22 -> 1-4 for API)
-        game_ids = get_games_for_week(season_type, week_num)
-        
-        if not game_ids:
-            print(f"  No completed games")
-            continue
+    week_results = fetch_weeks(weeks_to_scrape, skip_ids=seen_ids)
+    close()
+    
+    for season_type, week_num, game_ids, game_details in week_results:
+        week_label = get_week_label(season_type, week_num)
         
-        print(f"  Found {len(game_ids)} games")
+        # the week's progress lines are collected and written in one go
+        log = []
+        if verbose:
+            log.append(f"Checking {week_label} (season_type={season_type}, week={week_num})...")
+            if not game_ids:
+                log.append(f"  No new completed games")
+            else:
+                log.append(f"  Found {len(game_ids)} new games")
         
-        for game_id in game_ids:
+        for game_id, game_info in zip(game_ids, game_details):
             try:
-                game_info = get_game_details(game_id)
-                
                 if not game_info or not game_info['away_team'] or not game_info['home_team']:
                     continue
                 
-                print(f"  OK: {game_info['away_team']['name']} @ {game_info['home_team']['name']} "
-                      f"({game_info['away_team']['score']}-{game_info['home_team']['score']})")
+                if verbose:
+                    log.append(f"  OK: {game_info['away_team']['name']} @ {game_info['home_team']['name']} "
+                               f"({game_info['away_team']['score']}-{game_info['home_team']['score']})")
                 
                 game_data = {
+                    'game_id': game_id,
                     'week': week_label,
                     'season_type': season_type.upper(),
                     'week_number': week_num,
@@ -471,13 +901,13 @@ def update_mode():
                 }
                 
                 new_games.append(game_data)
-                time.sleep(1.5)
                 
             except Exception as e:
-                print(f"    Error: {e}")
+                log.append(f"    Error: {e}")
                 continue
         
-        time.sleep(1)
+        if log:
+            sys.stdout.write('\n'.join(log) + '\n')
     
     if not new_games:
         print("\nNo new games found. Data is up to date!")
@@ -486,71 +916,19 @@ def update_mode():
     # append new games to existing file
     print(f"\n{len(new_games)} new games found. Appending to nflData.txt...")
     
-    with open('nflData.txt', 'a', encoding='utf-8') as f:
-        current_week = None
-        for game in new_games:
-            if game['week'] != current_week:
-                current_week = game['week']
-                f.write(f"\n{'=' * 100}\n")
-                f.write(f"{current_week}\n")
-                f.write(f"{'=' * 100}\n\n")
-            
-            away = game['away_team']
-            home = game['home_team']
-            away_stats = away.get('stats', {})
-            home_stats = home.get('stats', {})
-            
-            f.write(f"[{game['week']}] {away['name']} @ {home['name']} | "
-                   f"{away['score']}-{home['score']} | {game['status']}\n")
-            
-            # QB stats (if available)
-            if 'qb' in away:
-                qb = away['qb']
-                f.write(f"  AWAY QB ({qb['name']}): {qb['comp_att']} for {qb['yards']}yds, {qb['tds']}TD/{qb['ints']}INT, "
-                       f"{qb['ypa']} YPA, {qb['qb_rating']} RTG\n")
-            if 'qb' in home:
-                qb = home['qb']
-                f.write(f"  HOME QB ({qb['name']}): {qb['comp_att']} for {qb['yards']}yds, {qb['tds']}TD/{qb['ints']}INT, "
-                       f"{qb['ypa']} YPA, {qb['qb_rating']} RTG\n")
-            
-            # detailed stats with enhanced metrics
-            f.write(f"  AWAY ({away['name']}):\n")
-            f.write(f"    Total Yards: {away_stats.get('totalYards', '0')} | "
-                   f"Yards/Play: {away_stats.get('yardsPerPlay', '0')} | "
-                   f"Possession: {away_stats.get('possessionTime', '0:00')}\n")
-            f.write(f"    Passing: {away_stats.get('netPassingYards', '0')}yds ({away_stats.get('completionAttempts', '0-0')}) | "
-                   f"Rushing: {away_stats.get('rushingYards', '0')}yds ({away_stats.get('yardsPerRushAttempt', '0.0')} avg) | "
-                   f"1st Downs: {away_stats.get('firstDowns', '0')}\n")
-            f.write(f"    3rd Down: {away_stats.get('thirdDownEff', '0-0')} | "
-                   f"4th Down: {away_stats.get('fourthDownEff', '0-0')} | "
-                   f"Red Zone: {away_stats.get('redZoneAttempts', '0-0')}\n")
-            f.write(f"    Turnovers: {away_stats.get('turnovers', '0')} (INT: {away_stats.get('interceptions', '0')}, Fum: {away_stats.get('fumblesLost', '0')}) | "
-                   f"Sacks: {away_stats.get('sacksYardsLost', '0-0').split('-')[0] if '-' in away_stats.get('sacksYardsLost', '0') else '0'} | "
-                   f"Penalties: {away_stats.get('totalPenaltiesYards', '0-0')}\n")
-            
-            f.write(f"  HOME ({home['name']}):\n")
-            f.write(f"    Total Yards: {home_stats.get('totalYards', '0')} | "
-                   f"Yards/Play: {home_stats.get('yardsPerPlay', '0')} | "
-                   f"Possession: {home_stats.get('possessionTime', '0:00')}\n")
-            f.write(f"    Passing: {home_stats.get('netPassingYards', '0')}yds ({home_stats.get('completionAttempts', '0-0')}) | "
-                   f"Rushing: {home_stats.get('rushingYards', '0')}yds ({home_stats.get('yardsPerRushAttempt', '0.0')} avg) | "
-                   f"1st Downs: {home_stats.get('firstDowns', '0')}\n")
-            f.write(f"    3rd Down: {home_stats.get('thirdDownEff', '0-0')} | "
-                   f"4th Down: {home_stats.get('fourthDownEff', '0-0')} | "
-                   f"Red Zone: {home_stats.get('redZoneAttempts', '0-0')}\n")
-            f.write(f"    Turnovers: {home_stats.get('turnovers', '0')} (INT: {home_stats.get('interceptions', '0')}, Fum: {home_stats.get('fumblesLost', '0')}) | "
-                   f"Sacks: {home_stats.get('sacksYardsLost', '0-0').split('-')[0] if '-' in home_stats.get('sacksYardsLost', '0') else '0'} | "
-                   f"Penalties: {home_stats.get('totalPenaltiesYards', '0-0')}\n")
-            f.write("\n")
+    with open('nflData.txt', 'a', encoding='utf-8', buffering=WRITE_BUFFER_SIZE) as f:
+        _write_games(f, new_games)
+        _sync(f)
+    write_games_jsonl(new_games, 'a')
+    save_seen_game_ids(seen_ids.union(game['game_id'] for game in new_games))
     
     print(f"Update complete! Added {len(new_games)} games to nflData.txt")
 
 
 if __name__ == "__main__":
-    import sys
-    
-    # Check if user wants update mode
-    if len(sys.argv) > 1 and sys.argv[1] == '--update':
-        update_mode()
+    # --update: incremental mode; --quiet: skip the per-week / per-game progress lines
+    verbose = '--quiet' not in sys.argv[1:]
+    if '--update' in sys.argv[1:]:
+        update_mode(verbose)
     else:
-        main()
+        main(verbose)
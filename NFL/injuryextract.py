@@ -3,9 +3,102 @@ NFL Injury Data Extractor
 Fetches current injury reports from ESPN API
 """
 
+import os
 import requests
 import json
 from datetime import datetime
+from types import MappingProxyType
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# optional HTTP cache - repeat runs within the hour reuse the stored response and
+# stale entries are revalidated with ETag/If-None-Match instead of re-downloaded
+try:
+    import requests_cache
+    _SESSION = requests_cache.CachedSession(
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'espn_cache'),
+        backend='sqlite',
+        expire_after=3600,
+        cache_control=True,
+        stale_if_error=True
+    )
+    HTTP_CACHE_AVAILABLE = True
+except ImportError:
+    _SESSION = requests.Session()
+    HTTP_CACHE_AVAILABLE = False
+
+# keep-alive connection pool for the session, with transient errors retried with backoff
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=(429, 500, 502, 503, 504),
+                      respect_retry_after_header=True)
+))
+
+# optional faster JSON decoder for the injury report (stdlib json otherwise)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+# Position-based impact weights (when player is OUT/IR)
+# read-only so callers can't mutate the shared tables
+POSITION_WEIGHTS = MappingProxyType({
+    'QB': 10.0,      # Critical - most important position
+    'WR': 2.5,       # Key offensive weapons
+    'RB': 2.0,       # Important for offense
+    'TE': 2.0,       # Important for offense
+    'OL': 2.5,       # Critical for QB protection
+    'DE': 2.0,       # Key pass rushers
+    'CB': 2.0,       # Key coverage
+    'LB': 1.5,       # Solid contributors
+    'S': 1.5,        # Solid contributors
+    'DT': 1.5,       # Solid contributors
+    'UNKNOWN': 1.0   # Default for unknown positions
+})
+
+# Status multipliers (exact status first, then checked in order, first substring match wins)
+STATUS_MULTIPLIERS = MappingProxyType({
+    'out': 1.0,          # Definitely missing
+    'ir': 1.0,           # Season-ending
+    'injured reserve': 1.0,
+    'doubtful': 0.6,     # 75% chance of missing
+    'questionable': 0.2, # 50% chance, may be limited
+    'active': 0.0        # NOT injured! Playing normally
+})
+
+
+# statuses counted as "out" (exact match)
+OUT_STATUSES = frozenset({'out', 'ir', 'injured reserve'})
+
+# comment keywords for each position, checked in order - the first position with any
+# keyword in the comment wins (so QB beats everything, O-line only catches what's left)
+POSITION_KEYWORDS = (
+    # QB detection (most critical)
+    ('QB', ('quarterback', 'qb ', ' qb,', 'passing', 'threw for', 'completed')),
+    ('RB', ('running back', 'rb ', 'carried', 'rushing', 'carries for')),
+    ('WR', ('receiver', 'wr ', 'caught', 'receptions', 'targets', 'receiving')),
+    ('TE', ('tight end', 'te ')),
+    # Defensive positions
+    ('LB', ('linebacker', 'lb ', 'tackles')),
+    ('CB', ('cornerback', 'cb ', 'coverage', 'pass defense')),
+    ('S', ('safety', 'ss ', 'fs ')),
+    ('DE', ('defensive end', 'de ', 'edge', 'sacks')),
+    ('DT', ('defensive tackle', 'dt ')),
+    # O-line
+    ('OL', ('offensive line', 'ol ', 'guard', 'tackle', 'center'))
+)
+
+
+def decode_json(response):
+    """
+    decodes a JSON response body, with orjson when it's installed
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(response.content)
+    return response.json()
 
 
 def get_injury_data():
@@ -16,9 +109,10 @@ def get_injury_data():
     injury_url = "https://site.api.espn.com/apis/site/v2/sports/football/nfl/injuries"
     
     try:
-        response = requests.get(injury_url, timeout=10)
+        # (connect, read) - a dead host fails fast, a slow report still gets 10s
+        response = _SESSION.get(injury_url, timeout=(3, 10))
         response.raise_for_status()
-        data = response.json()
+        data = decode_json(response)
         
         injury_data = {}
         
@@ -54,40 +148,12 @@ def detect_position_from_name_and_comment(player_name, comment):
     """
     attempts to detect player position from name patterns and comments
     """
-    name_lower = player_name.lower()
     comment_lower = comment.lower()
     
-    # QB detection (most critical)
-    if any(word in comment_lower for word in ['quarterback', 'qb ', ' qb,', 'passing', 'threw for', 'completed']):
-        return 'QB'
-    
-    # RB detection
-    if any(word in comment_lower for word in ['running back', 'rb ', 'carried', 'rushing', 'carries for']):
-        return 'RB'
-    
-    # WR detection  
-    if any(word in comment_lower for word in ['receiver', 'wr ', 'caught', 'receptions', 'targets', 'receiving']):
-        return 'WR'
-    
-    # TE detection
-    if any(word in comment_lower for word in ['tight end', 'te ']):
-        return 'TE'
-    
-    # Defensive positions
-    if any(word in comment_lower for word in ['linebacker', 'lb ', 'tackles']):
-        return 'LB'
-    if any(word in comment_lower for word in ['cornerback', 'cb ', 'coverage', 'pass defense']):
-        return 'CB'
-    if any(word in comment_lower for word in ['safety', 'ss ', 'fs ']):
-        return 'S'
-    if any(word in comment_lower for word in ['defensive end', 'de ', 'edge', 'sacks']):
-        return 'DE'
-    if any(word in comment_lower for word in ['defensive tackle', 'dt ']):
-        return 'DT'
-    
-    # O-line
-    if any(word in comment_lower for word in ['offensive line', 'ol ', 'guard', 'tackle', 'center']):
-        return 'OL'
+    for position, keywords in POSITION_KEYWORDS:
+        for keyword in keywords:
+            if keyword in comment_lower:
+                return position
     
     return 'UNKNOWN'
 
@@ -108,57 +174,42 @@ def calculate_injury_impact(team_name, injury_data):
     
     team_injuries = injury_data[team_name]
     
-    # Position-based impact weights (when player is OUT/IR)
-    position_weights = {
-        'QB': 10.0,      # Critical - most important position
-        'WR': 2.5,       # Key offensive weapons
-        'RB': 2.0,       # Important for offense
-        'TE': 2.0,       # Important for offense
-        'OL': 2.5,       # Critical for QB protection
-        'DE': 2.0,       # Key pass rushers
-        'CB': 2.0,       # Key coverage
-        'LB': 1.5,       # Solid contributors
-        'S': 1.5,        # Solid contributors
-        'DT': 1.5,       # Solid contributors
-        'UNKNOWN': 1.0   # Default for unknown positions
-    }
-    
-    # Status multipliers
-    status_multipliers = {
-        'out': 1.0,          # Definitely missing
-        'ir': 1.0,           # Season-ending
-        'injured reserve': 1.0,
-        'doubtful': 0.6,     # 75% chance of missing
-        'questionable': 0.2, # 50% chance, may be limited
-        'active': 0.0        # NOT injured! Playing normally
-    }
-    
-    # categorize injuries by status (EXCLUDE ACTIVE PLAYERS)
-    actual_injuries = [i for i in team_injuries if i['status'].lower() != 'active']
-    out = [i for i in actual_injuries if i['status'].lower() in ['out', 'ir', 'injured reserve']]
-    doubtful = [i for i in actual_injuries if 'doubtful' in i['status'].lower()]
-    questionable = [i for i in actual_injuries if 'questionable' in i['status'].lower()]
-    
-    # calculate position-weighted impact score
+    # one pass: categorize by status (EXCLUDE ACTIVE PLAYERS) and
+    # calculate the position-weighted impact score
+    total_injuries = 0
+    out = 0
+    doubtful = 0
+    questionable = 0
     impact_score = 0
     key_injuries = []
     qb_injured = False
     
-    for injury in actual_injuries:
-        player = injury['player_name']
+    for injury in team_injuries:
         status = injury['status'].lower()
+        if status == 'active':
+            continue
+        
+        total_injuries += 1
+        if status in OUT_STATUSES:
+            out += 1
+        if 'doubtful' in status:
+            doubtful += 1
+        if 'questionable' in status:
+            questionable += 1
+        
+        player = injury['player_name']
         comment = injury.get('detail', '')
         
         # Detect position
         position = detect_position_from_name_and_comment(player, comment)
         
         # Get weights
-        pos_weight = position_weights.get(position, 1.0)
-        status_mult = 0.0
-        for key, mult in status_multipliers.items():
-            if key in status:
-                status_mult = mult
-                break
+        pos_weight = POSITION_WEIGHTS.get(position, 1.0)
+        # ESPN's plain statuses hit the table directly; compound ones like
+        # "Injured Reserve - Designated for Return" fall back to the ordered substring scan
+        status_mult = STATUS_MULTIPLIERS.get(status)
+        if status_mult is None:
+            status_mult = next((mult for key, mult in STATUS_MULTIPLIERS.items() if key in status), 0.0)
         
         # Calculate this player's impact
         player_impact = pos_weight * status_mult
@@ -173,10 +224,10 @@ def calculate_injury_impact(team_name, injury_data):
             key_injuries.append(f"{player} ({position}, {injury['status']})")
     
     return {
-        'total_injuries': len(actual_injuries),  # Only count real injuries, not active
-        'out': len(out),
-        'doubtful': len(doubtful),
-        'questionable': len(questionable),
+        'total_injuries': total_injuries,  # Only count real injuries, not active
+        'out': out,
+        'doubtful': doubtful,
+        'questionable': questionable,
         'key_injuries': len(key_injuries),
         'impact_score': impact_score,
         'injury_list': key_injuries,
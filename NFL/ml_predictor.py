@@ -3,6 +3,10 @@ NFL Game Predictor - Machine Learning Approach
 Uses XGBoost with matchup-level features and proper probability calibration
 """
 
+import glob
+import hashlib
+import os
+import joblib
 import numpy as np
 import pandas as pd
 from sklearn.model_selection import train_test_split, cross_val_score
@@ -17,7 +21,7 @@ except (ImportError, Exception):
     xgb = None
     XGBOOST_AVAILABLE = False
 
-from predictor import read_nfl_data, calculate_team_averages, classify_offensive_style
+from predictor import read_nfl_data, calculate_team_averages, classify_offensive_style, jit_kernel
 from injuryextract import get_injury_data, calculate_injury_impact
 
 # Import injury module
@@ -27,6 +31,67 @@ try:
 except ImportError:
     INJURIES_AVAILABLE = False
 
+# trained models are stored here, one file per training-data fingerprint; see load_or_train_model
+MODEL_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+# team -> (games list, games count, game-log form values); see team_game_form
+TEAM_FORM_CACHE = {}
+
+
+@jit_kernel
+def game_log_form(score_for, point_diff, won, recent_to_margins):
+    """
+    game-log features create_matchup_features needs for one team:
+    recent turnover margin, scoring std dev over the last 5 games, average win margin
+    and blowout rate - plain scalar loop so numba can compile it when installed
+    """
+    # Recent turnover margin (last 3 games)
+    recent_to_margin = recent_to_margins.sum() / max(recent_to_margins.shape[0], 1)
+    
+    # Sample standard deviation of the last 5 scores
+    n = score_for.shape[0]
+    last_scores = score_for[max(n - 5, 0):]
+    score_std = 0.0
+    if last_scores.shape[0] > 1:
+        mean = last_scores.mean()
+        score_std = np.sqrt(((last_scores - mean) ** 2).sum() / (last_scores.shape[0] - 1))
+    
+    # Win margin and blowouts (14+ points) over the team's wins
+    wins = 0
+    margin_total = 0.0
+    blowouts = 0
+    for k in range(n):
+        if won[k]:
+            wins += 1
+            margin_total += point_diff[k]
+            if point_diff[k] >= 14:
+                blowouts += 1
+    avg_win_margin = margin_total / wins if wins > 0 else 0.0
+    blowout_rate = blowouts / max(wins, 1)
+    
+    return recent_to_margin, score_std, avg_win_margin, blowout_rate
+
+
+def team_game_form(team, teams_data):
+    """
+    cached game_log_form for a team, rebuilt when its game list is replaced or grows
+    returns (recent turnover margin, score std dev, avg win margin, blowout rate)
+    """
+    games = teams_data.get(team, []) if teams_data else []
+    cached = TEAM_FORM_CACHE.get(team)
+    if cached is None or cached[0] is not games or cached[1] != len(games):
+        recent_games = [g for g in games if not g.get('preseason', False)][-3:]
+        form = game_log_form(
+            np.array([g['score_for'] for g in games], dtype=np.float64),
+            np.array([g['point_diff'] for g in games], dtype=np.float64),
+            np.array([g['result'] == 'W' for g in games], dtype=np.bool_),
+            np.array([g['off_stats'].get('sacks', 0) - g['off_stats'].get('turnovers', 0)
+                      for g in recent_games], dtype=np.float64)
+        )
+        cached = (games, len(games), tuple(float(v) for v in form))
+        TEAM_FORM_CACHE[team] = cached
+    return cached[2]
+
 
 def create_matchup_features(home_team, away_team, home_avg, away_avg, teams_data=None, injury_data=None):
     """
@@ -39,6 +104,10 @@ def create_matchup_features(home_team, away_team, home_avg, away_avg, teams_data
     home_games = teams_data.get(home_team, []) if teams_data else []
     away_games = teams_data.get(away_team, []) if teams_data else []
     
+    # game-log stats (recent turnovers, scoring variance, win margins) only depend on the team
+    home_recent_to_margin, home_score_std, home_avg_win_margin, home_blowouts = team_game_form(home_team, teams_data)
+    away_recent_to_margin, away_score_std, away_avg_win_margin, away_blowouts = team_game_form(away_team, teams_data)
+    
     # === OFFENSIVE VS DEFENSIVE MATCHUPS (ratios) ===
     # Research shows: Weight offense 1.6x, defense 1.0x
     
@@ -134,19 +203,6 @@ def create_matchup_features(home_team, away_team, home_avg, away_avg, teams_data
     
     # Recent turnover margin (last 3 games - higher priority)
     if home_games and away_games:
-        home_recent_games = [g for g in home_games if not g.get('preseason', False)][-3:]
-        away_recent_games = [g for g in away_games if not g.get('preseason', False)][-3:]
-        
-        home_recent_to_margin = sum(
-            g['off_stats'].get('sacks', 0) - g['off_stats'].get('turnovers', 0) 
-            for g in home_recent_games
-        ) / max(len(home_recent_games), 1)
-        
-        away_recent_to_margin = sum(
-            g['off_stats'].get('sacks', 0) - g['off_stats'].get('turnovers', 0) 
-            for g in away_recent_games
-        ) / max(len(away_recent_games), 1)
-        
         features['recent_turnover_margin_diff'] = home_recent_to_margin - away_recent_to_margin
     else:
         features['recent_turnover_margin_diff'] = 0
@@ -197,14 +253,7 @@ def create_matchup_features(home_team, away_team, home_avg, away_avg, teams_data
     features['points_per_drive_diff'] = home_pts_per_drive - away_pts_per_drive
     
     # === CONSISTENCY METRICS (Variance = Risk) ===
-    # Calculate standard deviation of recent performance
-    home_recent_scores = [g['score_for'] for g in home_games[-5:]] if home_games else [0]
-    away_recent_scores = [g['score_for'] for g in away_games[-5:]] if away_games else [0]
-    
-    import statistics
-    home_score_std = statistics.stdev(home_recent_scores) if len(home_recent_scores) > 1 else 0
-    away_score_std = statistics.stdev(away_recent_scores) if len(away_recent_scores) > 1 else 0
-    
+    # Standard deviation of recent performance (last 5 scores, see team_game_form)
     # Lower variance = more consistent = better for prediction
     features['home_consistency'] = 1 / (home_score_std + 5)  # Higher is better
     features['away_consistency'] = 1 / (away_score_std + 5)
@@ -220,18 +269,9 @@ def create_matchup_features(home_team, away_team, home_avg, away_avg, teams_data
     
     # === SCORING MARGIN DISTRIBUTION (Blowout vs Close) ===
     # Teams that win big vs teams that squeak by
-    home_wins = [g for g in home_games if g['result'] == 'W']
-    away_wins = [g for g in away_games if g['result'] == 'W']
-    
-    home_avg_win_margin = sum([g['point_diff'] for g in home_wins]) / len(home_wins) if home_wins else 0
-    away_avg_win_margin = sum([g['point_diff'] for g in away_wins]) / len(away_wins) if away_wins else 0
-    
     features['avg_win_margin_diff'] = home_avg_win_margin - away_avg_win_margin
     
     # Blowout ability (% of wins by 14+ points)
-    home_blowouts = sum([1 for g in home_wins if g['point_diff'] >= 14]) / max(len(home_wins), 1)
-    away_blowouts = sum([1 for g in away_wins if g['point_diff'] >= 14]) / max(len(away_wins), 1)
-    
     features['blowout_rate_diff'] = home_blowouts - away_blowouts
     
     # === PRIORITY 8: RECENT MOMENTUM (weighted 1.25x to capture evolving teams) ===
@@ -416,6 +456,53 @@ def train_model(X, y, feature_names):
     return calibrated_model, feature_importance
 
 
+def training_data_key(teams_data, injury_data=None):
+    """
+    fingerprint of the model's training inputs (game data + injury report)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr(sorted(teams_data.items())).encode('utf-8'))
+    if injury_data:
+        digest.update(repr(sorted(injury_data.items())).encode('utf-8'))
+    return digest.hexdigest()
+
+
+def load_or_train_model(teams_data, injury_data=None):
+    """
+    build_training_dataset + train_model, reusing the model saved by an earlier run
+    on identical data when there is one
+    returns (model, feature_names, feature_importance)
+    """
+    path = os.path.join(MODEL_CACHE_DIR, f'nfl_model_{training_data_key(teams_data, injury_data)}.joblib')
+    
+    if os.path.exists(path):
+        try:
+            model, feature_names, feature_importance = joblib.load(path)
+            print(f"Loaded cached model ({path})")
+            return model, feature_names, feature_importance
+        except Exception as e:
+            print(f"Could not load cached model ({e}), retraining")
+    
+    X, y, feature_names, game_info = build_training_dataset(teams_data, injury_data)
+    model, feature_importance = train_model(X, y, feature_names)
+    
+    # write to a temp file first so a concurrent run never loads a half-written model
+    os.makedirs(MODEL_CACHE_DIR, exist_ok=True)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    joblib.dump((model, feature_names, feature_importance), tmp_path)
+    os.replace(tmp_path, path)
+    
+    # only the newest model is ever loaded again, so the older ones are dropped
+    for stale_path in glob.glob(os.path.join(MODEL_CACHE_DIR, 'nfl_model_*.joblib')):
+        if stale_path != path:
+            try:
+                os.remove(stale_path)
+            except OSError:
+                pass
+    
+    return model, feature_names, feature_importance
+
+
 def detect_qb_change(team, teams_data):
     """
     Detects if a team has recently changed QBs by comparing recent games
@@ -549,38 +636,18 @@ def apply_probability_calibration(home_win_prob, uncertainty_adjustment, qb_chan
     return calibrated_prob
 
 
-def predict_game_ml(home_team, away_team, teams_data, model, feature_names, injury_data=None):
+def calibrate_ml_prediction(home_team, away_team, home_avg, away_avg, features_dict, raw_home_win_prob,
+                            teams_data, verbose=True):
     """
-    Predicts game outcome using trained ML model with improved calibration
+    Turns the model's raw home win probability into the final prediction
+    (QB change and uncertainty adjustments); returns the prediction result dict
     """
-    home_avg = calculate_team_averages(home_team, teams_data, regular_only=True)
-    away_avg = calculate_team_averages(away_team, teams_data, regular_only=True)
-    
-    if not home_avg or not away_avg:
-        print("Insufficient data for one or both teams")
-        return None
-    
-    # Store team names for QB detection
-    if 'team_name' not in home_avg:
-        home_avg['team_name'] = home_team
-    if 'team_name' not in away_avg:
-        away_avg['team_name'] = away_team
-    
-    # Create features for this matchup
-    features_dict = create_matchup_features(home_team, away_team, home_avg, away_avg, teams_data, injury_data)
-    
-    # Convert to array in same order as training
-    X = np.array([features_dict[fname] for fname in feature_names]).reshape(1, -1)
-    
-    # Get raw prediction from model
-    raw_home_win_prob = model.predict_proba(X)[0, 1]
-    
     # Detect QB changes (adds uncertainty)
     home_qb_change = detect_qb_change(home_team, teams_data)
     away_qb_change = detect_qb_change(away_team, teams_data)
     qb_change_adjustment = (home_qb_change + away_qb_change) / 2
     
-    if home_qb_change > 0 or away_qb_change > 0:
+    if verbose and (home_qb_change > 0 or away_qb_change > 0):
         print(f"\n⚠️  QB CHANGE DETECTED:")
         if home_qb_change > 0:
             print(f"   {home_team} has changed QBs recently (uncertainty +{home_qb_change*100:.0f}%)")
@@ -590,13 +657,104 @@ def predict_game_ml(home_team, away_team, teams_data, model, feature_names, inju
     # Calculate uncertainty adjustment
     uncertainty_adj = calculate_uncertainty_adjustment(home_avg, away_avg, features_dict, teams_data)
     
-    if uncertainty_adj > 0:
+    if verbose and uncertainty_adj > 0:
         print(f"\n📊 UNCERTAINTY FACTORS: {uncertainty_adj*100:.0f}% adjustment (team volatility/upset potential)")
     
     # Apply calibration
     home_win_prob = apply_probability_calibration(raw_home_win_prob, uncertainty_adj, qb_change_adjustment)
     away_win_prob = 1 - home_win_prob
     
+    return {
+        'home_win_prob': home_win_prob,
+        'away_win_prob': away_win_prob,
+        'predicted_winner': home_team if home_win_prob > 0.5 else away_team,
+        'features': features_dict
+    }
+
+
+def predict_games_ml_batch(home_teams, away_teams, teams_data, model, feature_names, injury_data=None,
+                           team_averages=None):
+    """
+    Predicts several games with a single model.predict_proba call
+    team_averages: optional {team: averages} to use instead of recomputing them
+    returns one result dict per game (as predict_game_ml), None where a team lacks data
+    """
+    results = [None] * len(home_teams)
+    matchups = []
+    rows = []
+    
+    for idx, (home_team, away_team) in enumerate(zip(home_teams, away_teams)):
+        if team_averages is not None:
+            home_avg = team_averages.get(home_team)
+            away_avg = team_averages.get(away_team)
+        else:
+            home_avg = calculate_team_averages(home_team, teams_data, regular_only=True)
+            away_avg = calculate_team_averages(away_team, teams_data, regular_only=True)
+        
+        if not home_avg or not away_avg:
+            continue
+        
+        # team names for QB detection (shallow copies - the averages may be shared)
+        home_avg = {**home_avg, 'team_name': home_team}
+        away_avg = {**away_avg, 'team_name': away_team}
+        
+        features_dict = create_matchup_features(home_team, away_team, home_avg, away_avg, teams_data, injury_data)
+        matchups.append((idx, home_team, away_team, home_avg, away_avg, features_dict))
+        rows.append([features_dict[fname] for fname in feature_names])
+    
+    if not rows:
+        return results
+    
+    # one (games x features) matrix, one model call
+    raw_home_win_probs = model.predict_proba(np.array(rows))[:, 1]
+    
+    for (idx, home_team, away_team, home_avg, away_avg, features_dict), raw_home_win_prob in zip(matchups, raw_home_win_probs):
+        results[idx] = calibrate_ml_prediction(home_team, away_team, home_avg, away_avg, features_dict,
+                                               raw_home_win_prob, teams_data, verbose=False)
+    
+    return results
+
+
+def predict_game_ml(home_team, away_team, teams_data, model, feature_names, injury_data=None, verbose=True,
+                    home_avg=None, away_avg=None):
+    """
+    Predicts game outcome using trained ML model with improved calibration
+    verbose: print the full matchup report (batch runs turn this off)
+    home_avg/away_avg: precomputed team averages to use instead of recomputing them
+    """
+    if home_avg is None:
+        home_avg = calculate_team_averages(home_team, teams_data, regular_only=True)
+    if away_avg is None:
+        away_avg = calculate_team_averages(away_team, teams_data, regular_only=True)
+    
+    if not home_avg or not away_avg:
+        if verbose:
+            print("Insufficient data for one or both teams")
+        return None
+    
+    # Store team names for QB detection (on a shallow copy - passed-in averages may be shared)
+    if 'team_name' not in home_avg:
+        home_avg = {**home_avg, 'team_name': home_team}
+    if 'team_name' not in away_avg:
+        away_avg = {**away_avg, 'team_name': away_team}
+    
+    # Create features for this matchup
+    features_dict = create_matchup_features(home_team, away_team, home_avg, away_avg, teams_data, injury_data)
+    
+    # Convert to array in same order as training
+    X = np.array([features_dict[fname] for fname in feature_names]).reshape(1, -1)
+    
+    # Get raw prediction from model
+    raw_home_win_prob = model.predict_proba(X)[0, 1]
+    
+    result = calibrate_ml_prediction(home_team, away_team, home_avg, away_avg, features_dict,
+                                     raw_home_win_prob, teams_data, verbose)
+    home_win_prob = result['home_win_prob']
+    away_win_prob = result['away_win_prob']
+    
+    if not verbose:
+        return result
+    
     # Display team styles
     home_style = classify_offensive_style(home_avg)
     away_style = classify_offensive_style(away_avg)
@@ -676,12 +834,7 @@ def predict_game_ml(home_team, away_team, teams_data, model, feature_names, inju
     
     print(f"{'=' * 100}\n")
     
-    return {
-        'home_win_prob': home_win_prob,
-        'away_win_prob': away_win_prob,
-        'predicted_winner': home_team if home_win_prob > 0.5 else away_team,
-        'features': features_dict
-    }
+    return result
 
 
 def main():
@@ -3,6 +3,33 @@ NFL Game Predictor - Advanced Analysis
 Analyzes detailed game stats to predict outcomes with contextual matchup analysis
 """
 
+import bisect
+import functools
+import io
+import mmap
+import os
+import re
+import statistics
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+# optional JIT for the per-game numeric kernels (plain python when numba isn't installed)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def jit_kernel(func):
+    """
+    compiles func with numba (cached on disk) when available, otherwise returns it unchanged
+    """
+    return njit(cache=True)(func) if NUMBA_AVAILABLE else func
+
+
 # Import injury data functions
 try:
     from injuryextract import get_injury_data, calculate_injury_impact
@@ -11,415 +38,351 @@ except ImportError:
     INJURIES_AVAILABLE = False
     print("WARNING: Injury data module not available")
 
+# injury impact gap -> (points to healthier team, label); gaps at or below
+# the first threshold earn nothing, above the last one earn the max
+INJURY_DIFF_THRESHOLDS = (3.0, 5.0, 10.0)
+INJURY_DIFF_RESULTS = (
+    (0.0, None),
+    (1.0, "more injured"),
+    (2.0, "dealing with major injuries"),
+    (3.0, "significantly injury-depleted"),
+)
+
+# matchup ratio ladders for advanced_prediction, resolved by binary search in score_ladder:
+#   value strictly above up_thresholds[i] (highest one wins) -> up_points[i] to the team
+#   value strictly below down_thresholds[i] (lowest one wins) -> down_points to the opponent
+ScoreLadder = namedtuple(
+    'ScoreLadder',
+    ['up_thresholds', 'up_points', 'up_messages', 'down_thresholds', 'down_points', 'down_messages'],
+    defaults=((), (), ())
+)
+
+EFFICIENCY_LADDER = ScoreLadder(
+    (1.0, 1.1, 1.2), (1.5, 2.5, 3.5),
+    ("    >> Slight advantage for {team} (+{points})",
+     "    >> Strong advantage for {team} (+{points})",
+     "    >> Dominant advantage for {team} (+{points})"),
+    (0.85, 0.95), (2.0, 1.0),
+    ("    >> {opponent} defense dominates (+{points} to {opponent})",
+     "    >> {opponent} defense has advantage (+{points} to {opponent})")
+)
+RUN_GAME_LADDER = ScoreLadder(
+    (1.0, 1.1, 1.3), (0.75, 1.5, 2.5),
+    ("    >> Slight run game advantage for {team} (+{points})",
+     "    >> Moderate run game advantage for {team} (+{points})",
+     "    >> Strong run game advantage for {team} (+{points})")
+)
+PASS_GAME_LADDER = ScoreLadder(
+    (1.0, 1.1, 1.3), (0.75, 1.5, 2.5),
+    ("    >> Slight pass game advantage for {team} (+{points})",
+     "    >> Moderate pass game advantage for {team} (+{points})",
+     "    >> Strong pass game advantage for {team} (+{points})")
+)
+SCORING_LADDER = ScoreLadder(
+    (1.15, 1.25), (1.5, 2.5),
+    ("    >> {team} likely to score well (+{points})",
+     "    >> {team} likely to score heavily (+{points})")
+)
+
+# home field advantage by home/away win-rate split (home_advantage); splits between
+# the down and up rungs get HFA_NEUTRAL. messages also take home_rate / away_rate
+HFA_LADDER = ScoreLadder(
+    (0.05, 0.15, 0.25), (2.0, 2.5, 3.0),
+    ("\nHome Field Advantage: {team} has moderate home advantage (+{points})\n"
+     "  ({home_rate:.1%} home vs {away_rate:.1%} away)",
+     "\nHome Field Advantage: {team} has STRONG home advantage (+{points})\n"
+     "  ({home_rate:.1%} home vs {away_rate:.1%} away)",
+     "\nHome Field Advantage: {team} has DOMINANT home advantage (+{points})\n"
+     "  ({home_rate:.1%} home vs {away_rate:.1%} away)"),
+    (-0.10,), (0.5,),
+    ("\nHome Field Advantage: {team} minimal advantage (+{points})\n"
+     "  WARNING: Team performs worse at home ({home_rate:.1%} home vs {away_rate:.1%} away)",)
+)
+HFA_NEUTRAL = (
+    1.5,
+    "\nHome Field Advantage: {team} slight advantage (+{points})\n"
+    "  ({home_rate:.1%} home vs {away_rate:.1%} away)"
+)
+
+# per-game stat keys pulled into columns by calculate_team_averages (order matters)
+OFFENSE_STAT_KEYS = (
+    'yardsPerPlay', 'totalYards', 'thirdDownRate', 'fourthDownRate', 'redZoneRate',
+    'turnovers', 'interceptions', 'fumbles', 'rushingYards', 'rushingAvg',
+    'passingYards', 'completionRate', 'sacks', 'penalties'
+)
+DEFENSE_STAT_KEYS = (
+    'totalYards', 'yardsPerPlay', 'rushingYards', 'rushingAvg', 'passingYards',
+    'completionRate', 'sacks', 'redZoneRate', 'thirdDownRate', 'interceptions'
+)
+
+# whole-number stats fit exactly in int16; rates and averages stay float64 so the
+# weighted averages (and every threshold downstream) come out unchanged
+COUNT_STAT_KEYS = frozenset((
+    'totalYards', 'turnovers', 'interceptions', 'fumbles', 'rushingYards',
+    'passingYards', 'sacks'
+))
+
+# column layout of the per-team game table built by build_game_table
+GAME_DTYPE = np.dtype(
+    [('score_for', 'i2'), ('score_against', 'i2'), ('win', '?'), ('home', '?'),
+     ('epa_ypp', 'f8')]  # yards/play with the 5.5 default the EPA proxy uses
+    + [('off_' + k, 'i2' if k in COUNT_STAT_KEYS else 'f8') for k in OFFENSE_STAT_KEYS]
+    + [('def_' + k, 'i2' if k in COUNT_STAT_KEYS else 'f8') for k in DEFENSE_STAT_KEYS]
+)
+
+# "AWAY QB (Name): 17/34 for 204yds, 1TD/3INT, 6.0 YPA, 41.8 RTG" (rating optional)
+QB_LINE_RE = re.compile(
+    r'QB \(.*\):\s*(.*?)\s*for\s*(-?\d+)\s*yds,\s*(\d+)\s*TD\s*/\s*(\d+)\s*INT,'
+    r'\s*(-?[\d.]+)\s*YPA(?:,\s*(-?[\d.]+)\s*RTG)?'
+)
+
+# every line read_nfl_data cares about, as one alternation (matched in MULTILINE mode)
+# bytes pattern so it can scan the memory-mapped file without decoding it first
+NFL_DATA_RE = re.compile(
+    rb'^[ \t]*(?:'
+    rb'(?P<week>(?:PRESEASON|REGULAR)_WEEK[^\[\n]*)'
+    rb'|\[[^\]\n]*\][ \t]*(?P<game>(?P<away>[^@|\n]+?)[ \t]*@[ \t]*(?P<home>[^@|\n]+?)[ \t]*\|'
+    rb'[ \t]*(?P<away_score>\d+)[ \t]*-[ \t]*(?P<home_score>\d+))'
+    rb'|(?P<qb>(?P<qb_side>AWAY|HOME) QB .*)'
+    rb'|(?P<team>(?P<team_side>AWAY|HOME) \(.*\):)'
+    rb'|(?P<stats>(?:Total Yards|Passing|3rd Down|4th Down|Turnovers):.*)'
+    rb')',
+    re.MULTILINE
+)
+
+# "Label: value" pairs of a "|"-separated team stat line
+STAT_FIELD_RE = re.compile(r'\s*([^:|]+?):\s*([^|]*?)\s*(?:\||$)')
+
+# stat line label -> (stat key, parse_stat type) for fields that need no extra handling
+SIMPLE_STAT_FIELDS = {
+    'Total Yards': ('totalYards', 'int'),
+    'Yards/Play': ('yardsPerPlay', 'float'),
+    'Possession': ('possession', 'time'),
+    '1st Downs': ('firstDowns', 'int'),
+    '3rd Down': ('thirdDownRate', 'ratio'),
+    '4th Down': ('fourthDownRate', 'ratio'),
+    'Red Zone': ('redZoneRate', 'ratio'),
+    'Sacks': ('sacks', 'int'),
+    'Penalties': ('penalties', 'ratio')
+}
+
+# NFL exponent for pythagorean expectation: PF^x / (PF^x + PA^x)
+PYTHAGOREAN_EXPONENT = 2.37
+
+# nflData.txt path -> ((mtime_ns, size), teams_data); see read_nfl_data
+NFL_DATA_CACHE = {}
+
+# (team, regular_only) -> (games list, games count, averages); see calculate_team_averages
+TEAM_AVERAGES_CACHE = {}
+
+# team -> (injury_data it was computed from, impact); see get_injury_impact
+INJURY_IMPACT_CACHE = {}
+
+# team names -> (per-team (games list, games count) sources, LeagueTable); see league_table
+LEAGUE_TABLE_CACHE = {}
+
 
 def parse_stat(stat_str, stat_type='int'):
     """
     safely parse stat string to number
     """
+    # most stats have no thousands separator, so skip the copy unless needed
+    if ',' in stat_str:
+        stat_str = stat_str.replace(',', '')
     try:
         if stat_type == 'int':
-            return int(stat_str.replace(',', ''))
+            return int(stat_str)
         elif stat_type == 'float':
-            return float(stat_str.replace(',', ''))
+            return float(stat_str)
         elif stat_type == 'time':
             # parse time like "30:15" to minutes
-            parts = stat_str.split(':')
-            return int(parts[0]) + int(parts[1]) / 60.0
+            minutes, _, seconds = stat_str.partition(':')
+            return int(minutes) + int(seconds) / 60.0
         elif stat_type == 'ratio':
             # parse like "5-12" to success rate
-            parts = stat_str.split('-')
-            if len(parts) == 2 and int(parts[1]) > 0:
-                return int(parts[0]) / int(parts[1])
+            made, sep, attempts = stat_str.partition('-')
+            if sep and '-' not in attempts and int(attempts) > 0:
+                return int(made) / int(attempts)
             return 0.0
         elif stat_type == 'completion':
             # parse like "15/23" to completion percentage
-            parts = stat_str.split('/')
-            if len(parts) == 2 and int(parts[1]) > 0:
-                return int(parts[0]) / int(parts[1])
+            completions, sep, attempts = stat_str.partition('/')
+            if sep and '/' not in attempts and int(attempts) > 0:
+                return int(completions) / int(attempts)
             return 0.0
-    except:
+    except ValueError:
         return 0 if stat_type not in ['ratio', 'completion'] else 0.0
 
 
-def read_nfl_data():
+def parse_qb_line(line):
     """
-    reads nflData.txt with detailed stats and parses into structured format
+    parses a "QB (Name): 17/34 for 204yds, 1TD/3INT, 6.0 YPA, 41.8 RTG" line
+    returns {} if the line doesn't match
+    """
+    match = QB_LINE_RE.search(line)
+    if not match:
+        return {}
+    comp_att, yards, tds, ints, ypa, rating = match.groups()
+    return {
+        'comp_att': comp_att,
+        'yards': int(yards),
+        'tds': int(tds),
+        'ints': int(ints),
+        'ypa': float(ypa),
+        'rating': float(rating) if rating else 0.0
+    }
+
+
+def parse_stat_line(line, stats):
+    """
+    parses one team stat line (yards, passing/rushing, efficiency or
+    turnovers/sacks/penalties) into stats
     """
-    teams_data = {}
+    # one regex pass pulls every "Label: value" pair out of the line
+    for label, value in STAT_FIELD_RE.findall(line):
+        if label in SIMPLE_STAT_FIELDS:
+            key, stat_type = SIMPLE_STAT_FIELDS[label]
+            stats[key] = parse_stat(value, stat_type)
+        elif label == 'Passing':
+            # "198yds (17/34)" -> passingYards=198, completion=17/34
+            yds_part, paren, comp_part = value.partition('(')
+            stats['passingYards'] = parse_stat(yds_part.replace('yds', '').strip())
+            if paren:
+                stats['completionRate'] = parse_stat(comp_part.replace(')', '').strip(), 'completion')
+        elif label == 'Rushing':
+            # "140yds (7.8 avg)" -> rushingYards=140, rushAvg=7.8
+            yds_part, paren, avg_part = value.partition('(')
+            stats['rushingYards'] = parse_stat(yds_part.replace('yds', '').strip())
+            if paren:
+                stats['rushingAvg'] = parse_stat(avg_part.replace('avg', '').replace(')', '').strip(), 'float')
+        elif label == 'Turnovers':
+            # "3 (INT: 2, Fum: 1)" -> turnovers=3
+            # the INT/Fum breakdown has never been stored in off_stats and the
+            # model thresholds were tuned without it, so it's left out here too
+            stats['turnovers'] = parse_stat(value.partition('(')[0].strip())
+
+
+def add_game_records(teams_data, away_team, home_team, away_score, home_score, is_preseason,
+                     away_stats, home_stats, away_qb_stats, home_qb_stats):
+    """
+    appends the winner's and loser's game records to teams_data (ties are skipped)
+    both records point at the same stats dicts - one side's offense is the other's defense
+    """
+    if away_score == home_score:
+        return
     
-    try:
-        with open('nflData.txt', 'r', encoding='utf-8') as f:
-            lines = f.readlines()
+    away_won = away_score > home_score
+    point_diff = abs(away_score - home_score)
+    
+    away_record = {
+        'opponent': home_team,
+        'location': 'away',
+        'result': 'W' if away_won else 'L',
+        'score_for': away_score,
+        'score_against': home_score,
+        'point_diff': point_diff,
+        'preseason': is_preseason,
+        'off_stats': away_stats,
+        'def_stats': home_stats,  # opponent's offense = our defense faced
+        'qb_stats': away_qb_stats  # ACTUAL QB stats
+    }
+    home_record = {
+        'opponent': away_team,
+        'location': 'home',
+        'result': 'L' if away_won else 'W',
+        'score_for': home_score,
+        'score_against': away_score,
+        'point_diff': point_diff,
+        'preseason': is_preseason,
+        'off_stats': home_stats,
+        'def_stats': away_stats,
+        'qb_stats': home_qb_stats  # ACTUAL QB stats
+    }
+    
+    # winner first, so teams_data keys keep the order they were always first seen in
+    if away_won:
+        teams_data.setdefault(away_team, []).append(away_record)
+        teams_data.setdefault(home_team, []).append(home_record)
+    else:
+        teams_data.setdefault(home_team, []).append(home_record)
+        teams_data.setdefault(away_team, []).append(away_record)
+
+
+def parse_nfl_data(data, teams_data):
+    """
+    parses nflData.txt contents (bytes or a memory map) into teams_data
+    """
+    is_preseason = False
+    game_sides = None  # {b'AWAY': (stats, qb_stats), b'HOME': (...)} for the current game
+    side_stats = None  # stats dict the next stat lines belong to
+    
+    # one regex pass over the whole file; each match is a week header, game line,
+    # QB line, team header or stat line and just updates the current game
+    for match in NFL_DATA_RE.finditer(data):
+        kind = match.lastgroup
         
-        i = 0
-        current_week = None
-        is_preseason = False
+        if kind == 'week':
+            is_preseason = b'PRESEASON' in match.group('week')
+            game_sides = side_stats = None
         
-        while i < len(lines):
-            line = lines[i].strip()
-            
-            # detect week header (lines that contain WEEK but not brackets)
-            if ('PRESEASON_WEEK' in line or 'REGULAR_WEEK' in line) and '[' not in line:
-                current_week = line
-                is_preseason = 'PRESEASON' in line
-                i += 1
-                continue
-            
-            # parse game line
-            if line.startswith('[') and '@' in line and '|' in line:
-                try:
-                    # extract basic game info
-                    week_part = line[line.find('[')+1:line.find(']')]
-                    game_part = line[line.find(']')+1:].strip()
-                    teams_part = game_part.split('|')[0].strip()
-                    scores_part = game_part.split('|')[1].strip()
-                    
-                    away_team, home_team = teams_part.split('@')
-                    away_team = away_team.strip()
-                    home_team = home_team.strip()
-                    
-                    away_score, home_score = scores_part.split('-')
-                    away_score = int(away_score.strip())
-                    home_score = int(home_score.strip())
-                    
-                    # parse detailed stats from next lines
-                    away_stats = {}
-                    home_stats = {}
-                    away_qb_stats = {}
-                    home_qb_stats = {}
-                    
-                    # Check for QB stats (new format)
-                    peek_idx = i + 1
-                    if peek_idx < len(lines) and 'AWAY QB' in lines[peek_idx]:
-                        # Parse AWAY QB line: "  AWAY QB (Name): 17/34 for 204yds, 1TD/3INT, 6.0 YPA, 41.8 RTG"
-                        qb_line = lines[peek_idx].strip()
-                        try:
-                            qb_name = qb_line.split('(')[1].split(')')[0]
-                            qb_data = qb_line.split('):')[1].strip()
-                            parts = qb_data.split(',')
-                            
-                            # comp/att for yards
-                            comp_att = parts[0].split('for')[0].strip()
-                            yards = parts[0].split('for')[1].replace('yds', '').strip()
-                            
-                            # TDs/INTs
-                            td_int = parts[1].strip().split('/')
-                            tds = td_int[0].replace('TD', '').strip()
-                            ints = td_int[1].replace('INT', '').strip()
-                            
-                            # YPA
-                            ypa = parts[2].replace('YPA', '').strip()
-                            
-                            # QB Rating
-                            rating = parts[3].replace('RTG', '').strip() if len(parts) > 3 else '0.0'
-                            
-                            away_qb_stats = {
-                                'comp_att': comp_att,
-                                'yards': int(yards),
-                                'tds': int(tds),
-                                'ints': int(ints),
-                                'ypa': float(ypa),
-                                'rating': float(rating)
-                            }
-                        except:
-                            pass
-                        i += 1
-                    
-                    if peek_idx + 1 < len(lines) and 'HOME QB' in lines[peek_idx + 1]:
-                        # Parse HOME QB line
-                        qb_line = lines[peek_idx + 1].strip()
-                        try:
-                            qb_name = qb_line.split('(')[1].split(')')[0]
-                            qb_data = qb_line.split('):')[1].strip()
-                            parts = qb_data.split(',')
-                            
-                            # comp/att for yards
-                            comp_att = parts[0].split('for')[0].strip()
-                            yards = parts[0].split('for')[1].replace('yds', '').strip()
-                            
-                            # TDs/INTs
-                            td_int = parts[1].strip().split('/')
-                            tds = td_int[0].replace('TD', '').strip()
-                            ints = td_int[1].replace('INT', '').strip()
-                            
-                            # YPA
-                            ypa = parts[2].replace('YPA', '').strip()
-                            
-                            # QB Rating
-                            rating = parts[3].replace('RTG', '').strip() if len(parts) > 3 else '0.0'
-                            
-                            home_qb_stats = {
-                                'comp_att': comp_att,
-                                'yards': int(yards),
-                                'tds': int(tds),
-                                'ints': int(ints),
-                                'ypa': float(ypa),
-                                'rating': float(rating)
-                            }
-                        except:
-                            pass
-                        i += 1
-                    
-                    # look ahead for AWAY stats (now 4 lines instead of 3)
-                    if i + 1 < len(lines) and 'AWAY' in lines[i + 1]:
-                        i += 2  # skip "AWAY (team):" line
-                        
-                        # Line 1: parse away yards line
-                        if i < len(lines):
-                            stats_line = lines[i].strip()
-                            if 'Total Yards:' in stats_line:
-                                parts = stats_line.split('|')
-                                for part in parts:
-                                    if 'Total Yards:' in part:
-                                        away_stats['totalYards'] = parse_stat(part.split(':')[1].strip())
-                                    elif 'Yards/Play:' in part:
-                                        away_stats['yardsPerPlay'] = parse_stat(part.split(':')[1].strip(), 'float')
-                                    elif 'Possession:' in part:
-                                        away_stats['possession'] = parse_stat(part.split(':')[1].strip(), 'time')
-                            i += 1
-                        
-                        # Line 2: parse away passing/rushing line (with completion % and rush avg)
-                        if i < len(lines):
-                            stats_line = lines[i].strip()
-                            if 'Passing:' in stats_line:
-                                parts = stats_line.split('|')
-                                for part in parts:
-                                    if 'Passing:' in part:
-                                        # Extract "198yds (17/34)" -> passingYards=198, completion=17/34
-                                        pass_data = part.split(':')[1].strip()
-                                        if '(' in pass_data:
-                                            yds_part = pass_data.split('(')[0].replace('yds', '').strip()
-                                            comp_part = pass_data.split('(')[1].replace(')', '').strip()
-                                            away_stats['passingYards'] = parse_stat(yds_part)
-                                            away_stats['completionRate'] = parse_stat(comp_part, 'completion')
-                                        else:
-                                            away_stats['passingYards'] = parse_stat(pass_data.replace('yds', '').strip())
-                                    elif 'Rushing:' in part:
-                                        # Extract "140yds (7.8 avg)" -> rushingYards=140, rushAvg=7.8
-                                        rush_data = part.split(':')[1].strip()
-                                        if '(' in rush_data:
-                                            yds_part = rush_data.split('(')[0].replace('yds', '').strip()
-                                            avg_part = rush_data.split('(')[1].replace('avg', '').replace(')', '').strip()
-                                            away_stats['rushingYards'] = parse_stat(yds_part)
-                                            away_stats['rushingAvg'] = parse_stat(avg_part, 'float')
-                                        else:
-                                            away_stats['rushingYards'] = parse_stat(rush_data.replace('yds', '').strip())
-                                    elif '1st Downs:' in part:
-                                        away_stats['firstDowns'] = parse_stat(part.split(':')[1].strip())
-                            i += 1
-                        
-                        # Line 3: parse away efficiency line (3rd down, 4th down, red zone)
-                        if i < len(lines):
-                            stats_line = lines[i].strip()
-                            if '3rd Down:' in stats_line or '4th Down:' in stats_line:
-                                parts = stats_line.split('|')
-                                for part in parts:
-                                    if '3rd Down:' in part:
-                                        away_stats['thirdDownRate'] = parse_stat(part.split(':')[1].strip(), 'ratio')
-                                    elif '4th Down:' in part:
-                                        away_stats['fourthDownRate'] = parse_stat(part.split(':')[1].strip(), 'ratio')
-                                    elif 'Red Zone:' in part:
-                                        away_stats['redZoneRate'] = parse_stat(part.split(':')[1].strip(), 'ratio')
-                            i += 1
-                        
-                        # Line 4: parse turnovers, sacks, penalties
-                        if i < len(lines):
-                            stats_line = lines[i].strip()
-                            if 'Turnovers:' in stats_line:
-                                parts = stats_line.split('|')
-                                for part in parts:
-                                    if 'Turnovers:' in part:
-                                        # Extract "3 (INT: 2, Fum: 1)" -> turnovers=3, ints=2, fumbles=1
-                                        to_data = part.split(':')[1].strip()
-                                        if '(' in to_data:
-                                            total_to = to_data.split('(')[0].strip()
-                                            away_stats['turnovers'] = parse_stat(total_to)
-                                            # Parse INT and Fum
-                                            detail = to_data.split('(')[1].replace(')', '')
-                                            if 'INT:' in detail:
-                                                int_val = detail.split('INT:')[1].split(',')[0].strip()
-                                                away_stats['interceptions'] = parse_stat(int_val)
-                                            if 'Fum:' in detail:
-                                                fum_val = detail.split('Fum:')[1].strip()
-                                                away_stats['fumbles'] = parse_stat(fum_val)
-                                        else:
-                                            away_stats['turnovers'] = parse_stat(to_data)
-                                    elif 'Sacks:' in part and 'Sacks-' not in part:
-                                        away_stats['sacks'] = parse_stat(part.split(':')[1].strip())
-                                    elif 'Penalties:' in part:
-                                        away_stats['penalties'] = parse_stat(part.split(':')[1].strip(), 'ratio')
-                            i += 1
-                    
-                    # look ahead for HOME stats (now 4 lines instead of 3)
-                    if i < len(lines) and 'HOME' in lines[i]:
-                        i += 1  # skip "HOME (team):" line
-                        
-                        # Line 1: parse home yards line
-                        if i < len(lines):
-                            stats_line = lines[i].strip()
-                            if 'Total Yards:' in stats_line:
-                                parts = stats_line.split('|')
-                                for part in parts:
-                                    if 'Total Yards:' in part:
-                                        home_stats['totalYards'] = parse_stat(part.split(':')[1].strip())
-                                    elif 'Yards/Play:' in part:
-                                        home_stats['yardsPerPlay'] = parse_stat(part.split(':')[1].strip(), 'float')
-                                    elif 'Possession:' in part:
-                                        home_stats['possession'] = parse_stat(part.split(':')[1].strip(), 'time')
-                            i += 1
-                        
-                        # Line 2: parse home passing/rushing line (with completion % and rush avg)
-                        if i < len(lines):
-                            stats_line = lines[i].strip()
-                            if 'Passing:' in stats_line:
-                                parts = stats_line.split('|')
-                                for part in parts:
-                                    if 'Passing:' in part:
-                                        # Extract "198yds (17/34)" -> passingYards=198, completion=17/34
-                                        pass_data = part.split(':')[1].strip()
-                                        if '(' in pass_data:
-                                            yds_part = pass_data.split('(')[0].replace('yds', '').strip()
-                                            comp_part = pass_data.split('(')[1].replace(')', '').strip()
-                                            home_stats['passingYards'] = parse_stat(yds_part)
-                                            home_stats['completionRate'] = parse_stat(comp_part, 'completion')
-                                        else:
-                                            home_stats['passingYards'] = parse_stat(pass_data.replace('yds', '').strip())
-                                    elif 'Rushing:' in part:
-                                        # Extract "140yds (7.8 avg)" -> rushingYards=140, rushAvg=7.8
-                                        rush_data = part.split(':')[1].strip()
-                                        if '(' in rush_data:
-                                            yds_part = rush_data.split('(')[0].replace('yds', '').strip()
-                                            avg_part = rush_data.split('(')[1].replace('avg', '').replace(')', '').strip()
-                                            home_stats['rushingYards'] = parse_stat(yds_part)
-                                            home_stats['rushingAvg'] = parse_stat(avg_part, 'float')
-                                        else:
-                                            home_stats['rushingYards'] = parse_stat(rush_data.replace('yds', '').strip())
-                                    elif '1st Downs:' in part:
-                                        home_stats['firstDowns'] = parse_stat(part.split(':')[1].strip())
-                            i += 1
-                        
-                        # Line 3: parse home efficiency line (3rd down, 4th down, red zone)
-                        if i < len(lines):
-                            stats_line = lines[i].strip()
-                            if '3rd Down:' in stats_line or '4th Down:' in stats_line:
-                                parts = stats_line.split('|')
-                                for part in parts:
-                                    if '3rd Down:' in part:
-                                        home_stats['thirdDownRate'] = parse_stat(part.split(':')[1].strip(), 'ratio')
-                                    elif '4th Down:' in part:
-                                        home_stats['fourthDownRate'] = parse_stat(part.split(':')[1].strip(), 'ratio')
-                                    elif 'Red Zone:' in part:
-                                        home_stats['redZoneRate'] = parse_stat(part.split(':')[1].strip(), 'ratio')
-                            i += 1
-                        
-                        # Line 4: parse turnovers, sacks, penalties
-                        if i < len(lines):
-                            stats_line = lines[i].strip()
-                            if 'Turnovers:' in stats_line:
-                                parts = stats_line.split('|')
-                                for part in parts:
-                                    if 'Turnovers:' in part:
-                                        # Extract "3 (INT: 2, Fum: 1)" -> turnovers=3, ints=2, fumbles=1
-                                        to_data = part.split(':')[1].strip()
-                                        if '(' in to_data:
-                                            total_to = to_data.split('(')[0].strip()
-                                            home_stats['turnovers'] = parse_stat(total_to)
-                                            # Parse INT and Fum
-                                            detail = to_data.split('(')[1].replace(')', '')
-                                            if 'INT:' in detail:
-                                                int_val = detail.split('INT:')[1].split(',')[0].strip()
-                                                home_stats['interceptions'] = parse_stat(int_val)
-                                            if 'Fum:' in detail:
-                                                fum_val = detail.split('Fum:')[1].strip()
-                                                home_stats['fumbles'] = parse_stat(fum_val)
-                                        else:
-                                            home_stats['turnovers'] = parse_stat(to_data)
-                                    elif 'Sacks:' in part and 'Sacks-' not in part:
-                                        home_stats['sacks'] = parse_stat(part.split(':')[1].strip())
-                                    elif 'Penalties:' in part:
-                                        home_stats['penalties'] = parse_stat(part.split(':')[1].strip(), 'ratio')
-                            i += 1
-                    
-                    # determine winner and create game records
-                    if away_score > home_score:
-                        # away team won
-                        point_diff = away_score - home_score
-                        
-                        if away_team not in teams_data:
-                            teams_data[away_team] = []
-                        teams_data[away_team].append({
-                            'opponent': home_team,
-                            'location': 'away',
-                            'result': 'W',
-                            'score_for': away_score,
-                            'score_against': home_score,
-                            'point_diff': point_diff,
-                            'preseason': is_preseason,
-                            'off_stats': away_stats,
-                            'def_stats': home_stats,  # opponent's offense = our defense faced
-                            'qb_stats': away_qb_stats  # ACTUAL QB stats
-                        })
-                        
-                        if home_team not in teams_data:
-                            teams_data[home_team] = []
-                        teams_data[home_team].append({
-                            'opponent': away_team,
-                            'location': 'home',
-                            'result': 'L',
-                            'score_for': home_score,
-                            'score_against': away_score,
-                            'point_diff': point_diff,
-                            'preseason': is_preseason,
-                            'off_stats': home_stats,
-                            'def_stats': away_stats,
-                            'qb_stats': home_qb_stats  # ACTUAL QB stats
-                        })
-                    
-                    elif home_score > away_score:
-                        # home team won
-                        point_diff = home_score - away_score
-                        
-                        if home_team not in teams_data:
-                            teams_data[home_team] = []
-                        teams_data[home_team].append({
-                            'opponent': away_team,
-                            'location': 'home',
-                            'result': 'W',
-                            'score_for': home_score,
-                            'score_against': away_score,
-                            'point_diff': point_diff,
-                            'preseason': is_preseason,
-                            'off_stats': home_stats,
-                            'def_stats': away_stats,
-                            'qb_stats': home_qb_stats  # ACTUAL QB stats
-                        })
-                        
-                        if away_team not in teams_data:
-                            teams_data[away_team] = []
-                        teams_data[away_team].append({
-                            'opponent': home_team,
-                            'location': 'away',
-                            'result': 'L',
-                            'score_for': away_score,
-                            'score_against': home_score,
-                            'point_diff': point_diff,
-                            'preseason': is_preseason,
-                            'off_stats': away_stats,
-                            'def_stats': home_stats,
-                            'qb_stats': away_qb_stats  # ACTUAL QB stats
-                        })
-                
-                except Exception as e:
-                    print(f"Error parsing game: {e}")
-                    i += 1
-                    continue
+        elif kind == 'game':
+            away_team = match.group('away').decode('utf-8')
+            home_team = match.group('home').decode('utf-8')
+            away_score = int(match.group('away_score'))
+            home_score = int(match.group('home_score'))
             
-            i += 1
+            # records share these dicts, so the lines that follow fill them in place
+            away_stats, home_stats = {}, {}
+            away_qb_stats, home_qb_stats = {}, {}
+            game_sides = {b'AWAY': (away_stats, away_qb_stats), b'HOME': (home_stats, home_qb_stats)}
+            side_stats = None
+            add_game_records(teams_data, away_team, home_team, away_score, home_score, is_preseason,
+                             away_stats, home_stats, away_qb_stats, home_qb_stats)
+        
+        elif game_sides is None:
+            continue
+        
+        elif kind == 'qb':
+            # "  AWAY QB (Name): 17/34 for 204yds, 1TD/3INT, 6.0 YPA, 41.8 RTG"
+            game_sides[match.group('qb_side')][1].update(parse_qb_line(match.group('qb').decode('utf-8')))
+        
+        elif kind == 'team':
+            side_stats = game_sides[match.group('team_side')][0]
+        
+        elif kind == 'stats' and side_stats is not None:
+            parse_stat_line(match.group('stats').decode('utf-8'), side_stats)
+
+
+def read_nfl_data():
+    """
+    reads nflData.txt with detailed stats and parses into structured format
+    the parse is cached until the file's size or mtime changes, so repeat calls
+    return the same teams_data (treat it as read-only)
+    """
+    path = os.path.abspath('nflData.txt')
     
+    try:
+        f = open(path, 'rb')
     except FileNotFoundError:
         print("ERROR: nflData.txt not found. Please run dataextract.py first.")
         return None
     
+    with f:
+        stat = os.fstat(f.fileno())
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        cached = NFL_DATA_CACHE.get(path)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+        
+        teams_data = {}
+        # mmap can't map an empty file
+        if stat.st_size:
+            # map the file instead of copying it into a str; only the captured
+            # fields get decoded
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                parse_nfl_data(data, teams_data)
+    
+    NFL_DATA_CACHE[path] = (stamp, teams_data)
     return teams_data
 
 
@@ -431,24 +394,85 @@ def calculate_weighted_average(values, use_recency_weighting=True):
     if not values:
         return 0
     
-    if not use_recency_weighting or len(values) <= 3:
+    if not use_recency_weighting:
         return sum(values) / len(values)
     
-    # exponential weights: more recent = higher weight
-    weights = []
-    total_weight = 0
-    for i in range(len(values)):
-        # exponential decay: recent games get 2.5x weight of oldest games
-        weight = 1.0 * (1.5 ** (i / len(values)))
-        weights.append(weight)
-        total_weight += weight
-    
-    # normalize weights
-    weights = [w / total_weight for w in weights]
-    
-    # calculate weighted sum
-    weighted_sum = sum(v * w for v, w in zip(values, weights))
-    return weighted_sum
+    return float(np.dot(np.asarray(values, dtype=np.float64), recency_weights(len(values))))
+
+
+@functools.lru_cache(maxsize=256)
+def recency_weights(n):
+    """
+    normalized weight vector for n games (cached per length, read-only)
+    plain mean for 3 or fewer games, otherwise recent games get 1.5x the weight of the oldest
+    """
+    if n <= 3:
+        weights = np.full(n, 1.0 / n)
+    else:
+        weights = np.power(1.5, np.arange(n) / n)
+        weights /= weights.sum()
+    weights.setflags(write=False)
+    return weights
+
+
+def build_game_table(games):
+    """
+    packs a team's game records into one GAME_DTYPE record array (one row per game)
+    so aggregations work on columns instead of per-game dict lookups
+    """
+    table = np.empty(len(games), dtype=GAME_DTYPE)
+    for idx, g in enumerate(games):
+        off = g['off_stats']
+        dfn = g['def_stats']
+        table[idx] = (g['score_for'], g['score_against'], g['result'] == 'W', g['location'] == 'home',
+                      off.get('yardsPerPlay', 5.5),
+                      *[off.get(k, 0) for k in OFFENSE_STAT_KEYS],
+                      *[dfn.get(k, 0) for k in DEFENSE_STAT_KEYS])
+    return table
+
+
+@jit_kernel
+def derived_game_columns(passing_yds, comp_rate, sacks_allowed, total_yds, epa_ypp, points,
+                         rush_avg, opp_passing_yds, opp_comp_rate, opp_rush_avg):
+    """
+    per-game derived rates used by calculate_team_averages, one row per game:
+    sack rate, EPA proxy, YPA, explosive pass/run rate, explosive pass/run allowed
+    plain scalar loop so numba can compile it when installed
+    """
+    n = passing_yds.shape[0]
+    out = np.zeros((n, 7))
+    for k in range(n):
+        # Sack rate (calculate from team stats)
+        # attempts estimated from yards and completion rate (~7.5 yds/completion)
+        attempts = passing_yds[k] / (comp_rate[k] * 7.5) if comp_rate[k] > 0 else 0.0
+        if comp_rate[k] > 0 and attempts + sacks_allowed[k] > 0:
+            out[k, 0] = sacks_allowed[k] / (attempts + sacks_allowed[k])
+        
+        # EPA Proxy: (Points - League Average) / Total Plays
+        # League avg ~22 points, estimate plays from yards/ypp
+        plays = total_yds[k] / epa_ypp[k] if epa_ypp[k] > 0 else 60.0
+        if plays > 0:
+            out[k, 1] = (points[k] - 22) / plays
+        
+        # Calculate ypa for all games (needed for explosive play calculation)
+        ypa = passing_yds[k] / attempts if comp_rate[k] > 0 and attempts > 0 else 0.0
+        out[k, 2] = ypa
+        
+        # Explosive Play Rates (proxy - estimate from YPP and yards)
+        # Higher YPA suggests more explosive 15+ yard completions (cap at 30%)
+        if comp_rate[k] > 0 and ypa > 0:
+            out[k, 3] = min(ypa / 12.0, 0.3)
+        
+        # Explosive run: 10+ yard runs (estimate from rush avg)
+        out[k, 4] = min(rush_avg[k] / 8.0, 0.25) if rush_avg[k] > 4.5 else 0.05
+        
+        # Defensive explosive plays allowed (opponent's explosive rate = what we allowed)
+        if opp_comp_rate[k] > 0:
+            opp_attempts = opp_passing_yds[k] / (opp_comp_rate[k] * 7.5)
+            opp_ypa = opp_passing_yds[k] / opp_attempts if opp_attempts > 0 else 0.0
+            out[k, 5] = min(opp_ypa / 12.0, 0.3)
+        out[k, 6] = min(opp_rush_avg[k] / 8.0, 0.25) if opp_rush_avg[k] > 4.5 else 0.05
+    return out
 
 
 def calculate_league_stats(teams_data, stat_name, stat_category='offense'):
@@ -470,7 +494,7 @@ def calculate_league_stats(teams_data, stat_name, stat_category='offense'):
     if not values:
         return {'mean': 0, 'std': 1}
     
-    mean = sum(values) / len(values)
+    mean = statistics.fmean(values)
     variance = sum((x - mean) ** 2 for x in values) / len(values)
     std = variance ** 0.5
     
@@ -495,11 +519,38 @@ def calculate_team_averages(team, teams_data, regular_only=True):
     """
     calculates average offensive and defensive stats for a team
     includes run/pass breakdown, recent form analysis, and recency weighting
+    results are cached per team until that team's game list is replaced or grows
+    """
+    averages = get_team_averages(team, teams_data, regular_only)
+    if averages is None:
+        return None
+    # hand out a copy so callers that annotate the result don't touch the cache
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in averages.items()}
+
+
+def get_team_averages(team, teams_data, regular_only=True):
+    """
+    cached calculate_team_averages without the defensive copy - the returned
+    dict is shared, so only use it for read-only lookups
     """
     if team not in teams_data:
         return None
     
     games = teams_data[team]
+    key = (team, regular_only)
+    cached = TEAM_AVERAGES_CACHE.get(key)
+    # the entry keeps a reference to the list it was built from, so an identity
+    # match can't be a recycled id from some other teams_data
+    if cached is None or cached[0] is not games or cached[1] != len(games):
+        cached = (games, len(games), compute_team_averages(games, regular_only))
+        TEAM_AVERAGES_CACHE[key] = cached
+    return cached[2]
+
+
+def compute_team_averages(games, regular_only=True):
+    """
+    uncached body of calculate_team_averages for one team's game list
+    """
     if regular_only:
         # Include regular season AND postseason (weeks 19-22), exclude only preseason
         games = [g for g in games if not g['preseason']]
@@ -507,221 +558,119 @@ def calculate_team_averages(team, teams_data, regular_only=True):
     if not games:
         return None
     
-    # extract values for weighted averaging
-    yards_per_play_vals = [g['off_stats'].get('yardsPerPlay', 0) for g in games]
-    total_yards_vals = [g['off_stats'].get('totalYards', 0) for g in games]
-    points_scored_vals = [g['score_for'] for g in games]
-    third_down_vals = [g['off_stats'].get('thirdDownRate', 0) for g in games]
-    fourth_down_vals = [g['off_stats'].get('fourthDownRate', 0) for g in games]
-    red_zone_vals = [g['off_stats'].get('redZoneRate', 0) for g in games]
-    turnovers_vals = [g['off_stats'].get('turnovers', 0) for g in games]
-    interceptions_vals = [g['off_stats'].get('interceptions', 0) for g in games]
-    fumbles_vals = [g['off_stats'].get('fumbles', 0) for g in games]
-    rushing_vals = [g['off_stats'].get('rushingYards', 0) for g in games]
-    rushing_avg_vals = [g['off_stats'].get('rushingAvg', 0) for g in games]
-    passing_vals = [g['off_stats'].get('passingYards', 0) for g in games]
-    completion_vals = [g['off_stats'].get('completionRate', 0) for g in games]
-    sacks_vals = [g['off_stats'].get('sacks', 0) for g in games]
-    penalties_vals = [g['off_stats'].get('penalties', 0) for g in games]
+    # one record per game, one column per stat - every weighted average below is
+    # then a single dot product against the shared recency weight vector
+    table = build_game_table(games)
+    (yards_per_play_vals, total_yards_vals, third_down_vals, fourth_down_vals, red_zone_vals,
+     turnovers_vals, interceptions_vals, fumbles_vals, rushing_vals, rushing_avg_vals,
+     passing_vals, completion_vals, sacks_vals, penalties_vals) = (table['off_' + k] for k in OFFENSE_STAT_KEYS)
+    (yards_allowed_vals, yards_per_play_allowed_vals, rushing_allowed_vals, rushing_avg_allowed_vals,
+     passing_allowed_vals, completion_allowed_vals, sacks_allowed_vals, red_zone_allowed_vals,
+     third_down_allowed_vals, interceptions_forced_vals) = (table['def_' + k] for k in DEFENSE_STAT_KEYS)
+    points_scored_vals = table['score_for']
+    points_allowed_vals = table['score_against']
+    
+    (sack_rate_vals, epa_proxy_vals, ypa, explosive_pass_rate_vals, explosive_run_rate_vals,
+     explosive_pass_allowed_vals, explosive_run_allowed_vals) = derived_game_columns(
+        passing_vals, completion_vals, sacks_allowed_vals, total_yards_vals, table['epa_ypp'],
+        points_scored_vals, rushing_avg_vals, passing_allowed_vals, completion_allowed_vals,
+        rushing_avg_allowed_vals
+    ).T
     
     # === ACTUAL QB STATS (Priority #1!) ===
-    qb_rating_vals = []  # ACTUAL QB Rating
-    qb_ypa_vals = []  # ACTUAL Yards Per Attempt
-    qb_td_vals = []  # ACTUAL TDs
-    qb_int_vals = []  # ACTUAL INTs
-    qb_td_int_ratio_vals = []  # ACTUAL TD/INT ratio
-    
-    # Fallback values for games without QB stats
-    ypa_vals = []  # For backwards compatibility
-    td_int_ratio_vals = []
-    sack_rate_vals = []
-    epa_proxy_vals = []
-    explosive_pass_rate_vals = []
-    explosive_run_rate_vals = []
-    
-    for g in games:
+    # one slot per game, filled in place below
+    qb_rating_vals = np.empty(len(games))  # ACTUAL QB Rating
+    qb_ypa_vals = np.empty(len(games))  # ACTUAL Yards Per Attempt
+    qb_td_int_ratio_vals = np.empty(len(games))  # ACTUAL TD/INT ratio
+    qb_td_vals = []  # ACTUAL TDs (only games with QB stats)
+    qb_int_vals = []  # ACTUAL INTs (only games with QB stats)
+    
+    for idx, g in enumerate(games):
         # Try to use ACTUAL QB stats if available
         if 'qb_stats' in g and g['qb_stats']:
             qb = g['qb_stats']
-            
-            # ACTUAL QB Rating (most comprehensive QB metric)
-            qb_rating_vals.append(qb.get('rating', 0))
-            
-            # ACTUAL YPA
-            qb_ypa_vals.append(qb.get('ypa', 0))
-            ypa_vals.append(qb.get('ypa', 0))
-            
-            # ACTUAL TDs and INTs
             tds = qb.get('tds', 0)
             ints = qb.get('ints', 0)
             qb_td_vals.append(tds)
             qb_int_vals.append(ints)
-            
-            # ACTUAL TD/INT ratio
-            td_int_ratio = tds / (ints + 0.5) if ints >= 0 else 2.0
-            qb_td_int_ratio_vals.append(td_int_ratio)
-            td_int_ratio_vals.append(td_int_ratio)
-            
+            qb_rating_vals[idx] = qb.get('rating', 0)
+            qb_ypa_vals[idx] = qb.get('ypa', 0)
+            qb_td_int_ratio_vals[idx] = tds / (ints + 0.5) if ints >= 0 else 2.0
         else:
-            # Fallback to estimates if no QB stats
+            # Fallback to estimates from this game's team stats
             ints = g['off_stats'].get('interceptions', 0)
-            
-            ypa_vals.append(ypa)
-            qb_ypa_vals.append(ypa)
-            
             rz_rate = g['off_stats'].get('redZoneRate', 0.5)
-            est_tds = (pts / 7) * rz_rate
-            td_int_ratio = (est_tds / (ints + 0.5)) if ints >= 0 else 2.0
-            td_int_ratio_vals.append(td_int_ratio)
-            qb_td_int_ratio_vals.append(td_int_ratio)
-            
-            qb_rating_vals.append(85.0)  # League average
-        
-        # Sack rate (calculate from team stats)
-        pass_yds = g['off_stats'].get('passingYards', 0)
-        comp_rate = g['off_stats'].get('completionRate', 0)
-        sacks_allowed = g['def_stats'].get('sacks', 0)
-        if comp_rate > 0:
-            attempts = pass_yds / (comp_rate * 7.5)
-            sack_rate = sacks_allowed / (attempts + sacks_allowed) if (attempts + sacks_allowed) > 0 else 0
-        else:
-            sack_rate = 0
-        sack_rate_vals.append(sack_rate)
-        
-        # EPA Proxy: (Points - League Average) / Total Plays
-        # League avg ~22 points, estimate plays from yards/ypp
-        pts = g['score_for']  # Define pts here for all games
-        ypp = g['off_stats'].get('yardsPerPlay', 5.5)
-        total_yds = g['off_stats'].get('totalYards', 0)
-        plays = total_yds / ypp if ypp > 0 else 60
-        epa_proxy = (pts - 22) / plays if plays > 0 else 0
-        epa_proxy_vals.append(epa_proxy)
-        
-        # Calculate ypa for all games (needed for explosive play calculation)
-        if comp_rate > 0:
-            attempts = pass_yds / (comp_rate * 7.5)
-            ypa = pass_yds / attempts if attempts > 0 else 0
-        else:
-            ypa = 0
-        
-        # Explosive Play Rates (proxy - estimate from YPP and yards)
-        # If YPP is high, likely more explosive plays
-        # Explosive pass: estimate 15+ yard completions
-        if comp_rate > 0 and ypa > 0:
-            # Higher YPA suggests more explosives
-            explosive_pass_pct = min(ypa / 12.0, 0.3)  # Cap at 30%
-        else:
-            explosive_pass_pct = 0
-        explosive_pass_rate_vals.append(explosive_pass_pct)
-        
-        # Explosive run: 10+ yard runs (estimate from rush avg)
-        rush_avg = g['off_stats'].get('rushingAvg', 0)
-        explosive_run_pct = min(rush_avg / 8.0, 0.25) if rush_avg > 4.5 else 0.05
-        explosive_run_rate_vals.append(explosive_run_pct)
-    
-    yards_allowed_vals = [g['def_stats'].get('totalYards', 0) for g in games]
-    yards_per_play_allowed_vals = [g['def_stats'].get('yardsPerPlay', 0) for g in games]
-    points_allowed_vals = [g['score_against'] for g in games]
-    rushing_allowed_vals = [g['def_stats'].get('rushingYards', 0) for g in games]
-    rushing_avg_allowed_vals = [g['def_stats'].get('rushingAvg', 0) for g in games]
-    passing_allowed_vals = [g['def_stats'].get('passingYards', 0) for g in games]
-    completion_allowed_vals = [g['def_stats'].get('completionRate', 0) for g in games]
-    sacks_allowed_vals = [g['def_stats'].get('sacks', 0) for g in games]
-    red_zone_allowed_vals = [g['def_stats'].get('redZoneRate', 0) for g in games]
-    third_down_allowed_vals = [g['def_stats'].get('thirdDownRate', 0) for g in games]
-    interceptions_forced_vals = [g['def_stats'].get('interceptions', 0) for g in games]  # takeaways
-    
-    # Defensive explosive plays allowed (from opponent stats)
-    explosive_pass_allowed_vals = []
-    explosive_run_allowed_vals = []
-    for g in games:
-        opp_pass_yds = g['def_stats'].get('passingYards', 0)
-        opp_comp_rate = g['def_stats'].get('completionRate', 0)
-        
-        # Opponent's explosive pass rate = what we allowed
-        if opp_comp_rate > 0:
-            opp_attempts = opp_pass_yds / (opp_comp_rate * 7.5)
-            opp_ypa = opp_pass_yds / opp_attempts if opp_attempts > 0 else 0
-            explosive_pass_allowed = min(opp_ypa / 12.0, 0.3)
-        else:
-            explosive_pass_allowed = 0
-        explosive_pass_allowed_vals.append(explosive_pass_allowed)
-        
-        # Opponent's explosive run rate = what we allowed
-        opp_rush_avg = g['def_stats'].get('rushingAvg', 0)
-        explosive_run_allowed = min(opp_rush_avg / 8.0, 0.25) if opp_rush_avg > 4.5 else 0.05
-        explosive_run_allowed_vals.append(explosive_run_allowed)
-    
-    # offensive averages with recency weighting
-    avg_yards_per_play = calculate_weighted_average(yards_per_play_vals)
-    avg_total_yards = calculate_weighted_average(total_yards_vals)
-    avg_points_scored = calculate_weighted_average(points_scored_vals)
-    avg_third_down = calculate_weighted_average(third_down_vals)
-    avg_fourth_down = calculate_weighted_average(fourth_down_vals)
-    avg_red_zone = calculate_weighted_average(red_zone_vals)
-    avg_turnovers_committed = calculate_weighted_average(turnovers_vals)
-    avg_interceptions_thrown = calculate_weighted_average(interceptions_vals)
-    avg_fumbles_lost = calculate_weighted_average(fumbles_vals)
-    avg_rushing_yards = calculate_weighted_average(rushing_vals)
-    avg_rushing_avg = calculate_weighted_average(rushing_avg_vals)
-    avg_passing_yards = calculate_weighted_average(passing_vals)
-    avg_completion_rate = calculate_weighted_average(completion_vals)
-    avg_sacks_made = calculate_weighted_average(sacks_vals)  # defensive stat tracked on offense
-    avg_penalties = calculate_weighted_average(penalties_vals)
-    
-    # ACTUAL QB stats (when available)
-    avg_qb_rating = calculate_weighted_average(qb_rating_vals)
-    avg_qb_ypa = calculate_weighted_average(qb_ypa_vals)
+            est_tds = (g['score_for'] / 7) * rz_rate
+            qb_rating_vals[idx] = 85.0  # League average
+            qb_ypa_vals[idx] = ypa[idx]
+            qb_td_int_ratio_vals[idx] = (est_tds / (ints + 0.5)) if ints >= 0 else 2.0
+    
+    columns = np.column_stack((
+        yards_per_play_vals, total_yards_vals, points_scored_vals, third_down_vals, fourth_down_vals,
+        red_zone_vals, turnovers_vals, interceptions_vals, fumbles_vals, rushing_vals, rushing_avg_vals,
+        passing_vals, completion_vals, sacks_vals, penalties_vals,
+        qb_rating_vals, qb_ypa_vals, qb_td_int_ratio_vals,
+        sack_rate_vals, epa_proxy_vals, explosive_pass_rate_vals, explosive_run_rate_vals,
+        yards_allowed_vals, yards_per_play_allowed_vals, points_allowed_vals, rushing_allowed_vals,
+        rushing_avg_allowed_vals, passing_allowed_vals, completion_allowed_vals, sacks_allowed_vals,
+        red_zone_allowed_vals, third_down_allowed_vals, interceptions_forced_vals,
+        explosive_pass_allowed_vals, explosive_run_allowed_vals
+    ))
+    
+    # offensive and defensive averages with recency weighting
+    (avg_yards_per_play, avg_total_yards, avg_points_scored, avg_third_down, avg_fourth_down,
+     avg_red_zone, avg_turnovers_committed, avg_interceptions_thrown, avg_fumbles_lost,
+     avg_rushing_yards, avg_rushing_avg, avg_passing_yards, avg_completion_rate,
+     avg_sacks_made,  # defensive stat tracked on offense
+     avg_penalties,
+     avg_qb_rating, avg_qb_ypa, avg_qb_td_int_ratio,
+     avg_sack_rate, avg_epa_proxy, avg_explosive_pass_rate, avg_explosive_run_rate,
+     avg_yards_allowed, avg_yards_per_play_allowed, avg_points_allowed, avg_rushing_yards_allowed,
+     avg_rushing_avg_allowed, avg_passing_yards_allowed, avg_completion_allowed, avg_sacks_allowed,
+     avg_red_zone_allowed, avg_third_down_allowed,
+     avg_interceptions_forced,  # takeaways
+     avg_explosive_pass_allowed, avg_explosive_run_allowed) = (recency_weights(len(games)) @ columns).tolist()
+    
+    # TD/INT counts only cover games with ACTUAL QB stats
     avg_qb_tds = calculate_weighted_average(qb_td_vals) if qb_td_vals else 0
     avg_qb_ints = calculate_weighted_average(qb_int_vals) if qb_int_vals else 0
-    avg_qb_td_int_ratio = calculate_weighted_average(qb_td_int_ratio_vals)
-    
-    # Backwards compatibility
-    avg_yards_per_attempt = avg_qb_ypa if avg_qb_ypa > 0 else calculate_weighted_average(ypa_vals)
-    avg_td_int_ratio = avg_qb_td_int_ratio if avg_qb_td_int_ratio > 0 else calculate_weighted_average(td_int_ratio_vals)
-    avg_sack_rate = calculate_weighted_average(sack_rate_vals)
-    avg_epa_proxy = calculate_weighted_average(epa_proxy_vals)
-    avg_explosive_pass_rate = calculate_weighted_average(explosive_pass_rate_vals)
-    avg_explosive_run_rate = calculate_weighted_average(explosive_run_rate_vals)
-    
-    # defensive averages with recency weighting
-    avg_yards_allowed = calculate_weighted_average(yards_allowed_vals)
-    avg_yards_per_play_allowed = calculate_weighted_average(yards_per_play_allowed_vals)
-    avg_points_allowed = calculate_weighted_average(points_allowed_vals)
-    avg_rushing_yards_allowed = calculate_weighted_average(rushing_allowed_vals)
-    avg_rushing_avg_allowed = calculate_weighted_average(rushing_avg_allowed_vals)
-    avg_passing_yards_allowed = calculate_weighted_average(passing_allowed_vals)
-    avg_completion_allowed = calculate_weighted_average(completion_allowed_vals)
-    avg_sacks_allowed = calculate_weighted_average(sacks_allowed_vals)
-    avg_red_zone_allowed = calculate_weighted_average(red_zone_allowed_vals)
-    avg_third_down_allowed = calculate_weighted_average(third_down_allowed_vals)
-    avg_interceptions_forced = calculate_weighted_average(interceptions_forced_vals)  # takeaways
+    
+    # Backwards compatibility (QB columns already hold the estimates when QB stats are missing)
+    avg_yards_per_attempt = avg_qb_ypa
+    avg_td_int_ratio = avg_qb_td_int_ratio
     
     # recent form (last 3 games) - no weighting needed for binary outcomes
-    recent_games = games[-3:] if len(games) >= 3 else games
-    recent_wins = sum(1 for g in recent_games if g['result'] == 'W')
-    recent_points_scored = sum(g['score_for'] for g in recent_games) / len(recent_games)
-    recent_points_allowed = sum(g['score_against'] for g in recent_games) / len(recent_games)
+    # (slicing the table gives a view, so nothing is copied)
+    recent_games = table[-3:]
+    recent_wins = int(np.count_nonzero(recent_games['win']))
+    recent_points_scored = float(recent_games['score_for'].mean())
+    recent_points_allowed = float(recent_games['score_against'].mean())
     
-    wins = sum(1 for g in games if g['result'] == 'W')
+    # win / close-game / home-away counters straight off the table's columns
+    win = table['win']
+    home = table['home']
+    wins = int(np.count_nonzero(win))
     
     # close game performance (games decided by ≤7 points)
-    close_games = [g for g in games if abs(g['score_for'] - g['score_against']) <= 7]
-    close_game_wins = sum(1 for g in close_games if g['result'] == 'W')
-    close_game_rate = close_game_wins / len(close_games) if close_games else 0.5
+    close = np.abs(points_scored_vals - points_allowed_vals) <= 7
+    close_game_count = int(np.count_nonzero(close))
+    close_game_wins = int(np.count_nonzero(win & close))
+    close_game_rate = close_game_wins / close_game_count if close_game_count else 0.5
     
     # home/away splits
-    home_games = [g for g in games if g['location'] == 'home']
-    away_games = [g for g in games if g['location'] == 'away']
-    home_wins = sum(1 for g in home_games if g['result'] == 'W')
-    away_wins = sum(1 for g in away_games if g['result'] == 'W')
-    home_win_rate = home_wins / len(home_games) if home_games else 0.5
-    away_win_rate = away_wins / len(away_games) if away_games else 0.5
+    home_game_count = int(np.count_nonzero(home))
+    away_game_count = len(games) - home_game_count
+    home_wins = int(np.count_nonzero(win & home))
+    away_wins = wins - home_wins
+    home_win_rate = home_wins / home_game_count if home_game_count else 0.5
+    away_win_rate = away_wins / away_game_count if away_game_count else 0.5
     
     # pythagorean expectation (expected win rate based on points)
-    total_points_scored = sum(points_scored_vals)
-    total_points_allowed = sum(points_allowed_vals)
-    pythagorean_exp = (total_points_scored ** 2.37) / ((total_points_scored ** 2.37) + (total_points_allowed ** 2.37))
+    total_points_scored = int(points_scored_vals.sum())
+    total_points_allowed = int(points_allowed_vals.sum())
+    scored_pow = total_points_scored ** PYTHAGOREAN_EXPONENT
+    allowed_pow = total_points_allowed ** PYTHAGOREAN_EXPONENT
+    pythagorean_exp = scored_pow / (scored_pow + allowed_pow)
     
     # turnover differential (NOW using actual INTs instead of proxy)
     takeaways = avg_interceptions_forced  # actual takeaways
@@ -772,8 +721,8 @@ def calculate_team_averages(team, teams_data, regular_only=True):
             'red_zone_allowed': avg_red_zone_allowed,
             'third_down_allowed': avg_third_down_allowed,
             'interceptions_forced': avg_interceptions_forced,
-            'explosive_pass_allowed': calculate_weighted_average(explosive_pass_allowed_vals),
-            'explosive_run_allowed': calculate_weighted_average(explosive_run_allowed_vals)
+            'explosive_pass_allowed': avg_explosive_pass_allowed,
+            'explosive_run_allowed': avg_explosive_run_allowed
         },
         'recent_form': {
             'wins': recent_wins,
@@ -783,7 +732,7 @@ def calculate_team_averages(team, teams_data, regular_only=True):
             'points_allowed': recent_points_allowed
         },
         'close_games': {
-            'total': len(close_games),
+            'total': close_game_count,
             'wins': close_game_wins,
             'win_rate': close_game_rate
         },
@@ -836,7 +785,7 @@ def calculate_bounce_back_probability(team, teams_data):
     
     # 2. RED ZONE/3RD DOWN EXTREMES in recent games
     if len(recent_games) >= 2:
-        recent_3rd_down = sum(g['off_stats'].get('thirdDownRate', 0) for g in recent_games) / len(recent_games)
+        recent_3rd_down = statistics.fmean(g['off_stats'].get('thirdDownRate', 0) for g in recent_games)
         if recent_3rd_down <= 0.25 and recent_3rd_down > 0:  # extreme low (will normalize)
             bounce_back_score += 1.0
             factors.append("Extreme 3rd down struggles (likely to improve)")
@@ -888,18 +837,14 @@ def calculate_opponent_quality(team, teams_data):
     if team not in teams_data:
         return 0.5
     
-    opponent_win_rates = []
-    for game in teams_data[team]:
-        if not game['preseason']:
-            opp = game['opponent']
-            opp_avg = calculate_team_averages(opp, teams_data, regular_only=True)
-            if opp_avg:
-                opponent_win_rates.append(opp_avg['win_rate'])
+    league = league_table(teams_data)
+    opponent_rows = [league.team_index[g['opponent']] for g in teams_data[team]
+                     if not g['preseason'] and g['opponent'] in league.team_index]
     
-    if not opponent_win_rates:
+    if not opponent_rows:
         return 0.5
     
-    return sum(opponent_win_rates) / len(opponent_win_rates)
+    return statistics.fmean(league.win_rate[opponent_rows].tolist())
 
 
 def classify_offensive_style(team_avg):
@@ -919,10 +864,12 @@ def classify_offensive_style(team_avg):
     
     rush_pct = rush_yards / total_yards
     
-    if rush_pct > 0.55:
-        return 'run_heavy'
-    elif rush_pct < 0.45:
+    # pass_heavy is by far the most common result (30 of 32 teams in
+    # 2024), so test it first and let the rare cases fall through
+    if rush_pct < 0.45:
         return 'pass_heavy'
+    elif rush_pct > 0.55:
+        return 'run_heavy'
     else:
         return 'balanced'
 
@@ -941,7 +888,7 @@ def find_similar_matchup_performance(team, opponent_style, teams_data, matchup_t
     
     for game in games:
         opp = game['opponent']
-        opp_avg = calculate_team_averages(opp, teams_data, regular_only=True)
+        opp_avg = get_team_averages(opp, teams_data, regular_only=True)
         
         if not opp_avg:
             continue
@@ -977,65 +924,101 @@ def find_similar_matchup_performance(team, opponent_style, teams_data, matchup_t
     if matchup_type == 'offense':
         return {
             'games': len(similar_games),
-            'avg_points': sum(g['points_scored'] for g in similar_games) / len(similar_games),
-            'avg_yards': sum(g['yards'] for g in similar_games) / len(similar_games),
-            'avg_ypp': sum(g['ypp'] for g in similar_games) / len(similar_games),
+            'avg_points': statistics.fmean(g['points_scored'] for g in similar_games),
+            'avg_yards': statistics.fmean(g['yards'] for g in similar_games),
+            'avg_ypp': statistics.fmean(g['ypp'] for g in similar_games),
             'win_rate': sum(1 for g in similar_games if g['result'] == 'W') / len(similar_games)
         }
     else:
         return {
             'games': len(similar_games),
-            'avg_points_allowed': sum(g['points_allowed'] for g in similar_games) / len(similar_games),
-            'avg_yards_allowed': sum(g['yards_allowed'] for g in similar_games) / len(similar_games),
-            'avg_ypp_allowed': sum(g['ypp_allowed'] for g in similar_games) / len(similar_games),
+            'avg_points_allowed': statistics.fmean(g['points_allowed'] for g in similar_games),
+            'avg_yards_allowed': statistics.fmean(g['yards_allowed'] for g in similar_games),
+            'avg_ypp_allowed': statistics.fmean(g['ypp_allowed'] for g in similar_games),
             'win_rate': sum(1 for g in similar_games if g['result'] == 'W') / len(similar_games)
         }
 
 
-def calculate_strength_adjusted_stats(team, teams_data):
+# schedule-strength result; defaults are the neutral values used when a team
+# has no regular season data to rank against
+StrengthAdjustment = namedtuple(
+    'StrengthAdjustment',
+    ['adjustment_factor', 'avg_opp_def_rank', 'faced_tough_defenses', 'faced_weak_defenses'],
+    defaults=(1.0, 0.5, False, False)
+)
+
+
+# league-wide columns for cross-team lookups, one row per team with regular-season
+# games: team_index maps team -> row, the other fields are parallel float arrays
+LeagueTable = namedtuple('LeagueTable', ['team_index', 'win_rate', 'defense_rank'])
+
+
+def league_table(teams_data):
     """
-    calculates strength-adjusted offensive stats based on opponent defensive quality
-    adjusts team's offensive performance relative to the defenses they've faced
+    builds the LeagueTable: every team's win rate and defense rank (0.0 = best,
+    1.0 = worst by yards per play allowed), so opponent lookups are array gathers
+    it only changes when the data does, so it's cached until any team's game
+    list is replaced or grows
     """
-    if team not in teams_data:
-        return {'adjustment_factor': 1.0, 'avg_opp_def_rank': 0.5}
-    
-    # Get all teams' defensive stats to calculate league averages and ranks
-    all_teams_def_stats = {}
+    sources = [(games, len(games)) for games in teams_data.values()]
+    key = tuple(teams_data)
+    cached = LEAGUE_TABLE_CACHE.get(key)
+    if cached is not None and all(
+        old is games and old_len == games_len
+        for (old, old_len), (games, games_len) in zip(cached[0], sources)
+    ):
+        return cached[1]
+    
+    team_index = {}
+    win_rate = []
+    ypp_allowed = []
     for tm in teams_data.keys():
-        tm_avg = calculate_team_averages(tm, teams_data, regular_only=True)
+        tm_avg = get_team_averages(tm, teams_data, regular_only=True)
         if tm_avg:
-            all_teams_def_stats[tm] = {
-                'yards_per_play_allowed': tm_avg['defense']['yards_per_play_allowed'],
-                'points_allowed': tm_avg['defense']['points_allowed']
-            }
-    
-    if not all_teams_def_stats:
-        return {'adjustment_factor': 1.0, 'avg_opp_def_rank': 0.5}
+            team_index[tm] = len(win_rate)
+            win_rate.append(tm_avg['win_rate'])
+            ypp_allowed.append(tm_avg['defense']['yards_per_play_allowed'])
     
-    # Calculate league average defense
-    league_avg_ypp_allowed = sum(s['yards_per_play_allowed'] for s in all_teams_def_stats.values()) / len(all_teams_def_stats)
-    league_avg_pts_allowed = sum(s['points_allowed'] for s in all_teams_def_stats.values()) / len(all_teams_def_stats)
+    # lower allowed = better defense = lower rank; stable sort keeps ties in team order
+    defense_rank = np.empty(len(ypp_allowed))
+    defense_rank[np.argsort(ypp_allowed, kind='stable')] = np.arange(1, len(ypp_allowed) + 1) / len(ypp_allowed)
     
-    # Rank defenses (lower allowed = better defense = higher rank)
-    # Better defenses have lower yards/points allowed
-    sorted_by_ypp = sorted(all_teams_def_stats.items(), key=lambda x: x[1]['yards_per_play_allowed'])
-    defense_ranks = {team: (i + 1) / len(sorted_by_ypp) for i, (team, _) in enumerate(sorted_by_ypp)}
+    table = LeagueTable(team_index, np.array(win_rate), defense_rank)
+    LEAGUE_TABLE_CACHE[key] = (sources, table)
+    return table
+
+
+def get_injury_impact(team, injury_data):
+    """
+    calculate_injury_impact, cached per team for as long as the same injury_data
+    object is passed in (one fetch serves a whole slate of predictions)
+    """
+    cached = INJURY_IMPACT_CACHE.get(team)
+    if cached is None or cached[0] is not injury_data:
+        cached = (injury_data, calculate_injury_impact(team, injury_data))
+        INJURY_IMPACT_CACHE[team] = cached
+    return cached[1]
+
+
+def calculate_strength_adjusted_stats(team, teams_data):
+    """
+    calculates strength-adjusted offensive stats based on opponent defensive quality
+    adjusts team's offensive performance relative to the defenses they've faced
+    returns a StrengthAdjustment (neutral defaults when there's no data)
+    """
+    if team not in teams_data:
+        return StrengthAdjustment()
     
     # Calculate average defensive quality faced by this team
-    opp_def_qualities = []
-    games = [g for g in teams_data[team] if not g['preseason']]
-    
-    for game in games:
-        opp = game['opponent']
-        if opp in defense_ranks:
-            # defense_rank: 0.0 = best defense, 1.0 = worst defense
-            opp_def_qualities.append(defense_ranks[opp])
+    # defense_rank: 0.0 = best defense, 1.0 = worst defense
+    league = league_table(teams_data)
+    opponent_rows = [league.team_index[g['opponent']] for g in teams_data[team]
+                     if not g['preseason'] and g['opponent'] in league.team_index]
     
-    if not opp_def_qualities:
-        return {'adjustment_factor': 1.0, 'avg_opp_def_rank': 0.5}
+    if not opponent_rows:
+        return StrengthAdjustment()
     
-    avg_opp_def_rank = sum(opp_def_qualities) / len(opp_def_qualities)
+    avg_opp_def_rank = statistics.fmean(league.defense_rank[opponent_rows].tolist())
     
     # Adjustment factor:
     # If avg_opp_def_rank > 0.5: faced weaker defenses (easier schedule) -> deflate stats
@@ -1043,19 +1026,49 @@ def calculate_strength_adjusted_stats(team, teams_data):
     # Factor ranges from 0.85 to 1.15
     adjustment_factor = 1.0 + (0.5 - avg_opp_def_rank) * 0.3
     
-    return {
-        'adjustment_factor': adjustment_factor,
-        'avg_opp_def_rank': avg_opp_def_rank,
-        'faced_tough_defenses': avg_opp_def_rank < 0.4,  # Top 40% of defenses
-        'faced_weak_defenses': avg_opp_def_rank > 0.6   # Bottom 40% of defenses
-    }
+    return StrengthAdjustment(
+        adjustment_factor=adjustment_factor,
+        avg_opp_def_rank=avg_opp_def_rank,
+        faced_tough_defenses=avg_opp_def_rank < 0.4,  # Top 40% of defenses
+        faced_weak_defenses=avg_opp_def_rank > 0.6   # Bottom 40% of defenses
+    )
+
+
+def ladder_rung(ladder, value):
+    """
+    finds the ScoreLadder rung value lands on with two binary searches instead of an if/elif chain
+    returns (points, message template, True for an up rung / False for a down rung),
+    or None when value sits between the down and up rungs
+    """
+    up = bisect.bisect_left(ladder.up_thresholds, value)  # thresholds strictly below value
+    if up:
+        return ladder.up_points[up - 1], ladder.up_messages[up - 1], True
+    down = bisect.bisect_right(ladder.down_thresholds, value)  # thresholds at or below value
+    if down < len(ladder.down_thresholds):
+        return ladder.down_points[down], ladder.down_messages[down], False
+    return None
 
 
-def advanced_prediction(home_team, away_team, teams_data, is_neutral=False, injury_data=None):
+def score_ladder(ladder, value, team, opponent, verbose=True):
+    """
+    looks value up on a matchup ScoreLadder (up rungs score for team, down rungs for opponent)
+    returns (points for team, points for opponent, report line or None)
+    verbose: if False, the report line isn't formatted and is always None
+    """
+    rung = ladder_rung(ladder, value)
+    if rung is None:
+        return 0.0, 0.0, None
+    points, message, up = rung
+    message = message.format(team=team, opponent=opponent, points=points) if verbose else None
+    return (points, 0.0, message) if up else (0.0, points, message)
+
+
+def advanced_prediction(home_team, away_team, teams_data, is_neutral=False, injury_data=None, verbose=True):
     """
     advanced prediction using offensive/defensive matchup analysis
     is_neutral: if True, no home field advantage is applied
     injury_data: dict of current injuries (optional)
+    verbose: if False, skips the printed report and only computes the points (backtests, batch runs)
     """
     if teams_data is None:
         return None
@@ -1076,120 +1089,129 @@ def advanced_prediction(home_team, away_team, teams_data, is_neutral=False, inju
     home_injury_impact = None
     away_injury_impact = None
     if injury_data:
-        home_injury_impact = calculate_injury_impact(home_team, injury_data)
-        away_injury_impact = calculate_injury_impact(away_team, injury_data)
+        home_injury_impact = get_injury_impact(home_team, injury_data)
+        away_injury_impact = get_injury_impact(away_team, injury_data)
     
     if not home_avg or not away_avg:
-        print("Not enough regular season data for prediction")
+        if verbose:
+            print("Not enough regular season data for prediction")
         return None
     
-    print(f"\n{'=' * 100}")
-    print(f"DETAILED TEAM ANALYSIS")
-    print(f"{'=' * 100}\n")
-    
-    # display team stats
-    print(f"{home_team} (Home) - {home_avg['wins']}-{home_avg['games_played'] - home_avg['wins']} record:")
-    print(f"  Offense: {home_avg['offense']['yards_per_play']:.1f} yds/play, "
-          f"{home_avg['offense']['points_scored']:.1f} pts/game, "
-          f"{home_avg['offense']['third_down_rate']:.1%} 3rd down")
-    print(f"    Rushing: {home_avg['offense']['rushing_yards']:.1f} yds/game ({home_avg['offense']['rushing_avg']:.1f} avg) | "
-          f"Passing: {home_avg['offense']['passing_yards']:.1f} yds/game ({home_avg['offense']['completion_rate']:.1%} comp%)")
-    print(f"    Red Zone: {home_avg['offense']['red_zone_rate']:.1%} TD rate | "
-          f"4th Down: {home_avg['offense']['fourth_down_rate']:.1%} | "
-          f"Penalties: {home_avg['offense']['penalties']:.1f}/game")
-    print(f"  Defense: {home_avg['defense']['points_allowed']:.1f} pts allowed/game, "
-          f"{home_avg['defense']['yards_per_play_allowed']:.1f} yds/play allowed, "
-          f"{home_avg['offense']['sacks_made']:.1f} sacks/game")
-    print(f"    vs Rush: {home_avg['defense']['rushing_yards_allowed']:.1f} yds/game ({home_avg['defense']['rushing_avg_allowed']:.1f} avg) | "
-          f"vs Pass: {home_avg['defense']['passing_yards_allowed']:.1f} yds/game ({home_avg['defense']['completion_allowed']:.1%} comp%)")
-    print(f"    Red Zone D: {home_avg['defense']['red_zone_allowed']:.1%} allowed | "
-          f"INTs: {home_avg['defense']['interceptions_forced']:.1f}/game")
-    print(f"  Recent Form (last {home_avg['recent_form']['games']} games): "
-          f"{home_avg['recent_form']['wins']}-{home_avg['recent_form']['games'] - home_avg['recent_form']['wins']}, "
-          f"{home_avg['recent_form']['points_scored']:.1f} pts/game")
-    print(f"  Close Games (≤7 pts): {home_avg['close_games']['wins']}-{home_avg['close_games']['total'] - home_avg['close_games']['wins']} "
-          f"({home_avg['close_games']['win_rate']:.1%})")
-    print(f"  Home/Away Split: {home_avg['splits']['home_win_rate']:.1%} home, {home_avg['splits']['away_win_rate']:.1%} away")
-    print(f"  Turnover Margin: {home_avg['turnover_margin']:+.1f} per game")
-    print(f"  Pythagorean Win %: {home_avg['pythagorean_win_rate']:.1%} (Actual: {home_avg['win_rate']:.1%})")
+    # build the report in memory and write it to stdout once at the end
+    # (every report line sits behind verbose, so quiet runs never format one)
+    report = io.StringIO()
+    emit = functools.partial(print, file=report)
+    
+    if verbose:
+        emit(f"\n{'=' * 100}")
+        emit(f"DETAILED TEAM ANALYSIS")
+        emit(f"{'=' * 100}\n")
+        
+        # display team stats
+        emit(f"{home_team} (Home) - {home_avg['wins']}-{home_avg['games_played'] - home_avg['wins']} record:")
+        emit(f"  Offense: {home_avg['offense']['yards_per_play']:.1f} yds/play, "
+             f"{home_avg['offense']['points_scored']:.1f} pts/game, "
+             f"{home_avg['offense']['third_down_rate']:.1%} 3rd down")
+        emit(f"    Rushing: {home_avg['offense']['rushing_yards']:.1f} yds/game ({home_avg['offense']['rushing_avg']:.1f} avg) | "
+             f"Passing: {home_avg['offense']['passing_yards']:.1f} yds/game ({home_avg['offense']['completion_rate']:.1%} comp%)")
+        emit(f"    Red Zone: {home_avg['offense']['red_zone_rate']:.1%} TD rate | "
+             f"4th Down: {home_avg['offense']['fourth_down_rate']:.1%} | "
+             f"Penalties: {home_avg['offense']['penalties']:.1f}/game")
+        emit(f"  Defense: {home_avg['defense']['points_allowed']:.1f} pts allowed/game, "
+             f"{home_avg['defense']['yards_per_play_allowed']:.1f} yds/play allowed, "
+             f"{home_avg['offense']['sacks_made']:.1f} sacks/game")
+        emit(f"    vs Rush: {home_avg['defense']['rushing_yards_allowed']:.1f} yds/game ({home_avg['defense']['rushing_avg_allowed']:.1f} avg) | "
+             f"vs Pass: {home_avg['defense']['passing_yards_allowed']:.1f} yds/game ({home_avg['defense']['completion_allowed']:.1%} comp%)")
+        emit(f"    Red Zone D: {home_avg['defense']['red_zone_allowed']:.1%} allowed | "
+             f"INTs: {home_avg['defense']['interceptions_forced']:.1f}/game")
+        emit(f"  Recent Form (last {home_avg['recent_form']['games']} games): "
+             f"{home_avg['recent_form']['wins']}-{home_avg['recent_form']['games'] - home_avg['recent_form']['wins']}, "
+             f"{home_avg['recent_form']['points_scored']:.1f} pts/game")
+        emit(f"  Close Games (≤7 pts): {home_avg['close_games']['wins']}-{home_avg['close_games']['total'] - home_avg['close_games']['wins']} "
+             f"({home_avg['close_games']['win_rate']:.1%})")
+        emit(f"  Home/Away Split: {home_avg['splits']['home_win_rate']:.1%} home, {home_avg['splits']['away_win_rate']:.1%} away")
+        emit(f"  Turnover Margin: {home_avg['turnover_margin']:+.1f} per game")
+        emit(f"  Pythagorean Win %: {home_avg['pythagorean_win_rate']:.1%} (Actual: {home_avg['win_rate']:.1%})")
     
     home_opp_quality = calculate_opponent_quality(home_team, teams_data)
     home_strength_adj = calculate_strength_adjusted_stats(home_team, teams_data)
-    print(f"  Opponent Quality: {home_opp_quality:.3f} avg win rate")
-    print(f"  Defensive Schedule Strength: Rank {home_strength_adj['avg_opp_def_rank']:.2f} "
-          f"(Adjustment: {home_strength_adj['adjustment_factor']:.2f}x)")
-    if home_strength_adj['faced_tough_defenses']:
-        print(f"    >> Faced TOP-TIER defenses (stats likely understated)")
-    elif home_strength_adj['faced_weak_defenses']:
-        print(f"    >> Faced WEAK defenses (stat-padding concern)")
-    
-    # Display injury information
-    if home_injury_impact:
-        print(f"  Injury Report: {home_injury_impact['total_injuries']} injuries (excluding healthy/active)")
-        print(f"    Out/IR: {home_injury_impact['out']}, Doubtful: {home_injury_impact['doubtful']}, "
-              f"Questionable: {home_injury_impact['questionable']}")
-        print(f"    Impact Score: {home_injury_impact['impact_score']:.1f} (position-weighted)")
-        if home_injury_impact['qb_injured']:
-            print(f"    ⚠️  QB INJURED - MAJOR IMPACT")
-        if home_injury_impact['injury_list']:
-            print(f"    Key Injuries: {', '.join(home_injury_impact['injury_list'][:3])}")
-            if len(home_injury_impact['injury_list']) > 3:
-                print(f"      ... and {len(home_injury_impact['injury_list']) - 3} more")
-    print()
-    
-    print(f"{away_team} (Away) - {away_avg['wins']}-{away_avg['games_played'] - away_avg['wins']} record:")
-    print(f"  Offense: {away_avg['offense']['yards_per_play']:.1f} yds/play, "
-          f"{away_avg['offense']['points_scored']:.1f} pts/game, "
-          f"{away_avg['offense']['third_down_rate']:.1%} 3rd down")
-    print(f"    Rushing: {away_avg['offense']['rushing_yards']:.1f} yds/game ({away_avg['offense']['rushing_avg']:.1f} avg) | "
-          f"Passing: {away_avg['offense']['passing_yards']:.1f} yds/game ({away_avg['offense']['completion_rate']:.1%} comp%)")
-    print(f"    Red Zone: {away_avg['offense']['red_zone_rate']:.1%} TD rate | "
-          f"4th Down: {away_avg['offense']['fourth_down_rate']:.1%} | "
-          f"Penalties: {away_avg['offense']['penalties']:.1f}/game")
-    print(f"  Defense: {away_avg['defense']['points_allowed']:.1f} pts allowed/game, "
-          f"{away_avg['defense']['yards_per_play_allowed']:.1f} yds/play allowed, "
-          f"{away_avg['offense']['sacks_made']:.1f} sacks/game")
-    print(f"    vs Rush: {away_avg['defense']['rushing_yards_allowed']:.1f} yds/game ({away_avg['defense']['rushing_avg_allowed']:.1f} avg) | "
-          f"vs Pass: {away_avg['defense']['passing_yards_allowed']:.1f} yds/game ({away_avg['defense']['completion_allowed']:.1%} comp%)")
-    print(f"    Red Zone D: {away_avg['defense']['red_zone_allowed']:.1%} allowed | "
-          f"INTs: {away_avg['defense']['interceptions_forced']:.1f}/game")
-    print(f"  Recent Form (last {away_avg['recent_form']['games']} games): "
-          f"{away_avg['recent_form']['wins']}-{away_avg['recent_form']['games'] - away_avg['recent_form']['wins']}, "
-          f"{away_avg['recent_form']['points_scored']:.1f} pts/game")
-    print(f"  Close Games (≤7 pts): {away_avg['close_games']['wins']}-{away_avg['close_games']['total'] - away_avg['close_games']['wins']} "
-          f"({away_avg['close_games']['win_rate']:.1%})")
-    print(f"  Home/Away Split: {away_avg['splits']['home_win_rate']:.1%} home, {away_avg['splits']['away_win_rate']:.1%} away")
-    print(f"  Turnover Margin: {away_avg['turnover_margin']:+.1f} per game")
-    print(f"  Pythagorean Win %: {away_avg['pythagorean_win_rate']:.1%} (Actual: {away_avg['win_rate']:.1%})")
+    if verbose:
+        emit(f"  Opponent Quality: {home_opp_quality:.3f} avg win rate")
+        emit(f"  Defensive Schedule Strength: Rank {home_strength_adj.avg_opp_def_rank:.2f} "
+             f"(Adjustment: {home_strength_adj.adjustment_factor:.2f}x)")
+        if home_strength_adj.faced_tough_defenses:
+            emit(f"    >> Faced TOP-TIER defenses (stats likely understated)")
+        elif home_strength_adj.faced_weak_defenses:
+            emit(f"    >> Faced WEAK defenses (stat-padding concern)")
+        
+        # Display injury information
+        if home_injury_impact:
+            emit(f"  Injury Report: {home_injury_impact['total_injuries']} injuries (excluding healthy/active)")
+            emit(f"    Out/IR: {home_injury_impact['out']}, Doubtful: {home_injury_impact['doubtful']}, "
+                 f"Questionable: {home_injury_impact['questionable']}")
+            emit(f"    Impact Score: {home_injury_impact['impact_score']:.1f} (position-weighted)")
+            if home_injury_impact['qb_injured']:
+                emit(f"    ⚠️  QB INJURED - MAJOR IMPACT")
+            if home_injury_impact['injury_list']:
+                emit(f"    Key Injuries: {', '.join(home_injury_impact['injury_list'][:3])}")
+                if len(home_injury_impact['injury_list']) > 3:
+                    emit(f"      ... and {len(home_injury_impact['injury_list']) - 3} more")
+        emit()
+        
+        emit(f"{away_team} (Away) - {away_avg['wins']}-{away_avg['games_played'] - away_avg['wins']} record:")
+        emit(f"  Offense: {away_avg['offense']['yards_per_play']:.1f} yds/play, "
+             f"{away_avg['offense']['points_scored']:.1f} pts/game, "
+             f"{away_avg['offense']['third_down_rate']:.1%} 3rd down")
+        emit(f"    Rushing: {away_avg['offense']['rushing_yards']:.1f} yds/game ({away_avg['offense']['rushing_avg']:.1f} avg) | "
+             f"Passing: {away_avg['offense']['passing_yards']:.1f} yds/game ({away_avg['offense']['completion_rate']:.1%} comp%)")
+        emit(f"    Red Zone: {away_avg['offense']['red_zone_rate']:.1%} TD rate | "
+             f"4th Down: {away_avg['offense']['fourth_down_rate']:.1%} | "
+             f"Penalties: {away_avg['offense']['penalties']:.1f}/game")
+        emit(f"  Defense: {away_avg['defense']['points_allowed']:.1f} pts allowed/game, "
+             f"{away_avg['defense']['yards_per_play_allowed']:.1f} yds/play allowed, "
+             f"{away_avg['offense']['sacks_made']:.1f} sacks/game")
+        emit(f"    vs Rush: {away_avg['defense']['rushing_yards_allowed']:.1f} yds/game ({away_avg['defense']['rushing_avg_allowed']:.1f} avg) | "
+             f"vs Pass: {away_avg['defense']['passing_yards_allowed']:.1f} yds/game ({away_avg['defense']['completion_allowed']:.1%} comp%)")
+        emit(f"    Red Zone D: {away_avg['defense']['red_zone_allowed']:.1%} allowed | "
+             f"INTs: {away_avg['defense']['interceptions_forced']:.1f}/game")
+        emit(f"  Recent Form (last {away_avg['recent_form']['games']} games): "
+             f"{away_avg['recent_form']['wins']}-{away_avg['recent_form']['games'] - away_avg['recent_form']['wins']}, "
+             f"{away_avg['recent_form']['points_scored']:.1f} pts/game")
+        emit(f"  Close Games (≤7 pts): {away_avg['close_games']['wins']}-{away_avg['close_games']['total'] - away_avg['close_games']['wins']} "
+             f"({away_avg['close_games']['win_rate']:.1%})")
+        emit(f"  Home/Away Split: {away_avg['splits']['home_win_rate']:.1%} home, {away_avg['splits']['away_win_rate']:.1%} away")
+        emit(f"  Turnover Margin: {away_avg['turnover_margin']:+.1f} per game")
+        emit(f"  Pythagorean Win %: {away_avg['pythagorean_win_rate']:.1%} (Actual: {away_avg['win_rate']:.1%})")
     
     away_opp_quality = calculate_opponent_quality(away_team, teams_data)
     away_strength_adj = calculate_strength_adjusted_stats(away_team, teams_data)
-    print(f"  Opponent Quality: {away_opp_quality:.3f} avg win rate")
-    print(f"  Defensive Schedule Strength: Rank {away_strength_adj['avg_opp_def_rank']:.2f} "
-          f"(Adjustment: {away_strength_adj['adjustment_factor']:.2f}x)")
-    if away_strength_adj['faced_tough_defenses']:
-        print(f"    >> Faced TOP-TIER defenses (stats likely understated)")
-    elif away_strength_adj['faced_weak_defenses']:
-        print(f"    >> Faced WEAK defenses (stat-padding concern)")
-    
-    # Display injury information
-    if away_injury_impact:
-        print(f"  Injury Report: {away_injury_impact['total_injuries']} injuries (excluding healthy/active)")
-        print(f"    Out/IR: {away_injury_impact['out']}, Doubtful: {away_injury_impact['doubtful']}, "
-              f"Questionable: {away_injury_impact['questionable']}")
-        print(f"    Impact Score: {away_injury_impact['impact_score']:.1f} (position-weighted)")
-        if away_injury_impact['qb_injured']:
-            print(f"    ⚠️  QB INJURED - MAJOR IMPACT")
-        if away_injury_impact['injury_list']:
-            print(f"    Key Injuries: {', '.join(away_injury_impact['injury_list'][:3])}")
-            if len(away_injury_impact['injury_list']) > 3:
-                print(f"      ... and {len(away_injury_impact['injury_list']) - 3} more")
-    print()
-    
-    # MATCHUP ANALYSIS
-    print(f"{'=' * 100}")
-    print(f"MATCHUP ANALYSIS")
-    print(f"{'=' * 100}\n")
+    if verbose:
+        emit(f"  Opponent Quality: {away_opp_quality:.3f} avg win rate")
+        emit(f"  Defensive Schedule Strength: Rank {away_strength_adj.avg_opp_def_rank:.2f} "
+             f"(Adjustment: {away_strength_adj.adjustment_factor:.2f}x)")
+        if away_strength_adj.faced_tough_defenses:
+            emit(f"    >> Faced TOP-TIER defenses (stats likely understated)")
+        elif away_strength_adj.faced_weak_defenses:
+            emit(f"    >> Faced WEAK defenses (stat-padding concern)")
+        
+        # Display injury information
+        if away_injury_impact:
+            emit(f"  Injury Report: {away_injury_impact['total_injuries']} injuries (excluding healthy/active)")
+            emit(f"    Out/IR: {away_injury_impact['out']}, Doubtful: {away_injury_impact['doubtful']}, "
+                 f"Questionable: {away_injury_impact['questionable']}")
+            emit(f"    Impact Score: {away_injury_impact['impact_score']:.1f} (position-weighted)")
+            if away_injury_impact['qb_injured']:
+                emit(f"    ⚠️  QB INJURED - MAJOR IMPACT")
+            if away_injury_impact['injury_list']:
+                emit(f"    Key Injuries: {', '.join(away_injury_impact['injury_list'][:3])}")
+                if len(away_injury_impact['injury_list']) > 3:
+                    emit(f"      ... and {len(away_injury_impact['injury_list']) - 3} more")
+        emit()
+        
+        # MATCHUP ANALYSIS
+        emit(f"{'=' * 100}")
+        emit(f"MATCHUP ANALYSIS")
+        emit(f"{'=' * 100}\n")
     
     # Initialize points
     home_points = 0
@@ -1199,301 +1221,317 @@ def advanced_prediction(home_team, away_team, teams_data, is_neutral=False, inju
     home_style = classify_offensive_style(home_avg)
     away_style = classify_offensive_style(away_avg)
     
-    print(f"Offensive Styles:")
-    print(f"  {home_team}: {home_style.upper().replace('_', ' ')} "
-          f"({home_avg['offense']['rushing_yards']:.0f} rush / {home_avg['offense']['passing_yards']:.0f} pass)")
-    print(f"  {away_team}: {away_style.upper().replace('_', ' ')} "
-          f"({away_avg['offense']['rushing_yards']:.0f} rush / {away_avg['offense']['passing_yards']:.0f} pass)")
-    print()
+    if verbose:
+        emit(f"Offensive Styles:")
+        emit(f"  {home_team}: {home_style.upper().replace('_', ' ')} "
+             f"({home_avg['offense']['rushing_yards']:.0f} rush / {home_avg['offense']['passing_yards']:.0f} pass)")
+        emit(f"  {away_team}: {away_style.upper().replace('_', ' ')} "
+             f"({away_avg['offense']['rushing_yards']:.0f} rush / {away_avg['offense']['passing_yards']:.0f} pass)")
+        emit()
     
     # Find performance vs similar opponents
     home_vs_similar_off = find_similar_matchup_performance(home_team, away_style, teams_data, 'defense')
     away_vs_similar_off = find_similar_matchup_performance(away_team, home_style, teams_data, 'defense')
     
     if home_vs_similar_off and home_vs_similar_off['games'] >= 2:
-        print(f"Similar Matchup History:")
-        print(f"  {home_team} defense vs {away_style.replace('_', '-')} offenses ({home_vs_similar_off['games']} games):")
-        print(f"    Allowed {home_vs_similar_off['avg_points_allowed']:.1f} pts/game, "
-              f"{home_vs_similar_off['avg_ypp_allowed']:.1f} ypp ({home_vs_similar_off['win_rate']:.1%} win rate)")
+        if verbose:
+            emit(f"Similar Matchup History:")
+            emit(f"  {home_team} defense vs {away_style.replace('_', '-')} offenses ({home_vs_similar_off['games']} games):")
+            emit(f"    Allowed {home_vs_similar_off['avg_points_allowed']:.1f} pts/game, "
+                 f"{home_vs_similar_off['avg_ypp_allowed']:.1f} ypp ({home_vs_similar_off['win_rate']:.1%} win rate)")
         
         # Compare to overall defensive average
         if home_vs_similar_off['avg_points_allowed'] < home_avg['defense']['points_allowed'] - 3:
             home_points += 1.5
-            print(f"    >> {home_team} defense performs BETTER vs {away_style.replace('_', ' ')} teams (+1.5)")
+            if verbose:
+                emit(f"    >> {home_team} defense performs BETTER vs {away_style.replace('_', ' ')} teams (+1.5)")
         elif home_vs_similar_off['avg_points_allowed'] > home_avg['defense']['points_allowed'] + 3:
             away_points += 1.5
-            print(f"    >> {home_team} defense struggles vs {away_style.replace('_', ' ')} teams (+1.5 to {away_team})")
+            if verbose:
+                emit(f"    >> {home_team} defense struggles vs {away_style.replace('_', ' ')} teams (+1.5 to {away_team})")
     
     if away_vs_similar_off and away_vs_similar_off['games'] >= 2:
-        print(f"  {away_team} defense vs {home_style.replace('_', '-')} offenses ({away_vs_similar_off['games']} games):")
-        print(f"    Allowed {away_vs_similar_off['avg_points_allowed']:.1f} pts/game, "
-              f"{away_vs_similar_off['avg_ypp_allowed']:.1f} ypp ({away_vs_similar_off['win_rate']:.1%} win rate)")
+        if verbose:
+            emit(f"  {away_team} defense vs {home_style.replace('_', '-')} offenses ({away_vs_similar_off['games']} games):")
+            emit(f"    Allowed {away_vs_similar_off['avg_points_allowed']:.1f} pts/game, "
+                 f"{away_vs_similar_off['avg_ypp_allowed']:.1f} ypp ({away_vs_similar_off['win_rate']:.1%} win rate)")
         
         # Compare to overall defensive average
         if away_vs_similar_off['avg_points_allowed'] < away_avg['defense']['points_allowed'] - 3:
             away_points += 1.5
-            print(f"    >> {away_team} defense performs BETTER vs {home_style.replace('_', ' ')} teams (+1.5)")
+            if verbose:
+                emit(f"    >> {away_team} defense performs BETTER vs {home_style.replace('_', ' ')} teams (+1.5)")
         elif away_vs_similar_off['avg_points_allowed'] > away_avg['defense']['points_allowed'] + 3:
             home_points += 1.5
-            print(f"    >> {away_team} defense struggles vs {home_style.replace('_', ' ')} teams (+1.5 to {home_team})")
+            if verbose:
+                emit(f"    >> {away_team} defense struggles vs {home_style.replace('_', ' ')} teams (+1.5 to {home_team})")
     
-    print()
+    if verbose:
+        emit()
     
     # 1. offensive vs defensive matchup
     # home offense vs away defense
     home_off_vs_away_def = home_avg['offense']['yards_per_play'] / (away_avg['defense']['yards_per_play_allowed'] + 0.1)
     away_off_vs_home_def = away_avg['offense']['yards_per_play'] / (home_avg['defense']['yards_per_play_allowed'] + 0.1)
     
-    print(f"Offensive Efficiency vs Defense:")
-    print(f"  {home_team} offense vs {away_team} defense: {home_off_vs_away_def:.2f} ratio")
-    if home_off_vs_away_def > 1.2:
-        home_points += 3.5
-        print(f"    >> Dominant advantage for {home_team} (+3.5)")
-    elif home_off_vs_away_def > 1.1:
-        home_points += 2.5
-        print(f"    >> Strong advantage for {home_team} (+2.5)")
-    elif home_off_vs_away_def > 1.0:
-        home_points += 1.5
-        print(f"    >> Slight advantage for {home_team} (+1.5)")
-    elif home_off_vs_away_def < 0.85:
-        away_points += 2.0
-        print(f"    >> {away_team} defense dominates (+2.0 to {away_team})")
-    elif home_off_vs_away_def < 0.95:
-        away_points += 1.0
-        print(f"    >> {away_team} defense has advantage (+1.0 to {away_team})")
-    
-    print(f"  {away_team} offense vs {home_team} defense: {away_off_vs_home_def:.2f} ratio")
-    if away_off_vs_home_def > 1.2:
-        away_points += 3.5
-        print(f"    >> Dominant advantage for {away_team} (+3.5)")
-    elif away_off_vs_home_def > 1.1:
-        away_points += 2.5
-        print(f"    >> Strong advantage for {away_team} (+2.5)")
-    elif away_off_vs_home_def > 1.0:
-        away_points += 1.5
-        print(f"    >> Slight advantage for {away_team} (+1.5)")
-    elif away_off_vs_home_def < 0.85:
-        home_points += 2.0
-        print(f"    >> {home_team} defense dominates (+2.0 to {home_team})")
-    elif away_off_vs_home_def < 0.95:
-        home_points += 1.0
-        print(f"    >> {home_team} defense has advantage (+1.0 to {home_team})")
+    if verbose:
+        emit(f"Offensive Efficiency vs Defense:")
+        emit(f"  {home_team} offense vs {away_team} defense: {home_off_vs_away_def:.2f} ratio")
+    gained, conceded, message = score_ladder(EFFICIENCY_LADDER, home_off_vs_away_def, home_team, away_team, verbose)
+    home_points += gained
+    away_points += conceded
+    if message:
+        emit(message)
+    
+    if verbose:
+        emit(f"  {away_team} offense vs {home_team} defense: {away_off_vs_home_def:.2f} ratio")
+    gained, conceded, message = score_ladder(EFFICIENCY_LADDER, away_off_vs_home_def, away_team, home_team, verbose)
+    away_points += gained
+    home_points += conceded
+    if message:
+        emit(message)
     
     # 2. run game vs run defense
-    print(f"\nRun Game Matchup:")
+    if verbose:
+        emit(f"\nRun Game Matchup:")
     home_rush_vs_away_rush_d = home_avg['offense']['rushing_yards'] / (away_avg['defense']['rushing_yards_allowed'] + 0.1)
     away_rush_vs_home_rush_d = away_avg['offense']['rushing_yards'] / (home_avg['defense']['rushing_yards_allowed'] + 0.1)
     
-    print(f"  {home_team} rush ({home_avg['offense']['rushing_yards']:.1f} yds/g) vs "
-          f"{away_team} rush D ({away_avg['defense']['rushing_yards_allowed']:.1f} yds/g allowed): {home_rush_vs_away_rush_d:.2f} ratio")
-    if home_rush_vs_away_rush_d > 1.3:
-        home_points += 2.5
-        print(f"    >> Strong run game advantage for {home_team} (+2.5)")
-    elif home_rush_vs_away_rush_d > 1.1:
-        home_points += 1.5
-        print(f"    >> Moderate run game advantage for {home_team} (+1.5)")
-    elif home_rush_vs_away_rush_d > 1.0:
-        home_points += 0.75
-        print(f"    >> Slight run game advantage for {home_team} (+0.75)")
-    
-    print(f"  {away_team} rush ({away_avg['offense']['rushing_yards']:.1f} yds/g) vs "
-          f"{home_team} rush D ({home_avg['defense']['rushing_yards_allowed']:.1f} yds/g allowed): {away_rush_vs_home_rush_d:.2f} ratio")
-    if away_rush_vs_home_rush_d > 1.3:
-        away_points += 2.5
-        print(f"    >> Strong run game advantage for {away_team} (+2.5)")
-    elif away_rush_vs_home_rush_d > 1.1:
-        away_points += 1.5
-        print(f"    >> Moderate run game advantage for {away_team} (+1.5)")
-    elif away_rush_vs_home_rush_d > 1.0:
-        away_points += 0.75
-        print(f"    >> Slight run game advantage for {away_team} (+0.75)")
+    if verbose:
+        emit(f"  {home_team} rush ({home_avg['offense']['rushing_yards']:.1f} yds/g) vs "
+             f"{away_team} rush D ({away_avg['defense']['rushing_yards_allowed']:.1f} yds/g allowed): {home_rush_vs_away_rush_d:.2f} ratio")
+    gained, conceded, message = score_ladder(RUN_GAME_LADDER, home_rush_vs_away_rush_d, home_team, away_team, verbose)
+    home_points += gained
+    away_points += conceded
+    if message:
+        emit(message)
+    
+    if verbose:
+        emit(f"  {away_team} rush ({away_avg['offense']['rushing_yards']:.1f} yds/g) vs "
+             f"{home_team} rush D ({home_avg['defense']['rushing_yards_allowed']:.1f} yds/g allowed): {away_rush_vs_home_rush_d:.2f} ratio")
+    gained, conceded, message = score_ladder(RUN_GAME_LADDER, away_rush_vs_home_rush_d, away_team, home_team, verbose)
+    away_points += gained
+    home_points += conceded
+    if message:
+        emit(message)
     
     # 3. pass game vs pass defense
-    print(f"\nPass Game Matchup:")
+    if verbose:
+        emit(f"\nPass Game Matchup:")
     home_pass_vs_away_pass_d = home_avg['offense']['passing_yards'] / (away_avg['defense']['passing_yards_allowed'] + 0.1)
     away_pass_vs_home_pass_d = away_avg['offense']['passing_yards'] / (home_avg['defense']['passing_yards_allowed'] + 0.1)
     
-    print(f"  {home_team} pass ({home_avg['offense']['passing_yards']:.1f} yds/g) vs "
-          f"{away_team} pass D ({away_avg['defense']['passing_yards_allowed']:.1f} yds/g allowed): {home_pass_vs_away_pass_d:.2f} ratio")
-    if home_pass_vs_away_pass_d > 1.3:
-        home_points += 2.5
-        print(f"    >> Strong pass game advantage for {home_team} (+2.5)")
-    elif home_pass_vs_away_pass_d > 1.1:
-        home_points += 1.5
-        print(f"    >> Moderate pass game advantage for {home_team} (+1.5)")
-    elif home_pass_vs_away_pass_d > 1.0:
-        home_points += 0.75
-        print(f"    >> Slight pass game advantage for {home_team} (+0.75)")
-    
-    print(f"  {away_team} pass ({away_avg['offense']['passing_yards']:.1f} yds/g) vs "
-          f"{home_team} pass D ({home_avg['defense']['passing_yards_allowed']:.1f} yds/g allowed): {away_pass_vs_home_pass_d:.2f} ratio")
-    if away_pass_vs_home_pass_d > 1.3:
-        away_points += 2.5
-        print(f"    >> Strong pass game advantage for {away_team} (+2.5)")
-    elif away_pass_vs_home_pass_d > 1.1:
-        away_points += 1.5
-        print(f"    >> Moderate pass game advantage for {away_team} (+1.5)")
-    elif away_pass_vs_home_pass_d > 1.0:
-        away_points += 0.75
-        print(f"    >> Slight pass game advantage for {away_team} (+0.75)")
+    if verbose:
+        emit(f"  {home_team} pass ({home_avg['offense']['passing_yards']:.1f} yds/g) vs "
+             f"{away_team} pass D ({away_avg['defense']['passing_yards_allowed']:.1f} yds/g allowed): {home_pass_vs_away_pass_d:.2f} ratio")
+    gained, conceded, message = score_ladder(PASS_GAME_LADDER, home_pass_vs_away_pass_d, home_team, away_team, verbose)
+    home_points += gained
+    away_points += conceded
+    if message:
+        emit(message)
+    
+    if verbose:
+        emit(f"  {away_team} pass ({away_avg['offense']['passing_yards']:.1f} yds/g) vs "
+             f"{home_team} pass D ({home_avg['defense']['passing_yards_allowed']:.1f} yds/g allowed): {away_pass_vs_home_pass_d:.2f} ratio")
+    gained, conceded, message = score_ladder(PASS_GAME_LADDER, away_pass_vs_home_pass_d, away_team, home_team, verbose)
+    away_points += gained
+    home_points += conceded
+    if message:
+        emit(message)
     
     # 4. scoring efficiency
-    print(f"\nScoring Efficiency:")
+    if verbose:
+        emit(f"\nScoring Efficiency:")
     points_ratio_home = home_avg['offense']['points_scored'] / (away_avg['defense']['points_allowed'] + 0.1)
     points_ratio_away = away_avg['offense']['points_scored'] / (home_avg['defense']['points_allowed'] + 0.1)
     
-    print(f"  {home_team}: {home_avg['offense']['points_scored']:.1f} avg pts vs "
-          f"{away_team} allowing {away_avg['defense']['points_allowed']:.1f} avg")
-    if points_ratio_home > 1.25:
-        home_points += 2.5
-        print(f"    >> {home_team} likely to score heavily (+2.5)")
-    elif points_ratio_home > 1.15:
-        home_points += 1.5
-        print(f"    >> {home_team} likely to score well (+1.5)")
-    
-    print(f"  {away_team}: {away_avg['offense']['points_scored']:.1f} avg pts vs "
-          f"{home_team} allowing {home_avg['defense']['points_allowed']:.1f} avg")
-    if points_ratio_away > 1.25:
-        away_points += 2.5
-        print(f"    >> {away_team} likely to score heavily (+2.5)")
-    elif points_ratio_away > 1.15:
-        away_points += 1.5
-        print(f"    >> {away_team} likely to score well (+1.5)")
+    if verbose:
+        emit(f"  {home_team}: {home_avg['offense']['points_scored']:.1f} avg pts vs "
+             f"{away_team} allowing {away_avg['defense']['points_allowed']:.1f} avg")
+    gained, conceded, message = score_ladder(SCORING_LADDER, points_ratio_home, home_team, away_team, verbose)
+    home_points += gained
+    away_points += conceded
+    if message:
+        emit(message)
+    
+    if verbose:
+        emit(f"  {away_team}: {away_avg['offense']['points_scored']:.1f} avg pts vs "
+             f"{home_team} allowing {home_avg['defense']['points_allowed']:.1f} avg")
+    gained, conceded, message = score_ladder(SCORING_LADDER, points_ratio_away, away_team, home_team, verbose)
+    away_points += gained
+    home_points += conceded
+    if message:
+        emit(message)
     
     # NEW: Third Down Conversion Matchup
-    print(f"\nThird Down Efficiency:")
+    if verbose:
+        emit(f"\nThird Down Efficiency:")
     home_3rd_advantage = home_avg['offense']['third_down_rate'] - away_avg['defense']['yards_per_play_allowed'] / 10  # proxy for 3rd down defense
     away_3rd_advantage = away_avg['offense']['third_down_rate'] - home_avg['defense']['yards_per_play_allowed'] / 10
     
-    print(f"  {home_team} 3rd down: {home_avg['offense']['third_down_rate']:.1%}")
-    print(f"  {away_team} 3rd down: {away_avg['offense']['third_down_rate']:.1%}")
+    if verbose:
+        emit(f"  {home_team} 3rd down: {home_avg['offense']['third_down_rate']:.1%}")
+        emit(f"  {away_team} 3rd down: {away_avg['offense']['third_down_rate']:.1%}")
     
     third_down_diff = home_avg['offense']['third_down_rate'] - away_avg['offense']['third_down_rate']
     if third_down_diff > 0.08:
         home_points += 1.5
-        print(f"    >> {home_team} has significant 3rd down advantage (+1.5)")
+        if verbose:
+            emit(f"    >> {home_team} has significant 3rd down advantage (+1.5)")
     elif third_down_diff > 0.04:
         home_points += 0.75
-        print(f"    >> {home_team} has 3rd down advantage (+0.75)")
+        if verbose:
+            emit(f"    >> {home_team} has 3rd down advantage (+0.75)")
     elif third_down_diff < -0.08:
         away_points += 1.5
-        print(f"    >> {away_team} has significant 3rd down advantage (+1.5)")
+        if verbose:
+            emit(f"    >> {away_team} has significant 3rd down advantage (+1.5)")
     elif third_down_diff < -0.04:
         away_points += 0.75
-        print(f"    >> {away_team} has 3rd down advantage (+0.75)")
+        if verbose:
+            emit(f"    >> {away_team} has 3rd down advantage (+0.75)")
     
     # NEW: Sack Differential (Pass Rush Pressure)
-    print(f"\nPass Rush Pressure (Sacks):")
+    if verbose:
+        emit(f"\nPass Rush Pressure (Sacks):")
     home_sack_diff = home_avg['offense']['sacks_made'] - home_avg['defense']['sacks_allowed']
     away_sack_diff = away_avg['offense']['sacks_made'] - away_avg['defense']['sacks_allowed']
     
-    print(f"  {home_team}: {home_avg['offense']['sacks_made']:.1f} sacks/game, {home_avg['defense']['sacks_allowed']:.1f} allowed (diff: {home_sack_diff:+.1f})")
-    print(f"  {away_team}: {away_avg['offense']['sacks_made']:.1f} sacks/game, {away_avg['defense']['sacks_allowed']:.1f} allowed (diff: {away_sack_diff:+.1f})")
+    if verbose:
+        emit(f"  {home_team}: {home_avg['offense']['sacks_made']:.1f} sacks/game, {home_avg['defense']['sacks_allowed']:.1f} allowed (diff: {home_sack_diff:+.1f})")
+        emit(f"  {away_team}: {away_avg['offense']['sacks_made']:.1f} sacks/game, {away_avg['defense']['sacks_allowed']:.1f} allowed (diff: {away_sack_diff:+.1f})")
     
     sack_matchup_diff = home_sack_diff - away_sack_diff
     if sack_matchup_diff > 1.0:
         home_points += 1.5
-        print(f"    >> {home_team} has strong pass rush advantage (+1.5)")
+        if verbose:
+            emit(f"    >> {home_team} has strong pass rush advantage (+1.5)")
     elif sack_matchup_diff > 0.5:
         home_points += 0.75
-        print(f"    >> {home_team} has pass rush advantage (+0.75)")
+        if verbose:
+            emit(f"    >> {home_team} has pass rush advantage (+0.75)")
     elif sack_matchup_diff < -1.0:
         away_points += 1.5
-        print(f"    >> {away_team} has strong pass rush advantage (+1.5)")
+        if verbose:
+            emit(f"    >> {away_team} has strong pass rush advantage (+1.5)")
     elif sack_matchup_diff < -0.5:
         away_points += 0.75
-        print(f"    >> {away_team} has pass rush advantage (+0.75)")
+        if verbose:
+            emit(f"    >> {away_team} has pass rush advantage (+0.75)")
     
     # 5. momentum/recent form
-    print(f"\nMomentum & Recent Form:")
+    if verbose:
+        emit(f"\nMomentum & Recent Form:")
     home_momentum = home_avg['recent_form']['win_rate']
     away_momentum = away_avg['recent_form']['win_rate']
     
-    print(f"  {home_team}: {home_avg['recent_form']['wins']}-{home_avg['recent_form']['games'] - home_avg['recent_form']['wins']} "
-          f"in last {home_avg['recent_form']['games']}, scoring {home_avg['recent_form']['points_scored']:.1f} pts/game")
-    print(f"  {away_team}: {away_avg['recent_form']['wins']}-{away_avg['recent_form']['games'] - away_avg['recent_form']['wins']} "
-          f"in last {away_avg['recent_form']['games']}, scoring {away_avg['recent_form']['points_scored']:.1f} pts/game")
+    if verbose:
+        emit(f"  {home_team}: {home_avg['recent_form']['wins']}-{home_avg['recent_form']['games'] - home_avg['recent_form']['wins']} "
+             f"in last {home_avg['recent_form']['games']}, scoring {home_avg['recent_form']['points_scored']:.1f} pts/game")
+        emit(f"  {away_team}: {away_avg['recent_form']['wins']}-{away_avg['recent_form']['games'] - away_avg['recent_form']['wins']} "
+             f"in last {away_avg['recent_form']['games']}, scoring {away_avg['recent_form']['points_scored']:.1f} pts/game")
     
     # hot team bonus
     if home_momentum == 1.0 and home_avg['recent_form']['games'] >= 3:
         home_points += 2.0
-        print(f"  >> {home_team} is on a HOT STREAK (+2.0)")
+        if verbose:
+            emit(f"  >> {home_team} is on a HOT STREAK (+2.0)")
     elif home_momentum >= 0.67:
         home_points += 1.0
-        print(f"  >> {home_team} has positive momentum (+1.0)")
+        if verbose:
+            emit(f"  >> {home_team} has positive momentum (+1.0)")
     elif home_momentum == 0.0 and home_avg['recent_form']['games'] >= 3:
         away_points += 1.5
-        print(f"  >> {home_team} struggling lately (+1.5 to {away_team})")
+        if verbose:
+            emit(f"  >> {home_team} struggling lately (+1.5 to {away_team})")
     
     if away_momentum == 1.0 and away_avg['recent_form']['games'] >= 3:
         away_points += 2.0
-        print(f"  >> {away_team} is on a HOT STREAK (+2.0)")
+        if verbose:
+            emit(f"  >> {away_team} is on a HOT STREAK (+2.0)")
     elif away_momentum >= 0.67:
         away_points += 1.0
-        print(f"  >> {away_team} has positive momentum (+1.0)")
+        if verbose:
+            emit(f"  >> {away_team} has positive momentum (+1.0)")
     elif away_momentum == 0.0 and away_avg['recent_form']['games'] >= 3:
         home_points += 1.5
-        print(f"  >> {away_team} struggling lately (+1.5 to {home_team})")
+        if verbose:
+            emit(f"  >> {away_team} struggling lately (+1.5 to {home_team})")
     
     # 6. opponent quality adjustment (only if you have a winning record)
-    print(f"\nOpponent Quality Adjustment:")
+    if verbose:
+        emit(f"\nOpponent Quality Adjustment:")
     # only give credit for tough schedule if you're actually winning
     if home_avg['win_rate'] >= 0.5 and home_opp_quality > away_opp_quality + 0.15:
         home_points += 1.5
-        print(f"  {home_team} winning despite tough schedule (+1.5)")
+        if verbose:
+            emit(f"  {home_team} winning despite tough schedule (+1.5)")
     elif home_avg['win_rate'] >= 0.5 and home_opp_quality > away_opp_quality + 0.05:
         home_points += 0.75
-        print(f"  {home_team} has faced tougher opponents (+0.75)")
+        if verbose:
+            emit(f"  {home_team} has faced tougher opponents (+0.75)")
     elif away_avg['win_rate'] >= 0.5 and away_opp_quality > home_opp_quality + 0.15:
         away_points += 1.5
-        print(f"  {away_team} winning despite tough schedule (+1.5)")
+        if verbose:
+            emit(f"  {away_team} winning despite tough schedule (+1.5)")
     elif away_avg['win_rate'] >= 0.5 and away_opp_quality > home_opp_quality + 0.05:
         away_points += 0.75
-        print(f"  {away_team} has faced tougher opponents (+0.75)")
+        if verbose:
+            emit(f"  {away_team} has faced tougher opponents (+0.75)")
     else:
-        print(f"  Similar opponent quality or not applicable")
+        if verbose:
+            emit(f"  Similar opponent quality or not applicable")
     
     # NEW: Strength-Adjusted Performance
-    print(f"\nStrength-of-Schedule Adjustment (Defensive Quality Faced):")
-    print(f"  {home_team}: {home_strength_adj['adjustment_factor']:.2f}x adjustment "
-          f"(faced defenses ranked {home_strength_adj['avg_opp_def_rank']:.2f})")
-    print(f"  {away_team}: {away_strength_adj['adjustment_factor']:.2f}x adjustment "
-          f"(faced defenses ranked {away_strength_adj['avg_opp_def_rank']:.2f})")
+    if verbose:
+        emit(f"\nStrength-of-Schedule Adjustment (Defensive Quality Faced):")
+        emit(f"  {home_team}: {home_strength_adj.adjustment_factor:.2f}x adjustment "
+             f"(faced defenses ranked {home_strength_adj.avg_opp_def_rank:.2f})")
+        emit(f"  {away_team}: {away_strength_adj.adjustment_factor:.2f}x adjustment "
+             f"(faced defenses ranked {away_strength_adj.avg_opp_def_rank:.2f})")
     
     # Award points for playing well against tough defenses
-    if home_strength_adj['faced_tough_defenses'] and home_avg['offense']['points_scored'] > 22:
+    if home_strength_adj.faced_tough_defenses and home_avg['offense']['points_scored'] > 22:
         home_points += 1.5
-        print(f"    >> {home_team} scoring well vs ELITE defenses (+1.5)")
-    elif home_strength_adj['faced_weak_defenses']:
+        if verbose:
+            emit(f"    >> {home_team} scoring well vs ELITE defenses (+1.5)")
+    elif home_strength_adj.faced_weak_defenses:
         # stat-padding penalty - good stats against bad teams don't count as much
         home_points -= 2.0
-        print(f"    >> {home_team} stat-padding vs WEAK defenses (-2.0)")
+        if verbose:
+            emit(f"    >> {home_team} stat-padding vs WEAK defenses (-2.0)")
     
-    if away_strength_adj['faced_tough_defenses'] and away_avg['offense']['points_scored'] > 22:
+    if away_strength_adj.faced_tough_defenses and away_avg['offense']['points_scored'] > 22:
         away_points += 1.5
-        print(f"    >> {away_team} scoring well vs ELITE defenses (+1.5)")
-    elif away_strength_adj['faced_weak_defenses']:
+        if verbose:
+            emit(f"    >> {away_team} scoring well vs ELITE defenses (+1.5)")
+    elif away_strength_adj.faced_weak_defenses:
         # stat-padding penalty - good stats against bad teams don't count as much
         away_points -= 2.0
-        print(f"    >> {away_team} stat-padding vs WEAK defenses (-2.0)")
+        if verbose:
+            emit(f"    >> {away_team} stat-padding vs WEAK defenses (-2.0)")
     
     # NEW: Close Game Performance
-    print(f"\nClose Game Performance (≤7 points):")
-    print(f"  {home_team}: {home_avg['close_games']['wins']}-{home_avg['close_games']['total'] - home_avg['close_games']['wins']} "
-          f"({home_avg['close_games']['win_rate']:.1%}) in close games")
-    print(f"  {away_team}: {away_avg['close_games']['wins']}-{away_avg['close_games']['total'] - away_avg['close_games']['wins']} "
-          f"({away_avg['close_games']['win_rate']:.1%}) in close games")
+    if verbose:
+        emit(f"\nClose Game Performance (≤7 points):")
+        emit(f"  {home_team}: {home_avg['close_games']['wins']}-{home_avg['close_games']['total'] - home_avg['close_games']['wins']} "
+             f"({home_avg['close_games']['win_rate']:.1%}) in close games")
+        emit(f"  {away_team}: {away_avg['close_games']['wins']}-{away_avg['close_games']['total'] - away_avg['close_games']['wins']} "
+             f"({away_avg['close_games']['win_rate']:.1%}) in close games")
     
     if home_avg['close_games']['total'] >= 3 and home_avg['close_games']['win_rate'] > 0.60:
         home_points += 1.0
-        print(f"    >> {home_team} excels in close games (+1.0)")
+        if verbose:
+            emit(f"    >> {home_team} excels in close games (+1.0)")
     if away_avg['close_games']['total'] >= 3 and away_avg['close_games']['win_rate'] > 0.60:
         away_points += 1.0
-        print(f"    >> {away_team} excels in close games (+1.0)")
+        if verbose:
+            emit(f"    >> {away_team} excels in close games (+1.0)")
     
     # 7. UPDATED: Dynamic Home Field Advantage
     if is_neutral:
-        print(f"\nHome Field Advantage: NEUTRAL SITE (no advantage)")
+        if verbose:
+            emit(f"\nHome Field Advantage: NEUTRAL SITE (no advantage)")
     else:
         # Calculate dynamic home field advantage based on actual home/away split
         home_advantage_strength = home_avg['splits']['home_advantage']
@@ -1502,123 +1540,134 @@ def advanced_prediction(home_team, away_team, teams_data, is_neutral=False, inju
         # Winless at home = NO home field advantage
         if home_avg['splits']['home_win_rate'] == 0:
             hfa_points = 0.0
-            print(f"\nHome Field Advantage: NONE (+0.0)")
-            print(f"  {home_team} is WINLESS at home (0% home win rate)")
-        elif home_advantage_strength > 0.25:  # Dominant home team
-            hfa_points = 3.0
-            print(f"\nHome Field Advantage: {home_team} has DOMINANT home advantage (+3.0)")
-            print(f"  ({home_avg['splits']['home_win_rate']:.1%} home vs {home_avg['splits']['away_win_rate']:.1%} away)")
-        elif home_advantage_strength > 0.15:  # Strong home team
-            hfa_points = 2.5
-            print(f"\nHome Field Advantage: {home_team} has STRONG home advantage (+2.5)")
-            print(f"  ({home_avg['splits']['home_win_rate']:.1%} home vs {home_avg['splits']['away_win_rate']:.1%} away)")
-        elif home_advantage_strength > 0.05:  # Moderate home team
-            hfa_points = 2.0
-            print(f"\nHome Field Advantage: {home_team} has moderate home advantage (+2.0)")
-            print(f"  ({home_avg['splits']['home_win_rate']:.1%} home vs {home_avg['splits']['away_win_rate']:.1%} away)")
-        elif home_advantage_strength < -0.10:  # Actually worse at home!
-            hfa_points = 0.5
-            print(f"\nHome Field Advantage: {home_team} minimal advantage (+0.5)")
-            print(f"  WARNING: Team performs worse at home ({home_avg['splits']['home_win_rate']:.1%} home vs {home_avg['splits']['away_win_rate']:.1%} away)")
-        else:  # Neutral home effect
-            hfa_points = 1.5
-            print(f"\nHome Field Advantage: {home_team} slight advantage (+1.5)")
-            print(f"  ({home_avg['splits']['home_win_rate']:.1%} home vs {home_avg['splits']['away_win_rate']:.1%} away)")
+            if verbose:
+                emit(f"\nHome Field Advantage: NONE (+0.0)")
+                emit(f"  {home_team} is WINLESS at home (0% home win rate)")
+        else:
+            hfa_points, hfa_message, _ = ladder_rung(HFA_LADDER, home_advantage_strength) or (*HFA_NEUTRAL, True)
+            if verbose:
+                emit(hfa_message.format(team=home_team, points=hfa_points,
+                                        home_rate=home_avg['splits']['home_win_rate'],
+                                        away_rate=home_avg['splits']['away_win_rate']))
         
         home_points += hfa_points
         
         # NEW: Home vs Away Performance Matchup
-        print(f"\n  Home/Away Matchup Comparison:")
-        print(f"    {home_team} at home: {home_avg['splits']['home_win_rate']:.1%}")
-        print(f"    {away_team} on road: {away_avg['splits']['away_win_rate']:.1%}")
+        if verbose:
+            emit(f"\n  Home/Away Matchup Comparison:")
+            emit(f"    {home_team} at home: {home_avg['splits']['home_win_rate']:.1%}")
+            emit(f"    {away_team} on road: {away_avg['splits']['away_win_rate']:.1%}")
         
         # If away team is excellent on the road, reduce home field advantage
         if away_avg['splits']['away_win_rate'] >= 0.70:  # Great road team
             if away_avg['splits']['away_win_rate'] > home_avg['splits']['home_win_rate']:
                 away_points += 1.5
-                print(f"    >> {away_team} is ELITE on the road and better than {home_team} at home (+1.5 to {away_team})")
+                if verbose:
+                    emit(f"    >> {away_team} is ELITE on the road and better than {home_team} at home (+1.5 to {away_team})")
             else:
                 away_points += 1.0
-                print(f"    >> {away_team} is excellent on the road (+1.0)")
+                if verbose:
+                    emit(f"    >> {away_team} is excellent on the road (+1.0)")
         elif away_avg['splits']['away_win_rate'] < 0.30:  # Poor road team
             home_points += 0.5
-            print(f"    >> {away_team} struggles on the road (+0.5 to {home_team})")
+            if verbose:
+                emit(f"    >> {away_team} struggles on the road (+0.5 to {home_team})")
     
     # QB Completion % Matchup
-    print(f"\nQB Passing Accuracy:")
+    if verbose:
+        emit(f"\nQB Passing Accuracy:")
     home_comp_vs_away_def = home_avg['offense']['completion_rate'] - away_avg['defense']['completion_allowed']
     away_comp_vs_home_def = away_avg['offense']['completion_rate'] - home_avg['defense']['completion_allowed']
     
-    print(f"  {home_team} QB: {home_avg['offense']['completion_rate']:.1%} vs {away_team} allowing {away_avg['defense']['completion_allowed']:.1%}")
+    if verbose:
+        emit(f"  {home_team} QB: {home_avg['offense']['completion_rate']:.1%} vs {away_team} allowing {away_avg['defense']['completion_allowed']:.1%}")
     if home_comp_vs_away_def > 0.10:
         home_points += 2.0
-        print(f"    >> {home_team} QB should have high completion rate (+2.0)")
+        if verbose:
+            emit(f"    >> {home_team} QB should have high completion rate (+2.0)")
     elif home_comp_vs_away_def > 0.05:
         home_points += 1.0
-        print(f"    >> {home_team} QB has accuracy advantage (+1.0)")
+        if verbose:
+            emit(f"    >> {home_team} QB has accuracy advantage (+1.0)")
     elif home_comp_vs_away_def < -0.10:
         away_points += 1.5
-        print(f"    >> {away_team} pass defense should limit completions (+1.5 to {away_team})")
+        if verbose:
+            emit(f"    >> {away_team} pass defense should limit completions (+1.5 to {away_team})")
     
-    print(f"  {away_team} QB: {away_avg['offense']['completion_rate']:.1%} vs {home_team} allowing {home_avg['defense']['completion_allowed']:.1%}")
+    if verbose:
+        emit(f"  {away_team} QB: {away_avg['offense']['completion_rate']:.1%} vs {home_team} allowing {home_avg['defense']['completion_allowed']:.1%}")
     if away_comp_vs_home_def > 0.10:
         away_points += 2.0
-        print(f"    >> {away_team} QB should have high completion rate (+2.0)")
+        if verbose:
+            emit(f"    >> {away_team} QB should have high completion rate (+2.0)")
     elif away_comp_vs_home_def > 0.05:
         away_points += 1.0
-        print(f"    >> {away_team} QB has accuracy advantage (+1.0)")
+        if verbose:
+            emit(f"    >> {away_team} QB has accuracy advantage (+1.0)")
     elif away_comp_vs_home_def < -0.10:
         home_points += 1.5
-        print(f"    >> {home_team} pass defense should limit completions (+1.5 to {home_team})")
+        if verbose:
+            emit(f"    >> {home_team} pass defense should limit completions (+1.5 to {home_team})")
     
     # Red Zone Efficiency Matchup (ACTUAL red zone TD%)
-    print(f"\nRed Zone TD% Matchup:")
-    print(f"  {home_team} RZ: {home_avg['offense']['red_zone_rate']:.1%} TD rate vs {away_team} allowing {away_avg['defense']['red_zone_allowed']:.1%}")
-    print(f"  {away_team} RZ: {away_avg['offense']['red_zone_rate']:.1%} TD rate vs {home_team} allowing {home_avg['defense']['red_zone_allowed']:.1%}")
+    if verbose:
+        emit(f"\nRed Zone TD% Matchup:")
+        emit(f"  {home_team} RZ: {home_avg['offense']['red_zone_rate']:.1%} TD rate vs {away_team} allowing {away_avg['defense']['red_zone_allowed']:.1%}")
+        emit(f"  {away_team} RZ: {away_avg['offense']['red_zone_rate']:.1%} TD rate vs {home_team} allowing {home_avg['defense']['red_zone_allowed']:.1%}")
     
     home_rz_advantage = home_avg['offense']['red_zone_rate'] - away_avg['defense']['red_zone_allowed']
     away_rz_advantage = away_avg['offense']['red_zone_rate'] - home_avg['defense']['red_zone_allowed']
     
     if home_rz_advantage > 0.15:
         home_points += 2.5
-        print(f"    >> {home_team} excellent red zone matchup (+2.5)")
+        if verbose:
+            emit(f"    >> {home_team} excellent red zone matchup (+2.5)")
     elif home_rz_advantage > 0.08:
         home_points += 1.5
-        print(f"    >> {home_team} favorable red zone matchup (+1.5)")
+        if verbose:
+            emit(f"    >> {home_team} favorable red zone matchup (+1.5)")
     
     if away_rz_advantage > 0.15:
         away_points += 2.5
-        print(f"    >> {away_team} excellent red zone matchup (+2.5)")
+        if verbose:
+            emit(f"    >> {away_team} excellent red zone matchup (+2.5)")
     elif away_rz_advantage > 0.08:
         away_points += 1.5
-        print(f"    >> {away_team} favorable red zone matchup (+1.5)")
+        if verbose:
+            emit(f"    >> {away_team} favorable red zone matchup (+1.5)")
     
     # Rushing Efficiency (yards per carry)
-    print(f"\nRushing Efficiency (Yards Per Carry):")
-    print(f"  {home_team}: {home_avg['offense']['rushing_avg']:.1f} ypc vs {away_team} allowing {away_avg['defense']['rushing_avg_allowed']:.1f} ypc")
-    print(f"  {away_team}: {away_avg['offense']['rushing_avg']:.1f} ypc vs {home_team} allowing {home_avg['defense']['rushing_avg_allowed']:.1f} ypc")
+    if verbose:
+        emit(f"\nRushing Efficiency (Yards Per Carry):")
+        emit(f"  {home_team}: {home_avg['offense']['rushing_avg']:.1f} ypc vs {away_team} allowing {away_avg['defense']['rushing_avg_allowed']:.1f} ypc")
+        emit(f"  {away_team}: {away_avg['offense']['rushing_avg']:.1f} ypc vs {home_team} allowing {home_avg['defense']['rushing_avg_allowed']:.1f} ypc")
     
     home_rush_eff_adv = home_avg['offense']['rushing_avg'] - away_avg['defense']['rushing_avg_allowed']
     away_rush_eff_adv = away_avg['offense']['rushing_avg'] - home_avg['defense']['rushing_avg_allowed']
     
     if home_rush_eff_adv > 1.5:
         home_points += 2.0
-        print(f"    >> {home_team} should dominate on the ground (+2.0)")
+        if verbose:
+            emit(f"    >> {home_team} should dominate on the ground (+2.0)")
     elif home_rush_eff_adv > 0.8:
         home_points += 1.0
-        print(f"    >> {home_team} has rushing efficiency edge (+1.0)")
+        if verbose:
+            emit(f"    >> {home_team} has rushing efficiency edge (+1.0)")
     
     if away_rush_eff_adv > 1.5:
         away_points += 2.0
-        print(f"    >> {away_team} should dominate on the ground (+2.0)")
+        if verbose:
+            emit(f"    >> {away_team} should dominate on the ground (+2.0)")
     elif away_rush_eff_adv > 0.8:
         away_points += 1.0
-        print(f"    >> {away_team} has rushing efficiency edge (+1.0)")
+        if verbose:
+            emit(f"    >> {away_team} has rushing efficiency edge (+1.0)")
     
     # Interception/Takeaway Differential
-    print(f"\nTakeaway Battle (Interceptions):")
-    print(f"  {home_team}: {home_avg['offense']['interceptions_thrown']:.1f} INTs thrown/game, {home_avg['defense']['interceptions_forced']:.1f} INTs forced/game")
-    print(f"  {away_team}: {away_avg['offense']['interceptions_thrown']:.1f} INTs thrown/game, {away_avg['defense']['interceptions_forced']:.1f} INTs forced/game")
+    if verbose:
+        emit(f"\nTakeaway Battle (Interceptions):")
+        emit(f"  {home_team}: {home_avg['offense']['interceptions_thrown']:.1f} INTs thrown/game, {home_avg['defense']['interceptions_forced']:.1f} INTs forced/game")
+        emit(f"  {away_team}: {away_avg['offense']['interceptions_thrown']:.1f} INTs thrown/game, {away_avg['defense']['interceptions_forced']:.1f} INTs forced/game")
     
     # Matchup: home's INTs thrown vs away's INTs forced
     home_int_risk = home_avg['offense']['interceptions_thrown'] - away_avg['defense']['interceptions_forced']
@@ -1626,45 +1675,57 @@ def advanced_prediction(home_team, away_team, teams_data, is_neutral=False, inju
     
     if home_int_risk < -0.5:  # Home throws few INTs but away doesn't force many = advantage
         home_points += 1.0
-        print(f"    >> {home_team} protects ball well vs weak takeaway defense (+1.0)")
+        if verbose:
+            emit(f"    >> {home_team} protects ball well vs weak takeaway defense (+1.0)")
     elif home_int_risk > 1.0:  # Home throws many INTs and away forces many = big problem
         away_points += 2.5
-        print(f"    >> {away_team} should generate turnovers (+2.5)")
+        if verbose:
+            emit(f"    >> {away_team} should generate turnovers (+2.5)")
     elif home_int_risk > 0.5:
         away_points += 1.0
-        print(f"    >> {away_team} has turnover advantage (+1.0)")
+        if verbose:
+            emit(f"    >> {away_team} has turnover advantage (+1.0)")
     
     if away_int_risk < -0.5:
         away_points += 1.0
-        print(f"    >> {away_team} protects ball well vs weak takeaway defense (+1.0)")
+        if verbose:
+            emit(f"    >> {away_team} protects ball well vs weak takeaway defense (+1.0)")
     elif away_int_risk > 1.0:
         home_points += 2.5
-        print(f"    >> {home_team} should generate turnovers (+2.5)")
+        if verbose:
+            emit(f"    >> {home_team} should generate turnovers (+2.5)")
     elif away_int_risk > 0.5:
         home_points += 1.0
-        print(f"    >> {home_team} has turnover advantage (+1.0)")
+        if verbose:
+            emit(f"    >> {home_team} has turnover advantage (+1.0)")
     
     # Penalty Discipline
-    print(f"\nPenalty Discipline:")
-    print(f"  {home_team}: {home_avg['offense']['penalties']:.1f} penalties/game")
-    print(f"  {away_team}: {away_avg['offense']['penalties']:.1f} penalties/game")
+    if verbose:
+        emit(f"\nPenalty Discipline:")
+        emit(f"  {home_team}: {home_avg['offense']['penalties']:.1f} penalties/game")
+        emit(f"  {away_team}: {away_avg['offense']['penalties']:.1f} penalties/game")
     
     penalty_diff = away_avg['offense']['penalties'] - home_avg['offense']['penalties']
     if penalty_diff > 2.0:
         home_points += 1.5
-        print(f"    >> {home_team} much more disciplined (+1.5)")
+        if verbose:
+            emit(f"    >> {home_team} much more disciplined (+1.5)")
     elif penalty_diff > 1.0:
         home_points += 0.75
-        print(f"    >> {home_team} more disciplined (+0.75)")
+        if verbose:
+            emit(f"    >> {home_team} more disciplined (+0.75)")
     elif penalty_diff < -2.0:
         away_points += 1.5
-        print(f"    >> {away_team} much more disciplined (+1.5)")
+        if verbose:
+            emit(f"    >> {away_team} much more disciplined (+1.5)")
     elif penalty_diff < -1.0:
         away_points += 0.75
-        print(f"    >> {away_team} more disciplined (+0.75)")
+        if verbose:
+            emit(f"    >> {away_team} more disciplined (+0.75)")
     
     # 8. UPDATED: Win Rate Factor (reduced weight) + Pythagorean Expectation
-    print(f"\nWin Rate & Performance Indicators:")
+    if verbose:
+        emit(f"\nWin Rate & Performance Indicators:")
     
     # Actual win rate factor (reduced from 5.0 to 3.0)
     home_win_pts = home_avg['win_rate'] * 3.0
@@ -1672,136 +1733,162 @@ def advanced_prediction(home_team, away_team, teams_data, is_neutral=False, inju
     home_points += home_win_pts
     away_points += away_win_pts
     
-    print(f"  {home_team} Win Rate: +{home_win_pts:.1f} ({home_avg['wins']}-{home_avg['games_played'] - home_avg['wins']}, {home_avg['win_rate']:.1%})")
-    print(f"  {away_team} Win Rate: +{away_win_pts:.1f} ({away_avg['wins']}-{away_avg['games_played'] - away_avg['wins']}, {away_avg['win_rate']:.1%})")
+    if verbose:
+        emit(f"  {home_team} Win Rate: +{home_win_pts:.1f} ({home_avg['wins']}-{home_avg['games_played'] - home_avg['wins']}, {home_avg['win_rate']:.1%})")
+        emit(f"  {away_team} Win Rate: +{away_win_pts:.1f} ({away_avg['wins']}-{away_avg['games_played'] - away_avg['wins']}, {away_avg['win_rate']:.1%})")
     
     # BOUNCE-BACK ANALYSIS - based on underlying metrics, not gambler's fallacy
     home_bounce_back = calculate_bounce_back_probability(home_team, teams_data)
     away_bounce_back = calculate_bounce_back_probability(away_team, teams_data)
     
-    print(f"\n  Bounce-Back Analysis (underlying performance vs results):")
+    if verbose:
+        emit(f"\n  Bounce-Back Analysis (underlying performance vs results):")
     
     if home_bounce_back['has_bounce_back_potential']:
         home_points += home_bounce_back['bounce_back_score']
-        print(f"    {home_team}: +{home_bounce_back['bounce_back_score']:.1f} bounce-back potential")
+        if verbose:
+            emit(f"    {home_team}: +{home_bounce_back['bounce_back_score']:.1f} bounce-back potential")
         for factor in home_bounce_back['factors']:
-            print(f"      - {factor}")
+            if verbose:
+                emit(f"      - {factor}")
     else:
-        print(f"    {home_team}: No significant bounce-back indicators")
+        if verbose:
+            emit(f"    {home_team}: No significant bounce-back indicators")
     
     if away_bounce_back['has_bounce_back_potential']:
         away_points += away_bounce_back['bounce_back_score']
-        print(f"    {away_team}: +{away_bounce_back['bounce_back_score']:.1f} bounce-back potential")
+        if verbose:
+            emit(f"    {away_team}: +{away_bounce_back['bounce_back_score']:.1f} bounce-back potential")
         for factor in away_bounce_back['factors']:
-            print(f"      - {factor}")
+            if verbose:
+                emit(f"      - {factor}")
     else:
-        print(f"    {away_team}: No significant bounce-back indicators")
+        if verbose:
+            emit(f"    {away_team}: No significant bounce-back indicators")
     
     # Pythagorean expectation - only penalize lucky overperformers
     home_pyth_diff = home_avg['win_rate'] - home_avg['pythagorean_win_rate']
     away_pyth_diff = away_avg['win_rate'] - away_avg['pythagorean_win_rate']
     
-    print(f"\n  Pythagorean Win% (luck detection):")
-    print(f"    {home_team}: {home_avg['pythagorean_win_rate']:.1%} expected vs {home_avg['win_rate']:.1%} actual (diff: {home_pyth_diff:+.1%})")
+    if verbose:
+        emit(f"\n  Pythagorean Win% (luck detection):")
+        emit(f"    {home_team}: {home_avg['pythagorean_win_rate']:.1%} expected vs {home_avg['win_rate']:.1%} actual (diff: {home_pyth_diff:+.1%})")
     if home_pyth_diff > 0.15:  # Overperforming significantly (lucky wins)
         home_points -= 1.0
-        print(f"      >> {home_team} has been lucky in close games (-1.0, regression risk)")
+        if verbose:
+            emit(f"      >> {home_team} has been lucky in close games (-1.0, regression risk)")
     
-    print(f"    {away_team}: {away_avg['pythagorean_win_rate']:.1%} expected vs {away_avg['win_rate']:.1%} actual (diff: {away_pyth_diff:+.1%})")
+    if verbose:
+        emit(f"    {away_team}: {away_avg['pythagorean_win_rate']:.1%} expected vs {away_avg['win_rate']:.1%} actual (diff: {away_pyth_diff:+.1%})")
     if away_pyth_diff > 0.15:  # Overperforming significantly (lucky wins)
         away_points -= 1.0
-        print(f"      >> {away_team} has been lucky in close games (-1.0, regression risk)")
+        if verbose:
+            emit(f"      >> {away_team} has been lucky in close games (-1.0, regression risk)")
     
     # Additional penalty for losing records (scaled)
-    print(f"\n  Record Quality:")
+    if verbose:
+        emit(f"\n  Record Quality:")
     if home_avg['win_rate'] == 0:
         home_points -= 3.0
-        print(f"    >> {home_team} is WINLESS (-3.0)")
+        if verbose:
+            emit(f"    >> {home_team} is WINLESS (-3.0)")
     elif home_avg['win_rate'] < 0.2:
         home_points -= 2.5
-        print(f"    >> {home_team} has very poor record (-2.5)")
+        if verbose:
+            emit(f"    >> {home_team} has very poor record (-2.5)")
     elif home_avg['win_rate'] < 0.4:
         home_points -= 1.5
-        print(f"    >> {home_team} has poor record (-1.5)")
+        if verbose:
+            emit(f"    >> {home_team} has poor record (-1.5)")
     
     if away_avg['win_rate'] == 0:
         away_points -= 3.0
-        print(f"    >> {away_team} is WINLESS (-3.0)")
+        if verbose:
+            emit(f"    >> {away_team} is WINLESS (-3.0)")
     elif away_avg['win_rate'] < 0.2:
         away_points -= 2.5
-        print(f"    >> {away_team} has very poor record (-2.5)")
+        if verbose:
+            emit(f"    >> {away_team} has very poor record (-2.5)")
     elif away_avg['win_rate'] < 0.4:
         away_points -= 1.5
-        print(f"    >> {away_team} has poor record (-1.5)")
+        if verbose:
+            emit(f"    >> {away_team} has poor record (-1.5)")
     
     # 9. UPDATED: Turnover Margin (not just giveaways)
-    print(f"\nTurnover Margin:")
-    print(f"  {home_team}: {home_avg['turnover_margin']:+.1f} per game")
-    print(f"  {away_team}: {away_avg['turnover_margin']:+.1f} per game")
+    if verbose:
+        emit(f"\nTurnover Margin:")
+        emit(f"  {home_team}: {home_avg['turnover_margin']:+.1f} per game")
+        emit(f"  {away_team}: {away_avg['turnover_margin']:+.1f} per game")
     
     margin_diff = home_avg['turnover_margin'] - away_avg['turnover_margin']
     if margin_diff > 1.0:
         home_points += 1.5
-        print(f"    >> {home_team} has significantly better turnover margin (+1.5)")
+        if verbose:
+            emit(f"    >> {home_team} has significantly better turnover margin (+1.5)")
     elif margin_diff > 0.5:
         home_points += 0.75
-        print(f"    >> {home_team} has better turnover margin (+0.75)")
+        if verbose:
+            emit(f"    >> {home_team} has better turnover margin (+0.75)")
     elif margin_diff < -1.0:
         away_points += 1.5
-        print(f"    >> {away_team} has significantly better turnover margin (+1.5)")
+        if verbose:
+            emit(f"    >> {away_team} has significantly better turnover margin (+1.5)")
     elif margin_diff < -0.5:
         away_points += 0.75
-        print(f"    >> {away_team} has better turnover margin (+0.75)")
+        if verbose:
+            emit(f"    >> {away_team} has better turnover margin (+0.75)")
     
     # NEW: Injury Impact (position-weighted)
     if home_injury_impact and away_injury_impact:
-        print(f"\nInjury Impact (Position-Weighted):")
-        print(f"  {home_team}: {home_injury_impact['impact_score']:.1f} impact score "
-              f"({home_injury_impact['out']} out, {home_injury_impact['doubtful']} doubtful, "
-              f"{home_injury_impact['key_injuries']} key)")
-        if home_injury_impact['qb_injured']:
-            print(f"    ⚠️  QB INJURED")
-        
-        print(f"  {away_team}: {away_injury_impact['impact_score']:.1f} impact score "
-              f"({away_injury_impact['out']} out, {away_injury_impact['doubtful']} doubtful, "
-              f"{away_injury_impact['key_injuries']} key)")
-        if away_injury_impact['qb_injured']:
-            print(f"    ⚠️  QB INJURED")
+        if verbose:
+            emit(f"\nInjury Impact (Position-Weighted):")
+            emit(f"  {home_team}: {home_injury_impact['impact_score']:.1f} impact score "
+                 f"({home_injury_impact['out']} out, {home_injury_impact['doubtful']} doubtful, "
+                 f"{home_injury_impact['key_injuries']} key)")
+            if home_injury_impact['qb_injured']:
+                emit(f"    ⚠️  QB INJURED")
+            
+            emit(f"  {away_team}: {away_injury_impact['impact_score']:.1f} impact score "
+                 f"({away_injury_impact['out']} out, {away_injury_impact['doubtful']} doubtful, "
+                 f"{away_injury_impact['key_injuries']} key)")
+            if away_injury_impact['qb_injured']:
+                emit(f"    ⚠️  QB INJURED")
         
         # QB-specific penalties (most impactful)
         if home_injury_impact['qb_injured'] and not away_injury_impact['qb_injured']:
             away_points += 5.0
-            print(f"    >> {home_team} QB injured, MAJOR advantage to {away_team} (+5.0)")
+            if verbose:
+                emit(f"    >> {home_team} QB injured, MAJOR advantage to {away_team} (+5.0)")
         elif away_injury_impact['qb_injured'] and not home_injury_impact['qb_injured']:
             home_points += 5.0
-            print(f"    >> {away_team} QB injured, MAJOR advantage to {home_team} (+5.0)")
-        elif home_injury_impact['qb_injured'] and away_injury_impact['qb_injured']:
-            print(f"    >> Both QBs injured, no relative advantage")
+            if verbose:
+                emit(f"    >> {away_team} QB injured, MAJOR advantage to {home_team} (+5.0)")
+        elif verbose and home_injury_impact['qb_injured'] and away_injury_impact['qb_injured']:
+            emit(f"    >> Both QBs injured, no relative advantage")
         
         # General injury impact comparison (Award to team with FEWER injuries)
         # New thresholds adjusted for position-weighted scoring
         impact_diff = away_injury_impact['impact_score'] - home_injury_impact['impact_score']
         
         if abs(impact_diff) < 3.0 and not (home_injury_impact['qb_injured'] or away_injury_impact['qb_injured']):
-            print(f"    >> Both teams relatively healthy")
-        elif impact_diff > 10.0:  # Away team much more injured
-            home_points += 3.0
-            print(f"    >> {away_team} significantly injury-depleted (+3.0 to {home_team})")
-        elif impact_diff > 5.0:  # Away team more injured
-            home_points += 2.0
-            print(f"    >> {away_team} dealing with major injuries (+2.0 to {home_team})")
-        elif impact_diff > 3.0:
-            home_points += 1.0
-            print(f"    >> {away_team} more injured (+1.0 to {home_team})")
-        elif impact_diff < -10.0:  # Home team much more injured
-            away_points += 3.0
-            print(f"    >> {home_team} significantly injury-depleted (+3.0 to {away_team})")
-        elif impact_diff < -5.0:  # Home team more injured
-            away_points += 2.0
-            print(f"    >> {home_team} dealing with major injuries (+2.0 to {away_team})")
-        elif impact_diff < -3.0:
-            away_points += 1.0
-            print(f"    >> {home_team} more injured (+1.0 to {away_team})")
+            if verbose:
+                emit(f"    >> Both teams relatively healthy")
+        else:
+            # one binary search on |diff| picks the tier, sign picks who benefits
+            tier = bisect.bisect_left(INJURY_DIFF_THRESHOLDS, abs(impact_diff))
+            if tier:
+                bonus, label = INJURY_DIFF_RESULTS[tier]
+                if impact_diff > 0:
+                    home_points += bonus
+                    if verbose:
+                        emit(f"    >> {away_team} {label} (+{bonus:.1f} to {home_team})")
+                else:
+                    away_points += bonus
+                    if verbose:
+                        emit(f"    >> {home_team} {label} (+{bonus:.1f} to {away_team})")
+    
+    if verbose:
+        sys.stdout.write(report.getvalue())
     
     return {
         'home_points': home_points,
@@ -1811,6 +1898,57 @@ def advanced_prediction(home_team, away_team, teams_data, is_neutral=False, inju
     }
 
 
+def predict_slate(matchups, teams_data, injury_data=None):
+    """
+    scores a whole slate of games quietly and returns one DataFrame row per game
+    matchups: iterable of dicts with home_team, away_team and optional is_neutral
+              (same shape as batch_predict.get_upcoming_games)
+    per-team averages are computed once and reused across every game on the slate
+    games that can't be scored get NaN points; if scoring raised, 'error' holds the message
+    """
+    import pandas as pd
+    
+    matchups = list(matchups)
+    
+    # warm the per-team cache once for every team on the slate
+    for team in {m[side] for m in matchups for side in ('home_team', 'away_team')}:
+        get_team_averages(team, teams_data)
+    
+    home_points = np.full(len(matchups), np.nan)
+    away_points = np.full(len(matchups), np.nan)
+    errors = [None] * len(matchups)
+    for idx, matchup in enumerate(matchups):
+        try:
+            result = advanced_prediction(matchup['home_team'], matchup['away_team'], teams_data,
+                                         matchup.get('is_neutral', False), injury_data, verbose=False)
+        except Exception as e:  # one bad matchup shouldn't sink the rest of the slate
+            errors[idx] = str(e)
+            continue
+        if result:
+            home_points[idx] = result['home_points']
+            away_points[idx] = result['away_points']
+    
+    # slate-wide winner / confidence in one pass (same rule as main(): 6 pts = 100%, capped at 95%)
+    margin = np.abs(home_points - away_points)
+    home_team = np.array([m['home_team'] for m in matchups], dtype=object)
+    away_team = np.array([m['away_team'] for m in matchups], dtype=object)
+    winner = np.where(home_points > away_points, home_team, np.where(away_points > home_points, away_team, 'TIE'))
+    winner = np.where(np.isnan(margin), None, winner)
+    confidence = np.clip(margin / 6 * 100, None, 95)  # NaN margins stay NaN
+    confidence[margin == 0] = 50.0
+    
+    return pd.DataFrame({
+        'home_team': home_team,
+        'away_team': away_team,
+        'home_points': home_points,
+        'away_points': away_points,
+        # object columns keep None for unscored games (pandas would turn them into NaN strings)
+        'winner': pd.Series(winner, dtype=object),
+        'confidence': confidence,
+        'error': pd.Series(errors, dtype=object)
+    })
+
+
 def main():
     """
     main function
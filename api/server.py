@@ -31,6 +31,10 @@ from injuryextract import (  # type: ignore
 from predictor import advanced_prediction, read_nfl_data  # type: ignore
 from dataextract import update_mode, get_last_week_from_file  # type: ignore
 
+# nflData.txt line prefixes (lines are stripped before matching)
+WEEK_HEADER_PREFIXES = ("PRESEASON_WEEK", "REGULAR_WEEK")
+QB_LINE_PREFIXES = ("AWAY QB (", "HOME QB (")
+
 
 app = FastAPI(
     title="SportsPredictor NFL API",
@@ -261,7 +265,7 @@ async def run_batch_prediction(request: BatchRequest):
         season_type = request.season_type
         if request.week >= 19 and request.week <= 22:
             season_type = 'postseason'  # Use postseason API type for weeks 19-22
-        result = batch_predict_week(request.week, season_type, use_ml=request.use_ml)
+        result = batch_predict_week(request.week, season_type, use_ml=request.use_ml, verbose=False)
         return result or {
             "predictions": [],
             "failed_games": [],
@@ -360,7 +364,7 @@ async def get_qb_rankings():
             return {"qbs": []}
         
         qb_stats = {}
-        current_week = None
+        counts_week = False  # inside a regular/postseason week (preseason QB lines are skipped)
         current_game_teams = None
         
         try:
@@ -371,8 +375,8 @@ async def get_qb_rankings():
                 line = line.strip()
                 
                 # Track current week
-                if ('PRESEASON_WEEK' in line or 'REGULAR_WEEK' in line) and '[' not in line:
-                    current_week = line
+                if line.startswith(WEEK_HEADER_PREFIXES):
+                    counts_week = line.startswith('REGULAR_WEEK')
                     current_game_teams = None
                     continue
                 
@@ -390,7 +394,7 @@ async def get_qb_rankings():
                     continue
                 
                 # Parse QB lines: "  AWAY QB (Name): comp/att for yards, TDs/INTs, YPA, RTG"
-                if ('AWAY QB (' in line or 'HOME QB (' in line) and current_week and 'PRESEASON' not in current_week:
+                if counts_week and line.startswith(QB_LINE_PREFIXES):
                     try:
                         # Extract QB name
                         qb_name = line.split('(')[1].split(')')[0] if '(' in line else None
@@ -398,7 +402,7 @@ async def get_qb_rankings():
                             continue
                         
                         # Determine team
-                        is_away = 'AWAY QB' in line
+                        is_away = line.startswith('AWAY')
                         team_name = current_game_teams['away'] if is_away else current_game_teams['home']
                         
                         # Parse stats: "comp/att for yards, TDs/INTs, YPA, RTG"